@@ -0,0 +1,133 @@
+import sys
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+from consts.tags import MOM_TAG, INT_TAG
+from pipeline.pipeline import Pipeline
+from pipeline.pipeline_af import ArcFlashPipeline
+from pipeline.pipeline_dd import DeviceDutyPipeline
+from consts.common import PROGRAM_TITLE, EXIT_SUCCESS, CONFIG_MAP, BACKEND_OPENPYXL, BACKEND_XLSXWRITER
+
+VARIANTS = [
+    ('openpyxl', dict(excel_backend=BACKEND_OPENPYXL)),
+    ('openpyxl write-only', dict(excel_backend=BACKEND_OPENPYXL, write_only=True)),
+    ('xlsxwriter', dict(excel_backend=BACKEND_XLSXWRITER))
+]
+
+
+def make_device_duty_data(rows: int, configs: list[str]) -> tuple[dict, dict]:
+    """
+    Generates parsed device duty data with the given number of rows per sheet.
+
+    :param int rows: Number of entries of each sheet.
+    :param list[str] configs: Switching configurations of the fault values.
+    :return: The parsed ANSI and IEC data.
+    :rtype: tuple[dict, dict]
+    """
+    def faults():
+        return {config: random.uniform(0, 60) for config in configs}
+
+    mom = {f'BUS-{i:06}': {'Voltage': 0.48, 'Type': 'Switchgear', 'Sym': faults(), 'Asym': faults(),
+                           'CapSym': random.uniform(20, 60), 'CapAsym': random.uniform(20, 60)} for i in range(rows)}
+    ansi_int = {f'CB-{i:06}': {'Voltage': 4.16, 'Bus': f'BUS-{i:06}', 'Device': 'LVCB', 'AdjSym': faults(),
+                               'CapAdjSym': random.uniform(20, 60),
+                               'SeriesRated': i % 10 == 0} for i in range(rows)}
+    iec_int = {f'CB-{i:06}': {'Voltage': 0.4, 'Bus': f'BUS-{i:06}', 'Device': 'CB', 'LbSym': faults(),
+                              'LbAsym': faults(), 'CapLbSym': random.uniform(20, 60),
+                              'CapLbAsym': random.uniform(20, 60)} for i in range(rows)}
+    return {MOM_TAG: mom, INT_TAG: ansi_int}, {INT_TAG: iec_int}
+
+
+def make_arc_flash_data(rows: int) -> dict:
+    """
+    Generates parsed arc flash data with the given number of rows.
+
+    :param int rows: Number of entries.
+    :return: The parsed ANSI arc flash data.
+    :rtype: dict
+    """
+    return {f'BUS-{i:06}': [0.48, 'Switchgear', 'VCB', 24.0, '13\'6"', '4\'8"', 'AF_GEN', 'GEN',
+                            round(random.uniform(0, 60), 2), '24\'4"', 0.5, f'PD-{i:06}', 12.5,
+                            20.67, 6.79, 36.43, 39.88] for i in range(rows)}
+
+
+def export(pipeline: Pipeline, trace_memory: bool) -> tuple[float, int]:
+    """
+    Exports the parsed data of a pipeline, measuring the time taken and optionally the peak memory allocated.
+
+    :param Pipeline pipeline: The pipeline holding the parsed data.
+    :param bool trace_memory: A flag to determine whether to trace the memory allocated while exporting.
+    :return: The export time in seconds and the peak memory allocated in bytes, or 0 if not traced.
+    :rtype: tuple[float, int]
+    """
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    pipeline.execute_data_export()
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def run_benchmark(rows: int, config_count: int, output_dir: Path, conditional_formatting: bool, trace_memory: bool):
+    """
+    Exports the same generated device duty and arc flash tables with each backend and prints
+    the export time, the peak memory allocated and the size of the workbook.
+
+    :param int rows: Number of entries of each table.
+    :param int config_count: Number of switching configurations of the device duty tables.
+    :param Path output_dir: Directory the workbooks are saved in.
+    :param bool conditional_formatting: A flag to determine whether to highlight values with conditional formatting.
+    :param bool trace_memory: A flag to determine whether to trace the memory allocated while exporting.
+    """
+    random.seed(0)
+    ansi_data, iec_data = make_device_duty_data(rows, list(CONFIG_MAP)[:config_count])
+    af_data = make_arc_flash_data(rows)
+    common = ['', Path(f'benchmark_{rows}'), output_dir, False, False, [], [], [], True]
+
+    print(f"{'Table':<14}{'Backend':<22}{'Time (s)':>10}{'Peak (MiB)':>12}{'Size (KiB)':>12}")
+    for name, kwargs in VARIANTS:
+        dd_pipeline = DeviceDutyPipeline(*common, False, False, False, False,
+                                         conditional_formatting=conditional_formatting, **kwargs)
+        dd_pipeline.parsed_ansi_data, dd_pipeline.parsed_iec_data = ansi_data, iec_data
+        af_pipeline = ArcFlashPipeline(*common, False, 40.0, 12.0, conditional_formatting=conditional_formatting,
+                                       **kwargs)
+        af_pipeline.parsed_ansi_data = af_data
+
+        for table, pipeline in [('Device Duty', dd_pipeline), ('Arc Flash', af_pipeline)]:
+            elapsed, peak = export(pipeline, trace_memory)
+            size = sum(path.stat().st_size for path in output_dir.glob(f'*{table}*.xlsx'))
+            print(f'{table:<14}{name:<22}{elapsed:>10.2f}{peak / 2 ** 20:>12.1f}{size / 2 ** 10:>12.0f}')
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Parses the command line arguments and runs the exporter backend benchmark.
+
+    :param list[str] | None argv: Command line arguments, defaults to the arguments of the process.
+    :return int: The exit code of the benchmark.
+    """
+    arg_parser = argparse.ArgumentParser(description=f'Compares the Excel backends of the {PROGRAM_TITLE} '
+                                                     f'on generated device duty and arc flash tables.')
+    arg_parser.add_argument('--rows', type=int, default=20000, help='Number of entries of each table.')
+    arg_parser.add_argument('--configs', type=int, default=3, choices=range(1, len(CONFIG_MAP) + 1),
+                            help='Number of switching configurations of the device duty tables.')
+    arg_parser.add_argument('--conditional-formatting', action='store_true',
+                            help='Highlight values with Excel conditional formatting rules instead of cell fills.')
+    arg_parser.add_argument('--trace-memory', action='store_true',
+                            help='Trace the peak memory allocated while exporting, which slows down the export.')
+    args = arg_parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        run_benchmark(args.rows, args.configs, Path(output_dir), args.conditional_formatting, args.trace_memory)
+    return EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main())
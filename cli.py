@@ -0,0 +1,129 @@
+import sys
+import json
+import argparse
+from pathlib import Path
+from pipeline import utils
+from pipeline.pipeline import Pipeline
+from pipeline.pipeline_af import ArcFlashPipeline
+from pipeline.pipeline_dd import DeviceDutyPipeline
+from pipeline.pipeline_sc import ShortCircuitPipeline
+from consts.common import PROGRAM_TITLE, EXIT_SUCCESS, EXIT_FAILURE, EXIT_INVALID_INPUTS
+from consts.common import BACKEND_OPENPYXL, BACKEND_XLSXWRITER, DATA_FORMATS
+
+
+def run_project(inputs_path: Path, write_only: bool, use_cache: bool, clear_cache: bool, use_pivot: bool,
+                show_timings: bool = False, in_memory_reports: bool = False, mirror_dir: Path | None = None,
+                conditional_formatting: bool = False, excel_backend: str = BACKEND_OPENPYXL,
+                data_format: str | None = None) -> int:
+    """
+    Runs the selected study pipelines of a project in the same order as the interface,
+    stopping at the first study that fails.
+
+    :param Path inputs_path: Path to a JSON inputs file saved by the interface.
+    :param bool write_only: A flag to determine whether to stream the Excel tables using write-only worksheets.
+    :param bool use_cache: A flag to determine whether to reuse report data cached in the output directory.
+    :param bool clear_cache: A flag to determine whether to clear the cache before parsing.
+    :param bool use_pivot: A flag to determine whether to pivot the short circuit and device duty data inside SQLite.
+    :param bool show_timings: A flag to determine whether to print the time spent reading each report file.
+    :param bool in_memory_reports: A flag to determine whether to load small report files in memory before querying.
+    :param Path | None mirror_dir: Optional local directory in which the report files are mirrored and read.
+    :param bool conditional_formatting: A flag to determine whether to highlight values with conditional formatting.
+    :param str excel_backend: Name of the engine writing the Excel tables, 'openpyxl' or 'xlsxwriter'.
+    :param str | None data_format: Optional format the tables are also written in, 'csv', 'jsonl' or 'sqlite'.
+    :return int: The exit code of the project run.
+    """
+    try:
+        with open(inputs_path, 'r') as f:
+            inputs = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"{inputs_path}: Failed to load inputs: {e}", file=sys.stderr)
+        return EXIT_INVALID_INPUTS
+
+    message = utils.validate_inputs(inputs)
+    if message:
+        print(f"{inputs_path}: {message}", file=sys.stderr)
+        return EXIT_INVALID_INPUTS
+
+    sc_args, dd_args, af_args = utils.collect_arguments(inputs)
+    studies = [
+        ('short_circuit_checkbox', ShortCircuitPipeline, sc_args, dict(use_pivot=use_pivot)),
+        ('device_duty_checkbox', DeviceDutyPipeline, dd_args, dict(use_pivot=use_pivot)),
+        ('arc_flash_checkbox', ArcFlashPipeline, af_args, {})
+    ]
+    kwargs = dict(write_only=write_only, use_cache=use_cache, clear_cache=clear_cache,
+                  in_memory_reports=in_memory_reports, mirror_dir=mirror_dir,
+                  conditional_formatting=conditional_formatting, excel_backend=excel_backend, data_format=data_format)
+
+    for input_name, pipeline_class, args, study_kwargs in studies:
+        if not inputs.get(input_name, False):
+            continue
+        pipeline = pipeline_class(*args, **kwargs, **study_kwargs)
+        try:
+            output_path = pipeline.process()
+        except Exception as e:
+            print(f"{inputs_path}: {Pipeline.describe_error(e)}", file=sys.stderr)
+            return EXIT_FAILURE
+        finally:
+            if show_timings:
+                print_timings(pipeline.read_timings)
+        if output_path:
+            print(output_path)
+    return EXIT_SUCCESS
+
+
+def print_timings(timings: dict):
+    """
+    Prints the time spent opening and querying each report file, slowest first.
+
+    :param dict timings: Read timings keyed by report file path.
+    """
+    for filepath, timing in sorted(timings.items(), key=lambda item: sum(item[1]), reverse=True):
+        location = 'in memory' if timing.in_memory else 'from file'
+        print(f"{filepath}: open {timing.open * 1000:.1f} ms, query {timing.query * 1000:.1f} ms {location}",
+              file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Parses the command line arguments and runs the projects of the given inputs files.
+
+    :param list[str] | None argv: Command line arguments, defaults to the arguments of the process.
+    :return int: The highest exit code among the project runs.
+    """
+    arg_parser = argparse.ArgumentParser(description=f'{PROGRAM_TITLE} without the graphical interface.')
+    arg_parser.add_argument('inputs', nargs='+', type=Path,
+                            help='JSON inputs files saved from the interface, one per project.')
+    arg_parser.add_argument('--write-only', action='store_true',
+                            help='Stream the Excel tables using write-only worksheets.')
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help='Do not reuse report data cached in the output directory.')
+    arg_parser.add_argument('--clear-cache', action='store_true',
+                            help='Clear the cached report data before parsing.')
+    arg_parser.add_argument('--sql-pivot', action='store_true',
+                            help='Pivot the short circuit and device duty data by configuration inside SQLite.')
+    arg_parser.add_argument('--timings', action='store_true',
+                            help='Print the time spent opening and querying each report file.')
+    arg_parser.add_argument('--in-memory-reports', action='store_true',
+                            help='Load small report files in memory with one sequential read before querying them.')
+    arg_parser.add_argument('--mirror', type=Path, metavar='DIR',
+                            help='Mirror the report files in a local directory and read them from there.')
+    arg_parser.add_argument('--conditional-formatting', action='store_true',
+                            help='Highlight values with Excel conditional formatting rules instead of cell fills.')
+    arg_parser.add_argument('--backend', choices=[BACKEND_OPENPYXL, BACKEND_XLSXWRITER], default=BACKEND_OPENPYXL,
+                            help='Engine writing the Excel tables. XlsxWriter streams them in constant memory.')
+    arg_parser.add_argument('--data-format', choices=DATA_FORMATS,
+                            help='Also write the tables next to the Excel tables as CSV files, JSON Lines files '
+                                 'or a single project SQLite database with one table per sheet.')
+    args = arg_parser.parse_args(argv)
+
+    exit_code = EXIT_SUCCESS
+    for inputs_path in args.inputs:
+        exit_code = max(exit_code, run_project(inputs_path, args.write_only, not args.no_cache,
+                                                   args.clear_cache, args.sql_pivot, args.timings,
+                                                   args.in_memory_reports, args.mirror,
+                                                   args.conditional_formatting, args.backend, args.data_format))
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,6 +2,8 @@ SC_CONST_HEADERS = ['Device', None]
 SC_FAULT_CONST_COLS = ['Bus', 'kV']
 SC_VAR_COLS_PREFIX = 'Fault Config'
 SC_FAULT_VAR_COLS = ['3PH kA', 'LG kA', 'LL kA', 'LLG kA']
+SC_FAULT_DATA_VAR_COLS = ['3PH kA', '3PH angle (°)', 'LG kA', 'LG angle (°)', 'LL kA', 'LL angle (°)', 'LLG kA',
+                          'LLG angle (°)']
 SC_IMP_CONST_COLS = ['Bus', 'kV']
 SC_IMP_VAR_COLS = ['Pos. Seq. R (Ω)', 'Pos Seq. X (Ω)', 'Neg. Seq. R (Ω)', 'Neg Seq. X (Ω)', 'Zero Seq. R (Ω)', 'Zero Seq. X (Ω)']
 
@@ -5,7 +5,26 @@ HTTPS = 'https'
 ETAP22_PORT = 65358
 HEADER_ROW = 1
 SUBHEAD_ROW = 2
+SHEET_MAX_ROW = 1048576
 ROUND_DIGITS = 2
+EXTRACT_MAX_WORKERS = 8
+EXTRACT_PARALLEL_MIN_FILES = 4
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+FETCH_BATCH_SIZE = 1000
+REPORT_MMAP_SIZE = 256 * 1024 * 1024
+REPORT_CACHE_SIZE = -16 * 1024
+REPORT_IN_MEMORY_MAX_BYTES = 64 * 1024 * 1024
+MIRROR_CHUNK_SIZE = 1024 * 1024
+MIRROR_TEMP_MAX_AGE = 24 * 60 * 60
+BACKEND_OPENPYXL = 'openpyxl'
+BACKEND_XLSXWRITER = 'xlsxwriter'
+DATA_FORMAT_CSV = 'csv'
+DATA_FORMAT_JSONL = 'jsonl'
+DATA_FORMAT_SQLITE = 'sqlite'
+DATA_FORMATS = [DATA_FORMAT_CSV, DATA_FORMAT_JSONL, DATA_FORMAT_SQLITE]
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+EXIT_INVALID_INPUTS = 2
 
 JSON_FORMAT = 'JSON Source File (*.json)'
 DEFAULTS_FILENAME = 'defaults.json'
@@ -21,6 +40,10 @@ DEFAULT_SW_CONFIGS = [
     'GEN'
 ]
 
+DD_MOM_TYPES = ['Panelboard', 'Switchboard', 'Switchgear', 'MCC']
+DD_SWITCH_TYPES = ['SPST Switch', 'SPDT Switch']
+DD_IEC_INT_TYPES = ['CB', 'Fuse']
+
 TYPE_MAP = {
     'Fuse': 'FUSE',
     'SPDT Switch': 'DOUBLESWITCH',
@@ -8,5 +8,8 @@ AF_ANSI_EXT = 'AAFS'
 SC_FILENAME = 'Short Circuit Report.xlsx'
 DD_FILENAME = 'Device Duty Report.xlsx'
 AF_FILENAME = 'Arc Flash Report.xlsx'
-
-
+DATA_DB_FILENAME = 'Reports.db'
+CACHE_FILENAME = '.table_generator_cache.db'
+MIRROR_MANIFEST_FILENAME = 'manifest.db'
+MIRROR_OBJECTS_DIRNAME = 'objects'
+MIRROR_TEMP_PREFIX = 'tmp-'
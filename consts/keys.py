@@ -18,4 +18,16 @@ KEYS_DD_INT_IEC = {
 
 KEYS_SC_FAULT = ['Mag3Ph', 'MagLG', 'MagLL', 'MagLLG']
 KEYS_SC_FAULT_PHASOR = ['Phasor3Ph', 'PhasorLG', 'PhasorLL', 'PhasorLLG']
+KEYS_SC_FAULT_DATA = ['Mag3Ph', 'Ph3Ph', 'MagLG', 'PhLG', 'MagLL', 'PhLL', 'MagLLG', 'PhLLG']
 KEYS_SC_IMP = ['RPosOhm', 'XPosOhm', 'RNegOhm', 'XNegOhm', 'RZeroOhm', 'XZeroOhm']
+
+SC_FAULT_QUANTITIES = ['Real3Ph', 'Imag3Ph', 'Mag3Ph', 'Ph3Ph', 'RealLG', 'ImagLG', 'MagLG', 'PhLG',
+                       'RealLL', 'ImagLL', 'MagLL', 'PhLL', 'RealLLG', 'ImagLLG', 'MagLLG', 'PhLLG']
+SC_FAULT_PHASORS = {
+    'Phasor3Ph': ('Mag3Ph', 'Ph3Ph'),
+    'PhasorLG': ('MagLG', 'PhLG'),
+    'PhasorLL': ('MagLL', 'PhLL'),
+    'PhasorLLG': ('MagLLG', 'PhLLG')
+}
+SC_IMP_QUANTITIES = ['RPosOhm', 'XPosOhm', 'ZPosOhm', 'RNegOhm', 'XNegOhm', 'ZNegOhm',
+                     'RZeroOhm', 'XZeroOhm', 'ZZeroOhm']
@@ -4,6 +4,15 @@ ANSI_SC_FAULT_QUERY = (r"SELECT FaultedBus, kVnom, Real3ph, Imag3ph, Mag3ph, Rea
 ANSI_SC_IMP_QUERY = (r"SELECT FaultedBus, kVnom, RPosOhm, XPosOhm, ZPosOhm, RNegOhm, XNegOhm, ZNegOhm, "
                      r"RZeroOhm, XZeroOhm, ZZeroOhm FROM SCLGSum2")
 
+# SHORT CIRCUIT PIVOT TABLES
+SC_FAULT_TABLE = 'SCLGSum1'
+SC_IMP_TABLE = 'SCLGSum2'
+SC_ID_COLUMN = 'FaultedBus'
+SC_CONST_COLUMNS = ['kVnom']
+SC_FAULT_COLUMNS = ['Real3ph', 'Imag3ph', 'Mag3ph', 'RealLG', 'ImagLG', 'MagLG',
+                    'RealLL', 'ImagLL', 'MagLL', 'RealLLG', 'ImagLLG', 'MagLLG']
+SC_IMP_COLUMNS = ['RPosOhm', 'XPosOhm', 'ZPosOhm', 'RNegOhm', 'XNegOhm', 'ZNegOhm', 'RZeroOhm', 'XZeroOhm', 'ZZeroOhm']
+
 # DEVICE DUTY QUERIES
 ANSI_INT_QUERY = (r"SELECT PDID, kVnom, FaultedBus, PDType, AdjSym, CapAdjInt "
                   r"FROM SCDSumInt WHERE TRIM(PDID) <> '' ORDER BY PDID ASC")
@@ -18,6 +27,26 @@ IEC_INT_QUERY = (r"SELECT DeviceID, kVnom, FaultedBus, DeviceType, Ibsymm, Ibasy
 IEC_INT_SP_QUERY = (r"SELECT DeviceID, kVnom, FaultedBus, DeviceType, Ibsymm, Ibasymm, DeviceIbsymm, "
                     r"DeviceIbasym FROM SCIEC1phSum WHERE TRIM(DeviceID) <> '' ORDER BY DeviceID ASC")
 
+# DEVICE DUTY FILTER COLUMNS
+ANSI_ID_COLUMN = 'PDID'
+ANSI_TYPE_COLUMN = 'PDType'
+IEC_ID_COLUMN = 'DeviceID'
+IEC_TYPE_COLUMN = 'DeviceType'
+
+# DEVICE DUTY PIVOT TABLES
+ANSI_MOM_TABLE = 'SCDSumMom'
+ANSI_MOM_SP_TABLE = 'SCDSumMom1Ph'
+ANSI_INT_TABLE = 'SCDSumInt'
+ANSI_INT_SP_TABLE = 'SCDSumInt1Ph'
+IEC_INT_TABLE = 'SCIEC3phSum'
+IEC_INT_SP_TABLE = 'SCIEC1phSum'
+ANSI_MOM_CONST_COLUMNS = ['kVnom', 'PDType', 'CapSym', 'CapAsym']
+ANSI_MOM_COLUMNS = ["CASE WHEN substr(PDType, -6) = 'Switch' THEN 0 ELSE kASymm END", 'kAASymm']
+ANSI_INT_CONST_COLUMNS = ['kVnom', 'FaultedBus', 'PDType', 'CapAdjInt']
+ANSI_INT_COLUMNS = ['AdjSym']
+IEC_INT_CONST_COLUMNS = ['kVnom', 'FaultedBus', 'DeviceType', 'DeviceIbsymm', 'DeviceIbasym']
+IEC_INT_COLUMNS = ['Ibsymm', 'Ibasymm']
+
 # ARC FLASH QUERIES
 AF_INFO_QUERY = "SELECT Output, Config FROM IAFStudyCase"
 AF_BUS_QUERY = (
@@ -30,3 +59,7 @@ AF_PD_QUERY = (
     "IEnergy, PBoundary, EnFCT, FCTPD, ArcVaria, EnIa, FCTPDIa, EnIf, FCTPDIf "
     "FROM PDArcFlash WHERE ID <> '' AND Type = 'SPST Switch'"
 )
+
+# ARC FLASH FILTER COLUMNS
+AF_BUS_ID_COLUMN = 'IDBus'
+AF_PD_ID_COLUMN = 'ID'
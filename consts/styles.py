@@ -21,4 +21,20 @@ BORDER_ALL = Border(left=Side(style='thin'),
 BORDER_VERTICAL = Border(left=Side(style='thin'),
                          right=Side(style='thin'),
                          top=Side(style=None),
-                         bottom=Side(style=None))
\ No newline at end of file
+                         bottom=Side(style=None))
+STYLE_HEADER = 'Table Header'
+STYLE_HEADER_SEPARATOR = 'Table Header Separator'
+STYLE_ENTRY = 'Table Entry'
+STYLE_ENTRY_BANDED = 'Table Entry Banded'
+STYLE_ENTRY_RED = 'Table Entry Red'
+STYLE_ENTRY_ORANGE = 'Table Entry Orange'
+STYLE_ENTRY_SEPARATOR = 'Table Entry Separator'
+NAMED_STYLES = {
+    STYLE_HEADER: (FONT_HEADER, FILL_HEADER, BORDER_ALL),
+    STYLE_HEADER_SEPARATOR: (FONT_HEADER, FILL_ROW_BLANK, BORDER_VERTICAL),
+    STYLE_ENTRY: (FONT_ENTRIES, PatternFill(), BORDER_ALL),
+    STYLE_ENTRY_BANDED: (FONT_ENTRIES, FILL_ROW_BLUE, BORDER_ALL),
+    STYLE_ENTRY_RED: (FONT_ENTRIES, FILL_ROW_RED, BORDER_ALL),
+    STYLE_ENTRY_ORANGE: (FONT_ENTRIES, FILL_ROW_ORANGE, BORDER_ALL),
+    STYLE_ENTRY_SEPARATOR: (FONT_ENTRIES, FILL_ROW_BLANK, BORDER_VERTICAL)
+}
@@ -28,3 +28,4 @@ IMP_TAG = 'IMP'
 BUS_TAG = 'BUS'
 LVCB_TAG = 'LVCB'
 COMMENT_VAR = 'CommentText'
+LAYOUT_TAG = 'LAYOUT'
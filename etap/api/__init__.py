@@ -1,18 +1,24 @@
 from typing import Optional
+from etap.api import settings
 from etap.api.other.etap_client import EtapClient
 import requests
 
 
-def connect(base_address: str, project_name: Optional[str] = None) -> EtapClient:
+def connect(base_address: str, project_name: Optional[str] = None,
+            connect_timeout: Optional[float] = settings.connect_timeout,
+            read_timeout: Optional[float] = settings.read_timeout, pool_size: int = settings.pool_size) -> EtapClient:
     """
     Establish a connection with ETAP. This should be called before any other ETAP API call.
 
     :param str base_address: DataHub base address (e.g., 'http://localhost:50000')
     :param Optional[str] project_name: Name of the project to connect to (optional)
+    :param Optional[float] connect_timeout: Seconds to wait for a connection to DataHub, None to wait forever
+    :param Optional[float] read_timeout: Seconds to wait for a DataHub response, None to wait forever
+    :param int pool_size: Maximum number of pooled connections kept alive per host
     :return EtapClient: An instance of EtapClient for communicating with ETAP
     """
     try:
-        client = EtapClient()
+        client = EtapClient(connect_timeout, read_timeout, pool_size)
         client.connect(base_address, project_name)
         return client
     except (requests.RequestException, ConnectionError) as error:
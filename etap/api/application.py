@@ -6,17 +6,20 @@ from .other import api_constants
 
 
 class Application:
-    def __init__(self, base_address: str, token: str, project_name: Optional[str] = None):
+    def __init__(self, base_address: str, token: str, project_name: Optional[str] = None,
+                 session: Optional[datahub.Session] = None):
         """
         Initialize the Application instance.
 
         :param str base_address: Base URL for API endpoints.
         :param str token: Authorization token.
         :param Optional[str] project_name: Project name (optional).
+        :param Optional[datahub.Session] session: Shared DataHub session (optional).
         """
         self._base_address = base_address
         self._token = token
         self._project_name = project_name
+        self._session = session
 
     def project_file(self) -> str:
         """
@@ -26,7 +29,7 @@ class Application:
         """
         try:
             address = f'{self._base_address}{api_constants.application_projectfile}'
-            return json.loads(datahub.get(address, token=self._token))
+            return json.loads(datahub.get(address, token=self._token, session=self._session))
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to retrieve project file information: {e}") from e
 
@@ -38,7 +41,7 @@ class Application:
         """
         try:
             address = f'{self._base_address}{api_constants.application_version}'
-            return json.loads(datahub.get(address, token=self._token))
+            return json.loads(datahub.get(address, token=self._token, session=self._session))
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to retrieve version information: {e}") from e
 
@@ -50,6 +53,6 @@ class Application:
         """
         try:
             address = f'{self._base_address}{api_constants.application_getactivescenario}'
-            return json.loads(datahub.get(address, token=self._token))
+            return json.loads(datahub.get(address, token=self._token, session=self._session))
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to retrieve active scenario information: {e}") from e
@@ -1,23 +1,72 @@
 import requests
+from requests.adapters import HTTPAdapter
 from .. import settings
 
 requests.packages.urllib3.disable_warnings()
 
 
-def get(url_absolute: str, token: str = None) -> str:
+class Session(requests.Session):
+    """
+    HTTP session shared by all DataHub calls of a client. Keeps connections alive in a pool
+    and carries the default connect and read timeouts of its requests.
+    """
+
+    def __init__(self, connect_timeout: float | None = settings.connect_timeout,
+                 read_timeout: float | None = settings.read_timeout, pool_size: int = settings.pool_size):
+        """
+        Initialize the Session instance.
+
+        :param float | None connect_timeout: Seconds to wait for a connection to DataHub, None to wait forever.
+        :param float | None read_timeout: Seconds to wait for a DataHub response, None to wait forever.
+        :param int pool_size: Maximum number of connections kept alive per host.
+        """
+        super().__init__()
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.verify = not settings.https_enable
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+
+    @property
+    def timeout(self) -> tuple:
+        """
+        Default (connect, read) timeout of the session's requests.
+        """
+        return self.connect_timeout, self.read_timeout
+
+
+def _resolve(session: Session | None, timeout: tuple | None) -> tuple:
+    """
+    Resolves the requester and timeout to use for a call.
+
+    :param session: Optional shared session
+    :param timeout: Optional (connect, read) timeout overriding the session's default
+    :return: The session or the requests module, and the timeout to use
+    """
+    if session is None:
+        return requests, timeout or (settings.connect_timeout, settings.read_timeout)
+    return session, timeout or session.timeout
+
+
+def get(url_absolute: str, token: str = None, session: Session = None, timeout: tuple = None) -> str:
     """
     Makes an HTTP GET request to ETAP DataHub using the given absolute URL.
 
     :param url_absolute: Absolute URL to request
     :param token: Optional authorization token
+    :param session: Optional shared session used to reuse pooled connections
+    :param timeout: Optional (connect, read) timeout overriding the default
     :return: Response text from the GET request
     """
     headers = {"Authorization": token} if token else {}
-    response = requests.get(url_absolute, verify=not settings.https_enable, headers=headers)
+    requester, timeout = _resolve(session, timeout)
+    response = requester.get(url_absolute, verify=not settings.https_enable, headers=headers, timeout=timeout)
     return response.text
 
 
-def post(url_absolute: str, data: dict, token: str = None, headers: dict = None) -> str:
+def post(url_absolute: str, data: dict, token: str = None, headers: dict = None,
+         session: Session = None, timeout: tuple = None) -> str:
     """
     Makes an HTTP POST request to ETAP DataHub using the given absolute URL.
 
@@ -25,16 +74,20 @@ def post(url_absolute: str, data: dict, token: str = None, headers: dict = None)
     :param data: Dictionary to send in the request body
     :param token: Optional authorization token
     :param headers: Optional additional headers
+    :param session: Optional shared session used to reuse pooled connections
+    :param timeout: Optional (connect, read) timeout overriding the default
     :return: Response text from the POST request
     """
     final_headers = headers or {}
     if token:
         final_headers["Authorization"] = token
 
-    response = requests.post(
+    requester, timeout = _resolve(session, timeout)
+    response = requester.post(
         url_absolute,
         json=data,
         verify=not settings.https_enable,
-        headers=final_headers
+        headers=final_headers,
+        timeout=timeout
     )
     return response.text
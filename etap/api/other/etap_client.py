@@ -6,6 +6,8 @@ from pathlib import Path
 from .. import application
 from .. import projectdata
 from .. import scenario
+from .. import settings
+from . import datahub
 from netifaces import interfaces, ifaddresses, AF_INET
 
 
@@ -17,7 +19,16 @@ class EtapClient:
 
     _etap_path = None
 
-    def __init__(self):
+    def __init__(self, connect_timeout: float | None = settings.connect_timeout,
+                 read_timeout: float | None = settings.read_timeout, pool_size: int = settings.pool_size):
+        """
+        Initializes the client and its pooled DataHub session.
+
+        :param float | None connect_timeout: Seconds to wait for a connection to DataHub, None to wait forever.
+        :param float | None read_timeout: Seconds to wait for a DataHub response, None to wait forever.
+        :param int pool_size: Maximum number of connections kept alive per host.
+        """
+        self._session = datahub.Session(connect_timeout, read_timeout, pool_size)
         self._is_for_remote_etap = None
         self._ip_address = None
         self.scenario = None
@@ -37,12 +48,33 @@ class EtapClient:
         self._base_address = base_address
         self._project_name = project_name
         self._token = self._get_token()
-        self.application = application.Application(base_address, self._token, self._project_name)
-        self.projectdata = projectdata.ProjectData(base_address, self._token, self._project_name)
-        self.scenario = scenario.Scenario(base_address, self._token, self._project_name)
+        self.application = application.Application(base_address, self._token, self._project_name, self._session)
+        self.projectdata = projectdata.ProjectData(base_address, self._token, self._project_name, self._session)
+        self.scenario = scenario.Scenario(base_address, self._token, self._project_name, self._session)
         self._ip_address = self._extract_ip_address_from_base_address(base_address)
         self._is_for_remote_etap = self._is_request_for_remote_machine(self._ip_address)
 
+    def close(self) -> None:
+        """
+        Closes the pooled DataHub session and its connections.
+        """
+        self._session.close()
+
+    def __enter__(self) -> 'EtapClient':
+        """
+        Returns the client, so that its session is closed when leaving a with block.
+
+        :return: The client.
+        :rtype: EtapClient
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Closes the pooled DataHub session when leaving a with block.
+        """
+        self.close()
+
     def _get_token(self) -> str | None:
         """
         Reads token from keyFile.json based on the project name.
@@ -7,17 +7,20 @@ from .other import api_constants
 
 
 class ProjectData:
-    def __init__(self, base_address: str, token: str, project_name: Optional[str] = None):
+    def __init__(self, base_address: str, token: str, project_name: Optional[str] = None,
+                 session: Optional[datahub.Session] = None):
         """
         Initialize the ProjectData instance.
 
         :param str base_address: Base URL for API endpoints.
         :param str token: Authorization token.
         :param Optional[str] project_name: Name of the project (optional).
+        :param Optional[datahub.Session] session: Shared DataHub session (optional).
         """
         self._base_address = base_address
         self._token = token
         self._project_name = project_name
+        self._session = session
 
     def get_all_element_data(self, element_type: str) -> str:
         """
@@ -31,7 +34,7 @@ class ProjectData:
                 f'{self._base_address}{api_constants.projectdata_getallelementdata}?'
                 f'elementType={urllib.parse.quote(element_type)}'
             )
-            return json.loads(datahub.get(address, token=self._token))
+            return json.loads(datahub.get(address, token=self._token, session=self._session))
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to get all element data: {e}") from e
 
@@ -43,7 +46,7 @@ class ProjectData:
         """
         try:
             address = f'{self._base_address}{api_constants.projectdata_getconfigurations}'
-            return json.loads(datahub.get(address, token=self._token))
+            return json.loads(datahub.get(address, token=self._token, session=self._session))
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to get configurations: {e}") from e
 
@@ -59,7 +62,7 @@ class ProjectData:
                 f'{self._base_address}{api_constants.projectdata_getelementnames}?'
                 f'elementType={urllib.parse.quote(element_type)}'
             )
-            return json.loads(datahub.get(address, token=self._token))
+            return json.loads(datahub.get(address, token=self._token, session=self._session))
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to get element names: {e}") from e
 
@@ -71,7 +74,7 @@ class ProjectData:
         """
         try:
             address = f'{self._base_address}{api_constants.projectdata_getrevisions}'
-            return json.loads(datahub.get(address, token=self._token))
+            return json.loads(datahub.get(address, token=self._token, session=self._session))
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to get revisions: {e}") from e
 
@@ -82,7 +85,7 @@ class ProjectData:
         :return str: Study modes and cases.
         """
         try:
-            return datahub.get(f'{self._base_address}{api_constants.projectdata_getstudymodesandcases}', token=self._token)
+            return datahub.get(f'{self._base_address}{api_constants.projectdata_getstudymodesandcases}', token=self._token, session=self._session)
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to get study modes and cases: {e}") from e
 
@@ -93,7 +96,7 @@ class ProjectData:
         :return str: Project XML data.
         """
         try:
-            return datahub.get(f'{self._base_address}{api_constants.projectdata_getxml}', token=self._token)
+            return datahub.get(f'{self._base_address}{api_constants.projectdata_getxml}', token=self._token, session=self._session)
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to get project XML: {e}") from e
 
@@ -116,7 +119,7 @@ class ProjectData:
                 f'{self._base_address}{api_constants.projectdata_getelementprop}?'
                 f'elementType={encoded["elementType"]}&elementName={encoded["elementName"]}&fieldName={encoded["fieldName"]}'
             )
-            response = json.loads(datahub.get(address, token=self._token))
+            response = json.loads(datahub.get(address, token=self._token, session=self._session))
             if response.get('Value') == 'Invalid element name':
                 raise AttributeError(f'No element with ID {element_name} found')
             if response.get('Value') == 'Invalid element type':
@@ -132,7 +135,7 @@ class ProjectData:
         :return str: Supported element types.
         """
         try:
-            return datahub.get(f'{self._base_address}{api_constants.projectdata_getelementtypes}', token=self._token)
+            return datahub.get(f'{self._base_address}{api_constants.projectdata_getelementtypes}', token=self._token, session=self._session)
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to get element types: {e}") from e
 
@@ -158,7 +161,7 @@ class ProjectData:
                 f'{encoded["elementType"]}&elementName={encoded["elementName"]}&'
                 f'fieldName={encoded["fieldName"]}&value={encoded["value"]}'
             )
-            return datahub.post(address, {}, token=self._token)
+            return datahub.post(address, {}, token=self._token, session=self._session)
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to set element property: {e}") from e
 
@@ -170,7 +173,7 @@ class ProjectData:
         """
         try:
             address = f'{self._base_address}{api_constants.projectdata_getstudycasenames}'
-            return json.loads(datahub.get(address, token=self._token))
+            return json.loads(datahub.get(address, token=self._token, session=self._session))
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to get study case names: {e}") from e
 
@@ -186,7 +189,7 @@ class ProjectData:
                 f'{self._base_address}{api_constants.projectdata_getstudycase}?'
                 f'studyCaseId={urllib.parse.quote(study_case_id)}'
             )
-            return json.loads(datahub.get(address, token=self._token))
+            return json.loads(datahub.get(address, token=self._token, session=self._session))
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to get study case: {e}") from e
 
@@ -198,7 +201,7 @@ class ProjectData:
         :return str: API response.
         """
         try:
-            return datahub.post(f'{self._base_address}{api_constants.projectdata_setstudycase}', xml_element, token=self._token)
+            return datahub.post(f'{self._base_address}{api_constants.projectdata_setstudycase}', xml_element, token=self._token, session=self._session)
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to set study case: {e}") from e
 
@@ -216,6 +219,6 @@ class ProjectData:
                 f'{self._base_address}{api_constants.projectdata_setelementsprops}?'
                 f'compositeNetwork={encoded_network}'
             )
-            return datahub.post(address, multiple_element_json, token=self._token)
+            return datahub.post(address, multiple_element_json, token=self._token, session=self._session)
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to set element properties: {e}") from e
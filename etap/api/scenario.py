@@ -2,22 +2,26 @@ import json
 import urllib.parse
 import requests
 from typing import Optional, Any
+from . import settings
 from .other import datahub
 from .other import api_constants
 
 
 class Scenario:
-    def __init__(self, base_address: str, token: str, project_name: Optional[str] = None):
+    def __init__(self, base_address: str, token: str, project_name: Optional[str] = None,
+                 session: Optional[datahub.Session] = None):
         """
         Initialize the Scenario instance.
 
         :param str base_address: The base URL for API requests.
         :param str token: The authentication token.
         :param Optional[str] project_name: The name of the project (optional).
+        :param Optional[datahub.Session] session: Shared DataHub session (optional).
         """
         self._base_address = base_address
         self._token = token
         self._project_name = project_name
+        self._session = session
 
     def get_xml_file_path(self) -> str:
         """
@@ -27,7 +31,7 @@ class Scenario:
         """
         try:
             address = f'{self._base_address}{api_constants.scenario_getxmlfilepath}'
-            return json.loads(datahub.get(address, token=self._token))
+            return json.loads(datahub.get(address, token=self._token, session=self._session))
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to get XML file path: {e}") from e
 
@@ -40,7 +44,8 @@ class Scenario:
         try:
             return datahub.get(
                 f'{self._base_address}{api_constants.scenario_getxml}',
-                token=self._token
+                token=self._token,
+                session=self._session
             )
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to get scenario XML: {e}") from e
@@ -66,7 +71,10 @@ class Scenario:
             }
             query_string = urllib.parse.urlencode(params)
             address = f'{self._base_address}{api_constants.scenario_run}?{query_string}'
-            return datahub.post(address, what_if_commands, token=self._token)
+            # Study runs block until ETAP finishes, so only the connection attempt is time limited
+            connect_timeout = self._session.connect_timeout if self._session else settings.connect_timeout
+            return datahub.post(address, what_if_commands, token=self._token, session=self._session,
+                                timeout=(connect_timeout, None))
         except requests.RequestException as e:
             error_message = getattr(e.response, 'text', str(e))
             raise RuntimeError(f"Failed to run scenario: {error_message}") from e
@@ -117,7 +125,7 @@ class Scenario:
             query_string = urllib.parse.urlencode(encoded_params)
             address = f'{self._base_address}{api_constants.scenario_createscenario}?{query_string}'
 
-            datahub.post(address, what_if_commands, token=self._token)
+            datahub.post(address, what_if_commands, token=self._token, session=self._session)
             return True
         except requests.RequestException as e:
             error_message = getattr(e.response, 'text', str(e))
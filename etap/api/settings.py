@@ -1 +1,4 @@
 https_enable = True
+connect_timeout = 10
+read_timeout = 300
+pool_size = 10
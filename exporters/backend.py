@@ -0,0 +1,37 @@
+from pathlib import Path
+from exporters.registry import StyleRegistry
+
+
+class Backend:
+    """
+    A workbook engine the exporters write through. A backend creates the workbook and its sheets, registers
+    the cell styles and saves the workbook.
+
+    The sheets of a streaming backend only buffer the header rows and queue the data rows, which are styled
+    and written once, in order, when the workbook is saved. Other backends expose regular worksheets.
+    """
+    streaming = False
+
+    def __init__(self):
+        """
+        Initializes the backend. The style registry is set by the implementations.
+        """
+        self.style_registry: StyleRegistry | None = None
+
+    def create_sheets(self, sheet_names: list[str]) -> list:
+        """
+        Creates and names the worksheets. Abstract method for inheritance.
+
+        :param list[str] sheet_names: Names of the worksheets to create.
+        :return: The worksheets, in the given order.
+        :rtype: list
+        """
+        pass
+
+    def save(self, wb_path: Path):
+        """
+        Writes the workbook to a specified filename. Abstract method for inheritance.
+
+        :param Path wb_path: The filename to save the workbook as.
+        """
+        pass
@@ -0,0 +1,179 @@
+import csv
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterable
+from exporters.backend import Backend
+from exporters.registry import BufferedStyleRegistry
+from exporters.streaming import BufferedSheet, BufferedCell
+
+HEADING_SEPARATOR = ': '
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quotes a table or column name for use in an SQL statement.
+
+    :param str name: The name to quote.
+    :return: The quoted name.
+    :rtype: str
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+class DataSheet(BufferedSheet):
+    """
+    Stands in for a worksheet whose table is written as plain data. The header rows are flattened into one
+    heading per column and the data rows are streamed as lists of values, without styling them.
+    """
+
+    def get_columns(self) -> list[tuple[int, str]]:
+        """
+        Gets the data columns of the sheet. The heading of a column joins the values of its header rows,
+        a merged header cell counting for every column it spans. Columns without a heading, such as
+        separator columns, are left out.
+
+        :return: The index and heading of each data column.
+        :rtype: list[tuple[int, str]]
+        """
+        start_after_row = self.layout[0]
+        merged = {}
+        for start_row, start_column, end_row, end_column in self.merged_ranges:
+            for row in range(start_row, end_row + 1):
+                for column in range(start_column, end_column + 1):
+                    merged[(row, column)] = (start_row, start_column)
+
+        columns = []
+        for column in range(1, self.max_column + 1):
+            parts = []
+            for row in range(1, start_after_row + 1):
+                value = self.cell(*merged.get((row, column), (row, column))).value
+                if value is not None and str(value).strip():
+                    parts.append(str(value).strip())
+            if parts:
+                columns.append((column - 1, HEADING_SEPARATOR.join(parts)))
+        return columns
+
+    def iter_values(self, col_indices: list[int]) -> Iterable[list]:
+        """
+        Iterates over the values of the queued data rows in the given columns, building each row once.
+
+        :param list[int] col_indices: Indices of the columns to get the values of.
+        :return: Rows of values.
+        :rtype: Iterable[list]
+        """
+        for rows in self.row_sources:
+            for row in rows:
+                values = [cell.value if isinstance(cell, BufferedCell) else cell for cell in row]
+                yield [values[i] if i < len(values) else None for i in col_indices]
+
+
+class DataBackend(Backend):
+    """
+    Backend writing the tables of the sheets as plain data rather than as an Excel workbook,
+    for tools that only read the values back. The rows are streamed straight from the parsed data.
+    """
+    streaming = True
+
+    def __init__(self, write_only: bool = False):
+        """
+        Initializes the backend.
+
+        :param bool write_only: Unused, as this backend always streams the tables.
+        """
+        super().__init__()
+        self.style_registry = BufferedStyleRegistry()
+        self.sheets = []
+
+    def create_sheets(self, sheet_names: list[str]) -> list:
+        """
+        Creates the buffered sheets.
+
+        :param list[str] sheet_names: Names of the worksheets to create.
+        :return: The sheets, in the given order.
+        :rtype: list
+        """
+        self.sheets = [DataSheet(ws_name, self.style_registry) for ws_name in sheet_names]
+        return self.sheets
+
+    @staticmethod
+    def get_sheet_path(wb_path: Path, sheet: DataSheet, suffix: str) -> Path:
+        """
+        Gets the path of the file of a sheet, named after the workbook and the sheet.
+
+        :param Path wb_path: The filename the workbook would be saved as.
+        :param DataSheet sheet: The sheet to write.
+        :param str suffix: The file extension, including the leading dot.
+        :return: The path of the file of the sheet.
+        :rtype: Path
+        """
+        return wb_path.with_name(f'{wb_path.stem} - {sheet.name}{suffix}')
+
+
+class CsvBackend(DataBackend):
+    """
+    Backend writing each table to a CSV file with a single header row.
+    """
+
+    def save(self, wb_path: Path):
+        """
+        Writes one CSV file per sheet next to the filename of the workbook.
+
+        :param Path wb_path: The filename the workbook would be saved as.
+        """
+        for sheet in self.sheets:
+            columns = sheet.get_columns()
+            with open(self.get_sheet_path(wb_path, sheet, '.csv'), 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(heading for _, heading in columns)
+                writer.writerows(sheet.iter_values([index for index, _ in columns]))
+
+
+class JsonLinesBackend(DataBackend):
+    """
+    Backend writing each table to a JSON Lines file, with one object keyed by column heading per row.
+    """
+
+    def save(self, wb_path: Path):
+        """
+        Writes one JSON Lines file per sheet next to the filename of the workbook.
+
+        :param Path wb_path: The filename the workbook would be saved as.
+        """
+        for sheet in self.sheets:
+            columns = sheet.get_columns()
+            headings = [heading for _, heading in columns]
+            with open(self.get_sheet_path(wb_path, sheet, '.jsonl'), 'w', encoding='utf-8') as f:
+                for values in sheet.iter_values([index for index, _ in columns]):
+                    f.write(json.dumps(dict(zip(headings, values)), ensure_ascii=False, default=str))
+                    f.write('\n')
+
+
+class SqliteBackend(DataBackend):
+    """
+    Backend writing the tables to a SQLite database, with one table per sheet. The studies of a project
+    share the database, since their sheet names are unique.
+    """
+
+    def save(self, wb_path: Path):
+        """
+        Writes the tables to the database, replacing the tables of an earlier export of the same sheets
+        and keeping the tables of the other sheets.
+
+        :param Path wb_path: The filename of the database.
+        :raises sqlite3.Error: If the database cannot be written.
+        """
+        conn = sqlite3.connect(wb_path)
+        try:
+            with conn:
+                for sheet in self.sheets:
+                    columns = sheet.get_columns()
+                    table = quote_identifier(sheet.name)
+                    conn.execute(f'DROP TABLE IF EXISTS {table}')
+                    conn.execute(f'CREATE TABLE {table} '
+                                 f'({", ".join(quote_identifier(heading) for _, heading in columns)})')
+                    conn.executemany(f'INSERT INTO {table} VALUES ({", ".join("?" * len(columns))})',
+                                     sheet.iter_values([index for index, _ in columns]))
+        finally:
+            conn.close()
+
@@ -0,0 +1,55 @@
+from pathlib import Path
+from openpyxl.workbook import Workbook
+from exporters.backend import Backend
+from exporters.registry import StyleRegistry
+from exporters.streaming import StreamingSheet
+
+
+class OpenpyxlBackend(Backend):
+    """
+    Backend writing the workbook with openpyxl, either through regular worksheets
+    or streamed through write-only worksheets.
+    """
+
+    def __init__(self, write_only: bool = False):
+        """
+        Initializes the backend, creating a new workbook and registering the cell styles in it.
+
+        :param bool write_only: A flag to determine whether to stream the workbook using write-only worksheets.
+        """
+        super().__init__()
+        self.streaming = write_only
+        self.wb = Workbook(write_only=write_only)
+        self.style_registry = StyleRegistry(self.wb)
+        self.sheets = []
+
+    def create_sheets(self, sheet_names: list[str]) -> list:
+        """
+        Creates and names the worksheets, wrapped in streaming sheets in write-only mode.
+
+        :param list[str] sheet_names: Names of the worksheets to create.
+        :return: The worksheets, in the given order.
+        :rtype: list
+        """
+        if self.streaming:
+            self.sheets = [StreamingSheet(self.wb.create_sheet(ws_name), self.style_registry)
+                           for ws_name in sheet_names]
+            return self.sheets
+
+        self.wb.active.title = sheet_names[0]
+        for ws_name in sheet_names[1:]:
+            self.wb.create_sheet(ws_name)
+        self.sheets = self.wb.worksheets
+        return self.sheets
+
+    def save(self, wb_path: Path):
+        """
+        Writes the queued rows of the streaming sheets, if any, and saves the workbook to a specified filename.
+
+        :param Path wb_path: The filename to save the workbook as.
+        """
+        if self.streaming:
+            for sheet in self.sheets:
+                sheet.write()
+        self.wb.save(wb_path)
+        self.wb.close()
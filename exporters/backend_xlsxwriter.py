@@ -0,0 +1,175 @@
+from pathlib import Path
+from xlsxwriter import Workbook
+from xlsxwriter.format import Format
+from xlsxwriter.exceptions import FileCreateError
+from openpyxl.styles import Font, PatternFill, Border, Alignment
+from consts import styles
+from exporters import utils
+from exporters.backend import Backend
+from exporters.registry import BufferedStyleRegistry
+from exporters.streaming import BufferedSheet
+
+BORDER_STYLES = {None: 0, 'thin': 1, 'medium': 2, 'dashed': 3, 'dotted': 4, 'thick': 5, 'double': 6, 'hair': 7}
+WORKBOOK_OPTIONS = {'constant_memory': True, 'strings_to_formulas': False, 'strings_to_urls': False}
+
+
+def get_fill_props(fill: PatternFill) -> dict:
+    """
+    Converts a solid fill to XlsxWriter format properties.
+
+    :param PatternFill fill: The fill to convert.
+    :return: The format properties, empty if the fill is not solid.
+    :rtype: dict
+    """
+    if fill.patternType != 'solid':
+        return {}
+    return {'pattern': 1, 'bg_color': f'#{fill.fgColor.rgb[-6:]}'}
+
+
+def get_format_props(font: Font, fill: PatternFill, border: Border, alignment: Alignment, number_format: str) -> dict:
+    """
+    Converts openpyxl style objects to XlsxWriter format properties.
+
+    :param Font font: The font to convert.
+    :param PatternFill fill: The fill to convert.
+    :param Border border: The border to convert.
+    :param Alignment alignment: The alignment to convert.
+    :param str number_format: The number format.
+    :return: The format properties.
+    :rtype: dict
+    """
+    valign = 'vcenter' if alignment.vertical == 'center' else alignment.vertical
+    props = {'font_name': font.name, 'font_size': font.sz, 'bold': bool(font.b), 'num_format': number_format,
+             'align': alignment.horizontal, 'valign': valign,
+             'left': BORDER_STYLES[border.left.style], 'right': BORDER_STYLES[border.right.style],
+             'top': BORDER_STYLES[border.top.style], 'bottom': BORDER_STYLES[border.bottom.style]}
+    if font.color is not None and font.color.rgb:
+        props['font_color'] = f'#{font.color.rgb[-6:]}'
+    props.update(get_fill_props(fill))
+    return props
+
+
+class XlsxWriterStyleRegistry(BufferedStyleRegistry):
+    """
+    Registers every cell style used by the exporters once per workbook as an XlsxWriter format.
+
+    Cells only record the name of their style, since the formats are created along with the workbook
+    when it is saved.
+    """
+
+    def __init__(self):
+        """
+        Converts the named styles to XlsxWriter format properties.
+        """
+        super().__init__()
+        self.style_props = {name: get_format_props(font, fill, border, styles.ALIGNMENT, styles.NUMBER_FORMAT)
+                            for name, (font, fill, border) in styles.NAMED_STYLES.items()}
+        self.formats = {}
+        self.rule_formats = {}
+        self.wb = None
+
+    def create_formats(self, wb: Workbook):
+        """
+        Creates the formats of the registered styles in the given workbook.
+
+        :param Workbook wb: The workbook to create the formats in.
+        """
+        self.wb = wb
+        self.formats = {name: wb.add_format(props) for name, props in self.style_props.items()}
+        self.rule_formats = {}
+
+    def get_rule_format(self, fill: PatternFill) -> Format:
+        """
+        Returns the format of a conditional formatting rule with the given fill, creating it on first use.
+
+        :param PatternFill fill: The fill of the rule.
+        :return: The format of the rule.
+        :rtype: Format
+        """
+        props = get_fill_props(fill)
+        key = tuple(props.items())
+        if key not in self.rule_formats:
+            self.rule_formats[key] = self.wb.add_format(props)
+        return self.rule_formats[key]
+
+
+class XlsxWriterSheet(BufferedSheet):
+    """
+    Stands in for a worksheet of an XlsxWriter workbook in constant memory mode. Headers, merged ranges and
+    conditional formatting rules are buffered and data rows are queued, then every row is styled and written
+    exactly once, in order, to the worksheet created when the workbook is saved.
+    """
+
+    def write(self):
+        """
+        Writes the column widths, all rows with their merged ranges and the conditional formatting rules
+        to the worksheet, which must have been set. Rows are written in order, as required in constant memory mode.
+        """
+        start_after_row, const_cols_len, var_cols_len, col_width = self.layout
+        max_column = self.max_column
+        separators = utils.get_separator_cols(max_column, const_cols_len, var_cols_len)
+        for i in range(1, max_column + 1):
+            width = styles.WIDTH_BUFFER if i in separators else col_width
+            self.sheet.set_column(i - 1, i - 1, width)
+
+        formats = self.registry.formats
+        for row_index, row in enumerate(self._iter_all_rows(start_after_row, max_column), 1):
+            utils.format_row(row, self.registry, row_index, start_after_row, separators)
+            for col_index, cell in enumerate(row):
+                self.sheet.write(row_index - 1, col_index, cell.value, formats.get(cell.style))
+            for start_row, start_column, end_row, end_column in self.merged_ranges:
+                if start_row == row_index:
+                    cell = row[start_column - 1]
+                    self.sheet.merge_range(start_row - 1, start_column - 1, end_row - 1, end_column - 1,
+                                           cell.value, formats.get(cell.style))
+
+        for cell_range, rule in self.rules:
+            self.sheet.conditional_format(cell_range, {'type': 'formula', 'criteria': f'={rule.formula[0]}',
+                                                       'format': self.registry.get_rule_format(rule.dxf.fill)})
+
+
+class XlsxWriterBackend(Backend):
+    """
+    Backend streaming the workbook with XlsxWriter in constant memory mode, which keeps only the current row
+    in memory and writes each cell directly to the file, without an object model of the workbook.
+    """
+    streaming = True
+
+    def __init__(self, write_only: bool = False):
+        """
+        Initializes the backend. The workbook is created when it is saved.
+
+        :param bool write_only: Unused, as this backend always streams the workbook.
+        """
+        super().__init__()
+        self.style_registry = XlsxWriterStyleRegistry()
+        self.sheets = []
+
+    def create_sheets(self, sheet_names: list[str]) -> list:
+        """
+        Creates the buffered sheets.
+
+        :param list[str] sheet_names: Names of the worksheets to create.
+        :return: The sheets, in the given order.
+        :rtype: list
+        """
+        self.sheets = [XlsxWriterSheet(ws_name, self.style_registry) for ws_name in sheet_names]
+        return self.sheets
+
+    def save(self, wb_path: Path):
+        """
+        Creates the workbook, writes every sheet and saves it to a specified filename.
+
+        :param Path wb_path: The filename to save the workbook as.
+        :raises OSError: If the file cannot be written, such as when it is open in Excel.
+        """
+        wb = Workbook(str(wb_path), WORKBOOK_OPTIONS)
+        self.style_registry.create_formats(wb)
+        for sheet in self.sheets:
+            sheet.sheet = wb.add_worksheet(sheet.name)
+            sheet.write()
+        try:
+            wb.close()
+        except FileCreateError as e:
+            # Raised as the underlying error, so that it is described like the errors of the openpyxl backend
+            raise e.args[0] from None
@@ -1,32 +1,68 @@
 import re
 from pathlib import Path
+from typing import Callable
 from consts import styles
 from exporters import utils
-from openpyxl.workbook import Workbook
-from consts.common import SUBHEAD_ROW, HEADER_ROW
+from exporters.backend_openpyxl import OpenpyxlBackend
+from exporters.backend_xlsxwriter import XlsxWriterBackend
+from exporters.backend_data import CsvBackend, JsonLinesBackend, SqliteBackend
+from consts.common import SUBHEAD_ROW, HEADER_ROW, BACKEND_OPENPYXL, BACKEND_XLSXWRITER, DATA_FORMAT_CSV, \
+    DATA_FORMAT_JSONL, DATA_FORMAT_SQLITE
+
+BACKENDS = {BACKEND_OPENPYXL: OpenpyxlBackend, BACKEND_XLSXWRITER: XlsxWriterBackend, DATA_FORMAT_CSV: CsvBackend,
+            DATA_FORMAT_JSONL: JsonLinesBackend, DATA_FORMAT_SQLITE: SqliteBackend}
 
 
 class Exporter:
 
-    def __init__(self, sheet_names: list[str], header_names: list[str]):
+    def __init__(self, sheet_names: list[str], header_names: list[str], write_only: bool = False,
+                 conditional_formatting: bool = False, backend: str = BACKEND_OPENPYXL):
         """
         Initializes a new instance of the Exporter class,
-        creating a new workbook and setting up the worksheets.
+        creating a new workbook with the given backend and setting up the worksheets.
+
+        In write-only mode, and always with the XlsxWriter and data backends, the workbook is streamed: headers are
+        buffered, data rows are queued and every row is styled and written once, in order, when the workbook is saved.
+
+        With conditional formatting, value highlights are added as worksheet rules over whole columns
+        instead of being evaluated cell by cell, so they stay up to date when values are edited in Excel.
+
+        :param list[str] sheet_names: Names of the worksheets to create.
+        :param list[str] header_names: Names of the constant and end column headers.
+        :param bool write_only: A flag to determine whether to stream the workbook using write-only worksheets.
+        :param bool conditional_formatting: A flag to determine whether to highlight values with conditional
+                                            formatting rules.
+        :param str backend: Name of the engine writing the workbook, 'openpyxl' or 'xlsxwriter',
+                            or of the data format to write the tables as instead, 'csv', 'jsonl' or 'sqlite'.
         """
         self.ansi_data = {}
         self.iec_data = {}
-        self.wb = Workbook()
-        self._initialize_sheets(sheet_names)
+        self.col_indices = {}
+        self.conditional_formatting = conditional_formatting
+        self.backend = BACKENDS[backend](write_only)
+        self.streaming = self.backend.streaming
+        self.style_registry = self.backend.style_registry
+        self.sheets = self.backend.create_sheets(sheet_names)
         self.header_names = header_names
 
-    def _initialize_sheets(self, ws_names):
-        """
-        Initializes and names the worksheets.
+    def _index_headers(self, sheet_index: int):
         """
+        Builds the heading to column index map of a specified sheet from its header row.
+        Both the full heading and the part after a ':' prefix are mapped, the first column winning.
 
-        self.wb.active.title = ws_names[0]
-        for ws_name in ws_names[1:]:
-            self.wb.create_sheet(ws_name)
+        :param int sheet_index: Index of the worksheet in the workbook.
+        """
+        sheet = self.sheets[sheet_index]
+        col_indices = {}
+        for column in range(1, sheet.max_column + 1):
+            value = sheet.cell(HEADER_ROW, column).value
+            if value is None:
+                continue
+            col_indices.setdefault(value.strip(), column - 1)
+            match = re.search(r':(.*)', value)
+            if match:
+                col_indices.setdefault(match.group(1).strip(), column - 1)
+        self.col_indices[sheet_index] = col_indices
 
     def _get_col_index(self, sheet_index: int, heading: str):
         """
@@ -37,16 +73,28 @@ class Exporter:
         :return: The index of the column with the specified heading.
         :rtype: int
         """
-        sheet = self.wb.worksheets[sheet_index]
-        for col in sheet.iter_cols(1, sheet.max_column):
-            if col[0].value is None:
-                continue
-            if col[0].value.strip() == heading:
-                return col[0].column - 1
-            match = re.search(r':(.*)', col[0].value)
-            col_name = match and match.group(1).strip()
-            if heading == col_name:
-                return col[0].column - 1
+        if sheet_index not in self.col_indices:
+            self._index_headers(sheet_index)
+        return self.col_indices[sheet_index].get(heading)
+
+    def _insert_rows(self, sheet_index: int, start_row: int, entries: dict, insert_row: Callable):
+        """
+        Inserts one row per data entry using the given row insertion function. When streaming the rows
+        are queued lazily and only built when the sheet is written.
+
+        :param int sheet_index: Index of the worksheet in the workbook.
+        :param int start_row: Index of the first data row.
+        :param dict entries: Dictionary of data entries keyed by ID.
+        :param Callable insert_row: Function filling a row of cells from an entry ID and its data, returning the row.
+        """
+        sheet = self.sheets[sheet_index]
+        if self.streaming:
+            sheet.add_rows(insert_row(sheet.new_row(), _id, entry) for _id, entry in entries.items())
+            return
+        # The last column is found once, as indexing the sheet by row recomputes it from every cell
+        rows = sheet.iter_rows(start_row, start_row + len(entries) - 1, 1, sheet.max_column)
+        for row, (_id, entry) in zip(rows, entries.items()):
+            insert_row(row, _id, entry)
 
     def set_ansi_data(self, ansi_data: dict):
         """
@@ -75,12 +123,13 @@ class Exporter:
         """
         var_cols_buff = len(var_cols) + 1
         const_cols_buff = len(const_cols) + 2
-        sheet = self.wb.worksheets[sheet_index]
+        sheet = self.sheets[sheet_index]
         configs = utils.get_sorted_configs(self.ansi_data) or utils.get_sorted_configs(self.iec_data)
         const_cols_header, end_cols_header = self.header_names
         utils.set_const_cols_header(sheet, const_cols_header, const_cols)
         utils.set_var_cols_headers(sheet, configs, var_cols, const_cols_buff, var_cols_buff, col_prefix)
         utils.set_end_cols_headers(sheet, end_cols_header, var_cols, const_cols_buff, len(configs) * var_cols_buff)
+        self._index_headers(sheet_index)
 
     def format_headers(self, sheet_index: int):
         """
@@ -88,16 +137,16 @@ class Exporter:
 
         :param int sheet_index: Index of the worksheet in the workbook.
         """
-        sheet = self.wb.worksheets[sheet_index]
+        sheet = self.sheets[sheet_index]
         for row in sheet.iter_rows(HEADER_ROW, SUBHEAD_ROW):
             for cell in row:
-                utils.apply_cell_format(cell, styles.FONT_HEADER, styles.ALIGNMENT,
-                                        styles.BORDER_ALL, styles.FILL_HEADER)
+                self.style_registry.apply(cell, styles.STYLE_HEADER)
 
     def format_sheet(self, sheet_index: int, start_after_row: int, const_cols_len: int, var_cols_len: int,
                      col_width: float):
         """
-        Applies formatting to the entire sheet.
+        Applies formatting to the entire sheet in a single pass, styling each cell once and setting the column
+        widths from the layout. When streaming the layout is recorded and applied while the rows are written out.
 
         :param int sheet_index: Index of the worksheet in the workbook.
         :param start_after_row: Index of the row to start formatting after.
@@ -105,10 +154,15 @@ class Exporter:
         :param int var_cols_len: Number of variable columns.
         :param float col_width: Width of the columns.
         """
-        sheet = self.wb.worksheets[sheet_index]
-        utils.apply_row_format(sheet, start_after_row + 1)
-        utils.set_column_widths(sheet, const_cols_len, var_cols_len, col_width)
-        utils.format_numbers(sheet)
+        sheet = self.sheets[sheet_index]
+        if self.streaming:
+            sheet.set_layout(start_after_row, const_cols_len, var_cols_len, col_width)
+            return
+        max_column = sheet.max_column
+        separators = utils.get_separator_cols(max_column, const_cols_len, var_cols_len)
+        utils.set_column_widths(sheet, max_column, separators, col_width)
+        for row_index, row in enumerate(sheet.iter_rows(1, sheet.max_row, 1, max_column), 1):
+            utils.format_row(row, self.style_registry, row_index, start_after_row, separators)
 
     def save_workbook(self, wb_path: Path):
         """
@@ -116,5 +170,4 @@ class Exporter:
 
         :param Path wb_path: The filename to save the workbook as.
         """
-        self.wb.save(wb_path)
-        self.wb.close()
+        self.backend.save(wb_path)
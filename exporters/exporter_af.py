@@ -1,6 +1,8 @@
 from consts import styles
-from openpyxl import Workbook
-from consts.common import SUBHEAD_ROW
+from exporters import utils
+from openpyxl.cell import Cell
+from openpyxl.utils import get_column_letter
+from consts.common import SUBHEAD_ROW, BACKEND_OPENPYXL
 from consts.sheets import WS_ARC_FLASH
 from exporters.exporter import Exporter
 from consts.columns import AF_SI_CONST_COLS, AF_CONST_COLS
@@ -15,15 +17,20 @@ class ArcFlashExporter(Exporter):
         ws (Worksheet): The active worksheet in the workbook.
     """
 
-    def __init__(self):
+    def __init__(self, write_only: bool = False, conditional_formatting: bool = False,
+                 backend: str = BACKEND_OPENPYXL):
         """
         Initializes a new instance of the ArcFlashExporter class,
         creating a new workbook and setting up the active worksheet.
+
+        :param bool write_only: A flag to determine whether to stream the workbook using write-only worksheets.
+        :param bool conditional_formatting: A flag to determine whether to highlight high energy values
+                                            with conditional formatting rules.
+        :param str backend: Name of the engine writing the workbook, 'openpyxl' or 'xlsxwriter'.
         """
-        super().__init__([WS_ARC_FLASH], [AF_CONST_COLS, None])
-        self.wb = Workbook()
-        self.ws = self.wb.active
-        self.ws.title = WS_ARC_FLASH
+        super().__init__([WS_ARC_FLASH], [AF_CONST_COLS, None], write_only, conditional_formatting, backend)
+        self.ws = self.sheets[0]
+        self.energy_thresholds = None
 
     def add_data(self, af_data: dict):
         """
@@ -32,9 +39,31 @@ class ArcFlashExporter(Exporter):
         :param dict af_data: A dictionary where the keys are row headers and values
                              are lists of data corresponding to each column.
         """
-        for i, (key, data) in enumerate(af_data.items()):
+        if self.streaming:
+            self.ws.add_rows(self._build_row(key, data) for key, data in af_data.items())
+            return
+        for key, data in af_data.items():
             self.ws.append([key] + data)
 
+    def _build_row(self, key: str, data: list) -> list[Cell]:
+        """
+        Builds a streamed data row, highlighting its energy cell if thresholds have been set.
+
+        :param str key: The row header.
+        :param list data: Data corresponding to each column.
+        :return: The row of cells.
+        :rtype: list[Cell]
+        """
+        row = self.ws.new_row()
+        for cell, value in zip(row, [key] + data):
+            cell.value = value
+        if self.energy_thresholds:
+            energy_cell = row[self._get_col_index(0, 'Total Energy (cal/cm²)')]
+            style = self.get_energy_style(energy_cell.value, *self.energy_thresholds)
+            if style:
+                self.style_registry.apply(energy_cell, style)
+        return row
+
     def create_headers(self, use_si_units: bool = False, **args):
         """
         Creates the header row in the worksheet using predefined column names
@@ -46,23 +75,60 @@ class ArcFlashExporter(Exporter):
         for index, col_name in enumerate(column_names):
             cell = self.ws.cell(1, index + 1)
             cell.value = col_name
-            cell.fill = styles.FILL_HEADER
-            cell.font = styles.FONT_HEADER
-            cell.alignment = styles.ALIGNMENT
-            cell.border = styles.BORDER_ALL
+            self.style_registry.apply(cell, styles.STYLE_HEADER)
+        self._index_headers(0)
 
     def highlight_high_energy(self, max_energy: float, crit_energy: float):
         """
         Highlights cells in the 'Total Energy' column that fall within specified
-        energy thresholds by applying different fill colors.
+        energy thresholds by applying different highlight styles. When streaming the
+        thresholds are applied as the rows are streamed out. With conditional formatting,
+        the thresholds are added as rules over the whole column instead.
 
         :param float max_energy: The maximum energy threshold for applying low energy highlighting.
         :param float crit_energy: The critical energy threshold for applying high energy highlighting.
         """
+        if self.conditional_formatting:
+            self._add_high_energy_rules(max_energy, crit_energy)
+            return
+        if self.streaming:
+            self.energy_thresholds = (max_energy, crit_energy)
+            return
+
         energy_col = self._get_col_index(0, 'Total Energy (cal/cm²)') + 1
         for column in self.ws.iter_cols(energy_col, energy_col, min_row=SUBHEAD_ROW):
             for cell in column:
-                if max_energy < cell.value < crit_energy:
-                    cell.fill = styles.FILL_ROW_ORANGE
-                elif cell.value > crit_energy:
-                    cell.fill = styles.FILL_ROW_RED
+                style = self.get_energy_style(cell.value, max_energy, crit_energy)
+                if style:
+                    self.style_registry.apply(cell, style)
+
+    def _add_high_energy_rules(self, max_energy: float, crit_energy: float):
+        """
+        Adds the conditional formatting rules highlighting the cells of the 'Total Energy' column
+        that fall within the specified energy thresholds.
+
+        :param float max_energy: The maximum energy threshold for applying low energy highlighting.
+        :param float crit_energy: The critical energy threshold for applying high energy highlighting.
+        """
+        energy_col = self._get_col_index(0, 'Total Energy (cal/cm²)') + 1
+        energy_cell = f'{get_column_letter(energy_col)}{SUBHEAD_ROW}'
+        utils.add_highlight_rule(self.ws, energy_col, SUBHEAD_ROW,
+                                 f'AND({energy_cell}>{max_energy},{energy_cell}<{crit_energy})',
+                                 styles.FILL_ROW_ORANGE)
+        utils.add_highlight_rule(self.ws, energy_col, SUBHEAD_ROW, f'{energy_cell}>{crit_energy}', styles.FILL_ROW_RED)
+
+    @staticmethod
+    def get_energy_style(energy: float, max_energy: float, crit_energy: float) -> str | None:
+        """
+        Gets the highlight style for an incident energy value.
+
+        :param float energy: The incident energy value.
+        :param float max_energy: The maximum energy threshold for applying low energy highlighting.
+        :param float crit_energy: The critical energy threshold for applying high energy highlighting.
+        :return: The name of the style to apply, or None if the value is below both thresholds.
+        :rtype: str | None
+        """
+        if max_energy < energy < crit_energy:
+            return styles.STYLE_ENTRY_ORANGE
+        elif energy > crit_energy:
+            return styles.STYLE_ENTRY_RED
@@ -1,8 +1,10 @@
 from openpyxl import Workbook
 from openpyxl.cell import Cell
+from exporters import utils
+from openpyxl.utils import get_column_letter
 from consts.columns import DD_CONST_HEADERS
-from consts.common import CONFIG_MAP
-from consts.styles import FILL_ROW_RED, FILL_ROW_ORANGE
+from consts.common import CONFIG_MAP, BACKEND_OPENPYXL
+from consts.styles import STYLE_ENTRY_RED, STYLE_ENTRY_ORANGE, FILL_ROW_RED
 from consts.sheets import WS_ANSI_MOM, WS_ANSI_INT, WS_IEC_INT
 from exporters.exporter import Exporter, SUBHEAD_ROW
 
@@ -17,16 +19,21 @@ class DeviceDutyExporter(Exporter):
         wb (Workbook): The Excel workbook.
     """
 
-    def __init__(self):
+    def __init__(self, write_only: bool = False, conditional_formatting: bool = False,
+                 backend: str = BACKEND_OPENPYXL):
         """
         Initializes a new instance of the DeviceDutyExporter class,
         creating a new workbook and setting up the worksheets.
+
+        :param bool write_only: A flag to determine whether to stream the workbook using write-only worksheets.
+        :param bool conditional_formatting: A flag to determine whether to highlight high duty values
+                                            with conditional formatting rules.
+        :param str backend: Name of the engine writing the workbook, 'openpyxl' or 'xlsxwriter'.
         """
         dd_ws_names = [WS_ANSI_MOM, WS_ANSI_INT, WS_IEC_INT]
-        super().__init__(dd_ws_names, DD_CONST_HEADERS)
+        super().__init__(dd_ws_names, DD_CONST_HEADERS, write_only, conditional_formatting, backend)
 
-    @staticmethod
-    def highlight_high_duty(cell: Cell, fault_val: float, cap_val: float):
+    def highlight_high_duty(self, cell: Cell, fault_val: float, cap_val: float):
         """
         Highlights cells where the fault value exceeds the capability value.
 
@@ -35,10 +42,9 @@ class DeviceDutyExporter(Exporter):
         :param float cap_val: The capability value to compare against.
         """
         if fault_val > cap_val:
-            cell.fill = FILL_ROW_RED
+            self.style_registry.apply(cell, STYLE_ENTRY_RED)
 
-    @staticmethod
-    def highlight_series_rated(cell, is_series_rated: bool | None):
+    def highlight_series_rated(self, cell: Cell, is_series_rated: bool | None):
         """
         Highlights cells that are series rated.
 
@@ -46,7 +52,7 @@ class DeviceDutyExporter(Exporter):
         :param bool | None is_series_rated: Indicates whether the cell should be series rated.
         """
         if is_series_rated:
-            cell.fill = FILL_ROW_ORANGE
+            self.style_registry.apply(cell, STYLE_ENTRY_ORANGE)
 
     def insert_data(self, ws_index: int, data_type: str, spec_keys: dict, dataset: str = 'ansi'):
         """
@@ -58,17 +64,40 @@ class DeviceDutyExporter(Exporter):
         :param str dataset: The dataset to use ('ansi' or 'iec'). Default is 'ansi'.
         """
         data = self.ansi_data if dataset == 'ansi' else self.iec_data
-        ws = self.wb.worksheets[ws_index]
         start_row = SUBHEAD_ROW + 1
-        data_entries = data[data_type]
-        ids = list(data_entries.keys())
-        values = list(data_entries.values())
 
-        for i, _id in enumerate(ids):
-            current_row = ws[start_row + i]
-            self._insert_row_data(ws_index, current_row, _id, values[i], spec_keys)
+        def insert_row(ws_row, _id, entry_data):
+            return self._insert_row_data(ws_index, ws_row, _id, entry_data, spec_keys)
+
+        self._insert_rows(ws_index, start_row, data[data_type], insert_row)
+        if self.conditional_formatting:
+            self.add_high_duty_rules(ws_index, data, data_type, spec_keys)
 
-    def _insert_row_data(self, ws_index: int, ws_row: tuple, entry_id: str, entry_data: dict, spec_keys: dict):
+    def add_high_duty_rules(self, ws_index: int, data: dict, data_type: str, spec_keys: dict):
+        """
+        Adds the conditional formatting rules highlighting the fault values that exceed the capability value
+        of their row. Capability cells showing '--' count as zero, as in the highlights made cell by cell.
+
+        :param int ws_index: Index of the worksheet in the workbook.
+        :param dict data: The dataset holding the data section of the worksheet.
+        :param str data_type: Key for the data section of the worksheet.
+        :param dict spec_keys: Dictionary of specification keys used to extract data.
+        """
+        sheet = self.sheets[ws_index]
+        start_row = SUBHEAD_ROW + 1
+        last_col_index = self._get_col_index(ws_index, DD_CONST_HEADERS[1])
+        for config in utils.get_sorted_configs({data_type: data[data_type]}):
+            col_index = self._get_col_index(ws_index, CONFIG_MAP.get(config, config))
+            if not col_index:
+                continue
+            for j in range(len(spec_keys['Fault'])):
+                fault_col = get_column_letter(col_index + j + 1)
+                cap_col = get_column_letter(last_col_index + j + 1)
+                formula = f'N({fault_col}{start_row})>N(${cap_col}{start_row})'
+                utils.add_highlight_rule(sheet, col_index + j + 1, start_row, formula, FILL_ROW_RED)
+
+    def _insert_row_data(self, ws_index: int, ws_row: tuple, entry_id: str, entry_data: dict,
+                         spec_keys: dict) -> tuple:
         """
         Inserts a single row of data into the specified sheet.
 
@@ -77,6 +106,8 @@ class DeviceDutyExporter(Exporter):
         :param str entry_id: ID of the data being inserted.
         :param dict entry_data: Dictionary of data to be inserted in the row.
         :param dict spec_keys: Specification keys for fault and capability data.
+        :return: The filled row.
+        :rtype: tuple
         """
         clean_id = entry_id.strip()
         assumed = entry_data.get('Assumed')
@@ -85,6 +116,7 @@ class DeviceDutyExporter(Exporter):
         ws_row[2].value = entry_data.get(spec_keys['Type'], '').strip()
         ws_row[3].value = entry_data.get('Device', '').strip()
         self._insert_fault_and_cap_data(ws_index, ws_row, entry_data, spec_keys)
+        return ws_row
 
     def _insert_fault_and_cap_data(self, ws_index: int, ws_row: tuple, entry_data: dict, spec_keys: dict):
         """
@@ -122,4 +154,5 @@ class DeviceDutyExporter(Exporter):
             if col_index:
                 cell = ws_row[col_index + offset]
                 cell.value = round(fault_val, 2) or '--'
-                self.highlight_high_duty(cell, fault_val, cap_val)
+                if not self.conditional_formatting:
+                    self.highlight_high_duty(cell, fault_val, cap_val)
@@ -1,5 +1,6 @@
+from typing import Mapping
 from openpyxl.cell import Cell
-from consts.common import CONFIG_MAP
+from consts.common import CONFIG_MAP, BACKEND_OPENPYXL
 from consts.columns import SC_CONST_HEADERS
 from consts.sheets import WS_SHORT_CIRCUIT, WS_SEQ_IMP
 from exporters.exporter import Exporter, SUBHEAD_ROW
@@ -13,13 +14,16 @@ class ShortCircuitExporter(Exporter):
         ansi_data (dict): Data specific to ANSI standards.
         wb (Workbook): The Excel workbook.
     """
-    def __init__(self):
+    def __init__(self, write_only: bool = False, backend: str = BACKEND_OPENPYXL):
         """
         Initializes a new instance of the ShortCircuitExporter class,
         creating a new workbook and setting up the worksheets.
+
+        :param bool write_only: A flag to determine whether to stream the workbook using write-only worksheets.
+        :param str backend: Name of the engine writing the workbook, 'openpyxl' or 'xlsxwriter'.
         """
         sc_ws_names = [WS_SHORT_CIRCUIT, WS_SEQ_IMP]
-        super().__init__(sc_ws_names, SC_CONST_HEADERS)
+        super().__init__(sc_ws_names, SC_CONST_HEADERS, write_only, backend=backend)
 
     def insert_data(self, ws_index: int, data_type: str, spec_keys: list[str], round_to: int = 2):
         """
@@ -31,40 +35,41 @@ class ShortCircuitExporter(Exporter):
         :param int round_to: Number of decimal digits to round up to.
         """
         start_row = SUBHEAD_ROW + 1
-        ws = self.wb.worksheets[ws_index]
-        data_entries = self.ansi_data[data_type]
-        ids = list(data_entries.keys())
-        values = list(data_entries.values())
-        for i, _id in enumerate(ids):
-            current_row = ws[start_row + i]
-            self._insert_row_data(ws_index, current_row, _id, values[i], spec_keys, round_to)
 
-    def _insert_row_data(self, ws_index: int, ws_row: tuple, entry_id: str, entry_data: dict,
-                         spec_keys: list[str], round_to: int):
+        def insert_row(ws_row, _id, entry_data):
+            return self._insert_row_data(ws_index, ws_row, _id, entry_data, spec_keys, round_to)
+
+        self._insert_rows(ws_index, start_row, self.ansi_data[data_type], insert_row)
+
+    def _insert_row_data(self, ws_index: int, ws_row: tuple, entry_id: str, entry_data: Mapping,
+                         spec_keys: list[str], round_to: int) -> tuple:
         """
         Inserts a single row of data into the specified sheet.
 
         :param int ws_index: Index of the worksheet where the data is being inserted.
         :param int ws_row: The row object where the data is being inserted.
         :param str entry_id: ID of the data being inserted.
-        :param dict entry_data: Dictionary of data to be inserted in the row.
+        :param Mapping entry_data: Mapping of data to be inserted in the row.
         :param list[str] spec_keys: Dictionary of specification keys used to extract data.
         :param int round_to: Number of decimal digits to round up to.
+        :return: The filled row.
+        :rtype: tuple
         """
         ws_row[0].value = entry_id.strip()
         ws_row[1].value = round(entry_data['Voltage'], 3)
         data_vals = [entry_data[k] for k in spec_keys]
         for j in range(len(data_vals)):
             self.insert_fault_data(ws_index, ws_row, data_vals[j], round_to, offset=j)
+        return ws_row
 
-    def insert_fault_data(self, sheet_index: int, row: tuple[Cell, ...], values: dict,
+    def insert_fault_data(self, sheet_index: int, row: tuple[Cell, ...], values: Mapping,
                           round_to: int, offset: int = 0):
         """
         Inserts fault data into specified cells in a row.
 
         :param int sheet_index: Index of the worksheet in the workbook.
         :param tuple[Cell, ...] row: The row to insert data into.
-        :param dict values: A dictionary of fault values by configuration.
+        :param Mapping values: A mapping of fault values or (magnitude, phase) pairs by configuration.
         :param int round_to: Number of decimal digits to round up to.
         :param int offset: Offset for column insertion, default is 0.
         """
@@ -73,7 +78,7 @@ class ShortCircuitExporter(Exporter):
             col_index = self._get_col_index(sheet_index, heading_key)
             if col_index:
                 cell = row[col_index + offset]
-                if isinstance(fault_val, list):
+                if isinstance(fault_val, (list, tuple)):
                     mag = round(fault_val[0], round_to)
                     phase = round(fault_val[1], round_to)
                     cell.value = f"{mag} ∠ {phase}°"
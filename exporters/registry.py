@@ -0,0 +1,59 @@
+from copy import copy
+from consts import styles
+from openpyxl.cell import Cell
+from openpyxl.workbook import Workbook
+from openpyxl.styles import NamedStyle
+
+
+class StyleRegistry:
+    """
+    Registers every cell style used by the exporters once per workbook as a named style.
+
+    Each style combines a font, fill, border, the common alignment and the number format, so that styling a cell
+    is a single copy of the precomputed style array of the named style rather than one lookup and hash
+    of each style object per cell.
+    """
+
+    def __init__(self, wb: Workbook):
+        """
+        Registers the named styles in the given workbook.
+
+        :param Workbook wb: The workbook to register the styles in.
+        """
+        self.style_arrays = {}
+        for name, (font, fill, border) in styles.NAMED_STYLES.items():
+            named_style = NamedStyle(name, font=font, fill=fill, border=border, alignment=styles.ALIGNMENT,
+                                     number_format=styles.NUMBER_FORMAT)
+            wb.add_named_style(named_style)
+            self.style_arrays[name] = named_style.as_tuple()
+
+    def apply(self, cell: Cell, name: str):
+        """
+        Applies a registered style to a cell.
+
+        :param Cell cell: The cell to apply the style to.
+        :param str name: The name of the style.
+        """
+        cell._style = copy(self.style_arrays[name])
+
+
+class BufferedStyleRegistry(StyleRegistry):
+    """
+    Records the name of the registered style of each buffered cell, for backends that create their cell formats
+    only when the workbook is saved, or that write no formats at all.
+    """
+
+    def __init__(self):
+        """
+        Initializes the registry. The named styles need no registration, since cells only refer to them by name.
+        """
+        self.style_arrays = {}
+
+    def apply(self, cell, name: str):
+        """
+        Applies a registered style to a buffered cell.
+
+        :param BufferedCell cell: The cell to apply the style to.
+        :param str name: The name of the style.
+        """
+        cell.style = name
@@ -0,0 +1,243 @@
+from typing import Iterable
+from exporters import utils
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.formatting.rule import Rule
+from openpyxl.formatting.formatting import ConditionalFormattingList
+from exporters.registry import StyleRegistry, BufferedStyleRegistry
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+
+
+class StreamingSheet:
+    """
+    Stands in for a worksheet of a write-only workbook. Supports the subset of the Worksheet API used by
+    the exporters for headers, while data rows are queued as lazy iterables. Every row is built, styled
+    and written exactly once, in order, when the sheet is written.
+    """
+    cell_class = Cell
+
+    def __init__(self, sheet: WriteOnlyWorksheet, registry: StyleRegistry):
+        """
+        Initializes the streaming sheet for the given write-only worksheet.
+
+        :param WriteOnlyWorksheet sheet: The write-only worksheet to stream rows into.
+        :param StyleRegistry registry: The style registry of the workbook.
+        """
+        self.sheet = sheet
+        self.registry = registry
+        self.header_cells = {}
+        self.row_sources = []
+        self.layout = None
+
+    @property
+    def max_row(self) -> int:
+        """
+        Returns the index of the last buffered header row.
+        """
+        return max((row for row, _ in self.header_cells), default=0)
+
+    @property
+    def max_column(self) -> int:
+        """
+        Returns the index of the last buffered header column.
+        """
+        return max((column for _, column in self.header_cells), default=0)
+
+    @property
+    def conditional_formatting(self) -> ConditionalFormattingList:
+        """
+        Returns the conditional formatting rules of the underlying worksheet.
+        """
+        return self.sheet.conditional_formatting
+
+    def _new_cell(self, value=None) -> Cell:
+        """
+        Creates a cell of the underlying worksheet.
+
+        :param value: The value of the cell.
+        :return: The new cell.
+        :rtype: Cell
+        """
+        return WriteOnlyCell(self.sheet, value)
+
+    def cell(self, row: int, column: int) -> Cell:
+        """
+        Returns the buffered header cell at the given position, creating it if needed.
+
+        :param int row: Row index of the cell.
+        :param int column: Column index of the cell.
+        :return: The buffered cell.
+        :rtype: Cell
+        """
+        if (row, column) not in self.header_cells:
+            self.header_cells[(row, column)] = self._new_cell()
+        return self.header_cells[(row, column)]
+
+    def iter_rows(self, min_row: int, max_row: int) -> Iterable[list[Cell]]:
+        """
+        Iterates over the buffered header rows between the given indices.
+
+        :param int min_row: Index of the first row.
+        :param int max_row: Index of the last row.
+        :return: Rows of buffered cells spanning all header columns.
+        :rtype: Iterable[list[Cell]]
+        """
+        for row in range(min_row, max_row + 1):
+            yield [self.cell(row, column) for column in range(1, self.max_column + 1)]
+
+    def merge_cells(self, start_row: int, start_column: int, end_row: int, end_column: int):
+        """
+        Registers a merged cell range on the underlying worksheet.
+
+        :param int start_row: Index of the first row of the range.
+        :param int start_column: Index of the first column of the range.
+        :param int end_row: Index of the last row of the range.
+        :param int end_column: Index of the last column of the range.
+        """
+        self.sheet.merged_cells.add(CellRange(min_row=start_row, min_col=start_column,
+                                              max_row=end_row, max_col=end_column))
+
+    def new_row(self) -> list[Cell]:
+        """
+        Creates an empty data row spanning all header columns.
+
+        :return: A list of write-only cells.
+        :rtype: list[Cell]
+        """
+        return [self._new_cell() for _ in range(self.max_column)]
+
+    def add_rows(self, rows: Iterable[list]):
+        """
+        Queues data rows to be written after the header rows. Rows may hold cells or plain values.
+
+        :param Iterable[list] rows: An iterable of rows, consumed only when the sheet is written.
+        """
+        self.row_sources.append(rows)
+
+    def set_layout(self, start_after_row: int, const_cols_len: int, var_cols_len: int, col_width: float):
+        """
+        Records the formatting layout to apply when the sheet is written.
+
+        :param start_after_row: Index of the last header row.
+        :param int const_cols_len: Number of constant columns.
+        :param int var_cols_len: Number of variable columns.
+        :param float col_width: Width of the columns.
+        """
+        self.layout = (start_after_row, const_cols_len, var_cols_len, col_width)
+
+    def write(self):
+        """
+        Writes the column widths, the header rows and all queued data rows to the worksheet in a single pass.
+        """
+        start_after_row, const_cols_len, var_cols_len, col_width = self.layout
+        max_column = self.max_column
+        separators = utils.get_separator_cols(max_column, const_cols_len, var_cols_len)
+        utils.set_column_widths(self.sheet, max_column, separators, col_width)
+        for row_index, row in enumerate(self._iter_all_rows(start_after_row, max_column), 1):
+            utils.format_row(row, self.registry, row_index, start_after_row, separators)
+            self.sheet.append(row)
+
+    def _iter_all_rows(self, start_after_row: int, max_column: int) -> Iterable[list[Cell]]:
+        """
+        Iterates over the header rows followed by the queued data rows, padded with empty cells to the last column.
+
+        :param int start_after_row: Index of the last header row.
+        :param int max_column: Index of the last header column.
+        :return: Rows of cells.
+        :rtype: Iterable[list[Cell]]
+        """
+        yield from self.iter_rows(1, start_after_row)
+        for rows in self.row_sources:
+            for row in rows:
+                cells = [value if isinstance(value, self.cell_class) else self._new_cell(value) for value in row]
+                cells += [self._new_cell() for _ in range(max_column - len(cells))]
+                yield cells
+
+
+class BufferedCell:
+    """
+    A buffered cell of a sheet written without an openpyxl worksheet, holding its value and the name
+    of its registered style.
+    """
+    __slots__ = ('value', 'style')
+
+    def __init__(self, value=None):
+        self.value = value
+        self.style = None
+
+    @property
+    def has_style(self) -> bool:
+        """
+        Returns whether a style has been applied to the cell.
+        """
+        return self.style is not None
+
+
+class BufferedRules(list):
+    """
+    The conditional formatting rules of a buffered sheet, added like the rules of an openpyxl worksheet.
+    """
+
+    def add(self, cell_range: str, rule: Rule):
+        """
+        Adds a formula rule over a range of cells.
+
+        :param str cell_range: The range of cells of the rule.
+        :param Rule rule: The openpyxl formula rule.
+        """
+        self.append((cell_range, rule))
+
+
+class BufferedSheet(StreamingSheet):
+    """
+    A streaming sheet without an openpyxl worksheet. Headers, merged ranges and conditional formatting rules
+    are buffered and data rows are queued until the sheet is written by its backend.
+    """
+    cell_class = BufferedCell
+
+    def __init__(self, name: str, registry: BufferedStyleRegistry):
+        """
+        Initializes the sheet with the given name.
+
+        :param str name: Name of the worksheet.
+        :param BufferedStyleRegistry registry: The style registry of the workbook.
+        """
+        super().__init__(None, registry)
+        self.name = name
+        self.merged_ranges = []
+        self.rules = BufferedRules()
+
+    @property
+    def conditional_formatting(self) -> BufferedRules:
+        """
+        Returns the buffered conditional formatting rules.
+        """
+        return self.rules
+
+    def _new_cell(self, value=None) -> BufferedCell:
+        """
+        Creates a buffered cell.
+
+        :param value: The value of the cell.
+        :return: The new cell.
+        :rtype: BufferedCell
+        """
+        return BufferedCell(value)
+
+    def merge_cells(self, start_row: int, start_column: int, end_row: int, end_column: int):
+        """
+        Registers a merged cell range, ignoring ranges of a single cell.
+
+        :param int start_row: Index of the first row of the range.
+        :param int start_column: Index of the first column of the range.
+        :param int end_row: Index of the last row of the range.
+        :param int end_column: Index of the last column of the range.
+        """
+        if (start_row, start_column) != (end_row, end_column):
+            self.merged_ranges.append((start_row, start_column, end_row, end_column))
+
+    def write(self):
+        """
+        Writes the sheet. Abstract method for inheritance.
+        """
+        pass
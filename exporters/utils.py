@@ -1,21 +1,29 @@
+from typing import Mapping
 from consts import styles
 from openpyxl.cell import Cell
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
-from consts.common import SUBHEAD_ROW, CONFIG_MAP, HEADER_ROW
+from exporters.registry import StyleRegistry
+from openpyxl.styles import PatternFill
+from openpyxl.formatting.rule import FormulaRule
+from consts.common import SUBHEAD_ROW, CONFIG_MAP, HEADER_ROW, SHEET_MAX_ROW
 
 
-def apply_row_format(sheet: Worksheet, start_row):
+def format_row(cells: list[Cell], registry: StyleRegistry, row_index: int, start_after_row: int,
+               separators: set[int]):
     """
-    Helper method to apply formatting to data rows.
+    Helper method to apply the registered style of each cell of a row, in a single assignment per cell.
 
-    :param Worksheet sheet: The worksheet object.
-    :param int start_row: Row index to start formatting at.
+    :param list[Cell] cells: The cells of the row.
+    :param StyleRegistry registry: The style registry of the workbook.
+    :param int row_index: Index of the row.
+    :param int start_after_row: Index of the last header row.
+    :param set[int] separators: Indices of the separator columns.
     """
-    for i in range(start_row, sheet.max_row + 1):
-        for cell in sheet[i]:
-            fill = get_row_cell_fill(cell)
-            apply_cell_format(cell, styles.FONT_ENTRIES, styles.ALIGNMENT, styles.BORDER_ALL, fill)
+    for col_index, cell in enumerate(cells, 1):
+        style = get_cell_style(cell, row_index, col_index, start_after_row, separators)
+        if style:
+            registry.apply(cell, style)
 
 
 def get_sorted_configs(data: dict) -> list:
@@ -28,7 +36,7 @@ def get_sorted_configs(data: dict) -> list:
     configs = set()
     random_key = next(iter(data))
     for _id, entry in data[random_key].items():
-        random_dict = next((v for v in entry.values() if isinstance(v, dict)), {})
+        random_dict = next((v for v in entry.values() if isinstance(v, Mapping)), {})
         configs.update(random_dict.keys())
     return rearrange_list(list(configs), list(CONFIG_MAP.keys()))
 
@@ -117,60 +125,80 @@ def set_cols_subheads(sheet: Worksheet, columns: list, start_col: int):
         sheet.cell(SUBHEAD_ROW, start_col + i).value = col_name
 
 
-def apply_cell_format(cell: Cell, font, align, border, fill=None):
+def get_cell_style(cell: Cell, row_index: int, col_index: int, start_after_row: int,
+                   separators: set[int]) -> str | None:
     """
-    Applies formatting to a single cell.
+    Gets the registered style of a cell. Header cells keep their header style unless they are in a separator
+    column, and highlighted data cells keep their highlight style.
 
-    :param Cell cell: The cell to apply formatting to.
-    :param font: Font style for the cell.
-    :param align: Alignment for the cell.
-    :param border: Border style for the cell.
-    :param fill: Fill pattern for the cell.
+    :param Cell cell: The cell to style.
+    :param int row_index: Index of the row of the cell.
+    :param int col_index: Index of the column of the cell.
+    :param int start_after_row: Index of the last header row.
+    :param set[int] separators: Indices of the separator columns.
+    :return: The name of the style, or None if the cell keeps its style.
+    :rtype: str | None
     """
-    cell.font = font
-    cell.alignment = align
-    cell.border = border
-    if fill is not None:
-        cell.fill = fill
+    if row_index <= start_after_row:
+        return styles.STYLE_HEADER_SEPARATOR if col_index in separators else None
+    if col_index in separators:
+        return styles.STYLE_ENTRY_SEPARATOR
+    if cell.has_style:
+        return None
+    return styles.STYLE_ENTRY_BANDED if row_index % 2 == 0 else styles.STYLE_ENTRY
 
 
-def get_row_cell_fill(cell: Cell):
+def is_separator_col(col_index: int, const_cols_len: int, var_cols_len: int) -> bool:
     """
-    Applies fill to a single row cell.
+    Determines whether a column is a blank separator column between configuration column groups.
 
-    :param Cell cell: The cell to apply fill to.
+    :param int col_index: Index of the column, starting at 1.
+    :param int const_cols_len: Number of constant columns.
+    :param int var_cols_len: Number of variable columns.
+    :return: True if the column is a separator column, otherwise False.
+    :rtype: bool
     """
-    if cell.row % 2 == 0 and not cell.fill.patternType:
-        return styles.FILL_ROW_BLUE
+    return col_index % (var_cols_len + 1) == (const_cols_len + 1) % (var_cols_len + 1) and col_index > const_cols_len
 
 
-def set_column_widths(sheet: Worksheet, const_cols_len: int, var_cols_len: int, col_width: float):
+def get_separator_cols(max_column: int, const_cols_len: int, var_cols_len: int) -> set[int]:
     """
-    Helper method to set column widths.
+    Gets the indices of the blank separator columns of a sheet.
 
-    :param Worksheet sheet: The worksheet object.
+    :param int max_column: Index of the last column.
     :param int const_cols_len: Number of constant columns.
     :param int var_cols_len: Number of variable columns.
-    :param float col_width: Width of the columns.
+    :return: Indices of the separator columns, starting at 1.
+    :rtype: set[int]
     """
-    for i in range(1, sheet.max_column + 1):
-        if i % (var_cols_len + 1) == (const_cols_len + 1) % (var_cols_len + 1) and i > const_cols_len:
-            sheet.column_dimensions[get_column_letter(i)].width = styles.WIDTH_BUFFER
-            for column in sheet.iter_cols(i, i):
-                for cell in column:
-                    cell.fill = styles.FILL_ROW_BLANK
-                    cell.border = styles.BORDER_VERTICAL
-        else:
-            sheet.column_dimensions[get_column_letter(i)].width = col_width
+    return {i for i in range(1, max_column + 1) if is_separator_col(i, const_cols_len, var_cols_len)}
 
 
-def format_numbers(sheet: Worksheet):
+def set_column_widths(sheet: Worksheet, max_column: int, separators: set[int], col_width: float):
     """
-    Formats cells with numerical values.
+    Helper method to set column widths.
 
     :param Worksheet sheet: The worksheet object.
+    :param int max_column: Index of the last column.
+    :param set[int] separators: Indices of the separator columns.
+    :param float col_width: Width of the columns.
+    """
+    for i in range(1, max_column + 1):
+        width = styles.WIDTH_BUFFER if i in separators else col_width
+        sheet.column_dimensions[get_column_letter(i)].width = width
+
+
+def add_highlight_rule(sheet: Worksheet, col_index: int, start_row: int, formula: str, fill: PatternFill):
     """
-    for i in range(1, sheet.max_column + 1):
-        for column in sheet.iter_cols(i, i):
-            for cell in column:
-                cell.number_format = styles.NUMBER_FORMAT
+    Adds a conditional formatting rule filling the cells of a column, from the given row to the last row
+    of the sheet, for which the formula is true. The formula is written for the cell of the first row.
+
+    :param Worksheet sheet: The worksheet object.
+    :param int col_index: Index of the column, starting at 1.
+    :param int start_row: Index of the first row of the rule.
+    :param str formula: Excel formula of the rule, relative to the first cell of the range.
+    :param PatternFill fill: Fill applied to the cells for which the formula is true.
+    """
+    col_letter = get_column_letter(col_index)
+    cell_range = f'{col_letter}{start_row}:{col_letter}{SHEET_MAX_ROW}'
+    sheet.conditional_formatting.add(cell_range, FormulaRule(formula=[formula], fill=fill))
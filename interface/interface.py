@@ -7,6 +7,7 @@ from interface.interface_pb import Ui_Dialog
 from interface.interface_ui import Ui_MainWindow
 from PyQt5.QtWidgets import QMainWindow, QFileDialog, QMessageBox, QDialog
 from consts.common import PROGRAM_TITLE, DEFAULTS_FILENAME, JSON_FORMAT
+from pipeline.utils import collect_arguments
 from worker.worker_af import ArcFlashWorker
 from worker.worker_dd import DeviceDutyWorker
 from worker.worker_sc import ShortCircuitWorker
@@ -161,7 +162,7 @@ class Interface(QMainWindow, Ui_MainWindow):
 
         self._show_progress_dialog()
 
-        args_sc, args_dd, args_af = self._collect_analysis_arguments()
+        args_sc, args_dd, args_af = collect_arguments(utils.get_all_inputs(self))
 
         if self.short_circuit_checkbox.isChecked():
             self._run_short_circuit(args_sc, args_dd, args_af)
@@ -170,76 +171,6 @@ class Interface(QMainWindow, Ui_MainWindow):
         elif self.arc_flash_checkbox.isChecked():
             self._run_arc_flash(args_af)
 
-    def _collect_analysis_arguments(self) -> tuple:
-        """
-        Collects and structures the arguments required for each worker.
-
-        :return tuple: Arguments for Short Circuit, Device Duty, and Arc Flash workers.
-        """
-        url = self._get_datahub_url()
-        input_dir = Path(self.etap_dir.text())
-        output_dir = Path(self.output_dir.text())
-
-        common_args = [
-            url, input_dir, output_dir,
-            self.create_scenarios_checkbox.isChecked(),
-            self.run_scenarios_checkbox.isChecked(),
-            utils.split_string_tags(self.exclude_start_input.text()),
-            utils.split_string_tags(self.exclude_contain_input.text()),
-            self._get_exclude_except(),
-            self.create_reports_checkbox.isChecked()
-        ]
-
-        short_circuit_args = common_args + [
-            self.use_all_checkbox.isChecked(),
-        ]
-
-        device_duty_args = common_args + [
-            self.sw_checkbox.isChecked(),
-            self.use_all_checkbox.isChecked(),
-            self.series_rating_checkbox.isChecked(),
-            self.mark_assumed_checkbox.isChecked()
-        ]
-
-        arc_flash_args = common_args + [
-            self.si_units_checkbox.isChecked(),
-            self.high_energy_box.value(),
-            self.low_energy_box.value(),
-            self._get_revisions()
-        ]
-
-        return short_circuit_args, device_duty_args, arc_flash_args
-
-    def _get_datahub_url(self) -> str:
-        """
-        Constructs the DataHub URL based on user selection.
-
-        :return str: The constructed URL.
-        """
-        protocol, port_number = utils.get_datahub_info(self.etap_dir.text())
-        return f'{protocol}://localhost:{port_number}'
-
-    def _get_revisions(self) -> list | None:
-        """
-        Retrieves revisions based on user selection.
-
-        :return list | None: List of revisions or None.
-        """
-        if self.include_all_radio.isChecked():
-            return None
-        if self.include_base_radio.isChecked():
-            return []
-        return utils.split_string_tags(self.include_revisions_input.text())
-
-    def _get_exclude_except(self) -> list:
-        """
-        Retrieves tags for the "exclude except" field.
-
-        :return list: Tags entered for exclusion exception.
-        """
-        return utils.split_string_tags(
-            self.exclude_except_input.text()) if self.exclude_except_radio.isChecked() else []
-
     def _run_short_circuit(self, sc_args: list, dd_args: list, af_args: list) -> None:
         """
         Runs the Short Circuit analysis worker.
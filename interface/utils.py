@@ -4,7 +4,6 @@ import json
 import subprocess
 from pathlib import Path
 from typing import Optional, Any
-from consts.common import HTTP, HTTPS, ETAP22_PORT, DATAHUB_FILENAME
 from PyQt5.QtWidgets import QLineEdit, QDoubleSpinBox, QCheckBox, QRadioButton, QWidget, QMainWindow
 
 
@@ -127,31 +126,3 @@ def open_file(file_path: Path) -> None:
             subprocess.call([opener, str(file_path)])
     except Exception as ex:
         print(f"Failed to open file: {ex}")
-
-
-def split_string_tags(tag_string: str, delimiter: str = ';') -> list[str]:
-    """
-    Splits a string into a list of tags based on a delimiter, removing empty items and trimming whitespace.
-
-    :param str tag_string: The string containing tags separated by the delimiter.
-    :param str delimiter: The character or string used to split tags. Default is ';'.
-    :return list[str]: A list of non-empty, trimmed tag strings.
-    """
-    return [tag.strip() for tag in tag_string.split(delimiter) if tag.strip()]
-
-
-def get_datahub_info(project_path: str | Path) -> tuple[str, str]:
-    """
-    Retrieves and returns the datahub settings for a project for API connection.
-
-    :param str | Path project_path: Path to the ETAP project files.
-    :return tuple[str, str]: returns the protocol and the port number to connect to datahub.
-    """
-    filepath = Path(project_path) / DATAHUB_FILENAME
-    try:
-        with open(filepath, 'r') as file:
-            services = json.load(file)['Services']
-    except FileNotFoundError:
-        return HTTP, ETAP22_PORT
-    port_number = next((s['Port'] for s in services if s['ServiceName'] == 'EtapApi'), None)
-    return HTTPS, str(port_number)
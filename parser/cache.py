@@ -0,0 +1,146 @@
+import json
+import zlib
+import time
+import sqlite3
+import hashlib
+from pathlib import Path
+from typing import Any
+from consts.common import CACHE_MAX_BYTES
+from parser.catalog import ReportCatalog
+
+CACHE_VERSION = 1
+CREATE_TABLE_QUERY = (r"CREATE TABLE IF NOT EXISTS entries (path TEXT NOT NULL, signature TEXT NOT NULL, "
+                      r"size INTEGER NOT NULL, mtime INTEGER NOT NULL, digest TEXT, data BLOB NOT NULL, "
+                      r"nbytes INTEGER NOT NULL, last_used REAL NOT NULL, PRIMARY KEY (path, signature))")
+
+
+class ParseCache:
+    """
+    On-disk cache of the rows extracted from ETAP report files, stored in a SQLite database.
+
+    Entries are keyed by report file path and a signature of the queries used to extract them, and are only
+    returned while the file's size, modification time and, optionally, content hash are unchanged.
+    The least recently used entries are evicted once the cache grows beyond its size limit.
+    """
+
+    def __init__(self, cache_path: Path, max_bytes: int = CACHE_MAX_BYTES, verify_content: bool = False,
+                 catalog: ReportCatalog | None = None):
+        """
+        Opens or creates the cache database at the given path.
+
+        :param Path cache_path: Path to the cache database file.
+        :param int max_bytes: Maximum total size of the cached data in bytes.
+        :param bool verify_content: A flag to determine whether to also compare file content hashes.
+        :param ReportCatalog | None catalog: Optional catalog of the report directory whose stat info is reused.
+        """
+        self.cache_path = Path(cache_path)
+        self._stat = catalog.stat if catalog else ReportCatalog.stat_path
+        self.max_bytes = max_bytes
+        self.verify_content = verify_content
+        self.conn = sqlite3.connect(self.cache_path, timeout=5)
+        try:
+            self.conn.execute(CREATE_TABLE_QUERY)
+        except sqlite3.DatabaseError:
+            self.conn.close()
+            self.cache_path.unlink()
+            self.conn = sqlite3.connect(self.cache_path, timeout=5)
+            self.conn.execute(CREATE_TABLE_QUERY)
+
+    @staticmethod
+    def make_signature(*parts: str) -> str:
+        """
+        Creates a signature identifying how the data of a file is extracted, such as the queries used.
+
+        :param str parts: Strings describing the extraction.
+        :return: A hex digest of the cache version and the given parts.
+        :rtype: str
+        """
+        return hashlib.sha1('\0'.join([str(CACHE_VERSION), *parts]).encode()).hexdigest()
+
+    def _fingerprint(self, filepath: str) -> tuple[int, int, str | None]:
+        """
+        Computes the fingerprint of a report file.
+
+        :param str filepath: Path to the report file.
+        :return: The file size, modification time in nanoseconds and content hash if enabled.
+        :rtype: tuple[int, int, str | None]
+        """
+        size, mtime = self._stat(filepath)
+        digest = None
+        if self.verify_content:
+            with open(filepath, 'rb') as file:
+                digest = hashlib.file_digest(file, 'sha1').hexdigest()
+        return size, mtime, digest
+
+    def get(self, filepath: str, signature: str) -> Any | None:
+        """
+        Returns the cached data of a report file if the file has not changed since it was cached.
+
+        :param str filepath: Path to the report file.
+        :param str signature: Signature of the extraction.
+        :return: The cached data, or None if there is no valid entry.
+        :rtype: Any | None
+        """
+        row = self.conn.execute(r"SELECT size, mtime, digest, data FROM entries WHERE path = ? AND signature = ?",
+                                (str(filepath), signature)).fetchone()
+        if row is None:
+            return None
+
+        size, mtime, digest, data = row
+        if (size, mtime) != self._stat(filepath):
+            return None
+        if self.verify_content and digest != self._fingerprint(filepath)[2]:
+            return None
+
+        self.conn.execute(r"UPDATE entries SET last_used = ? WHERE path = ? AND signature = ?",
+                          (time.time(), str(filepath), signature))
+        return json.loads(zlib.decompress(data))
+
+    def put(self, filepath: str, signature: str, data: Any):
+        """
+        Stores the extracted data of a report file along with its fingerprint.
+
+        :param str filepath: Path to the report file.
+        :param str signature: Signature of the extraction.
+        :param Any data: JSON serializable data extracted from the file.
+        """
+        size, mtime, digest = self._fingerprint(filepath)
+        blob = zlib.compress(json.dumps(data).encode(), 1)
+        self.conn.execute(r"INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                          (str(filepath), signature, size, mtime, digest, blob, len(blob), time.time()))
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache fits within its size limit.
+        """
+        total = self.conn.execute(r"SELECT COALESCE(SUM(nbytes), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self.conn.execute(r"SELECT path, signature, nbytes FROM entries ORDER BY last_used ASC").fetchall()
+        for path, signature, nbytes in rows:
+            if total <= self.max_bytes:
+                break
+            self.conn.execute(r"DELETE FROM entries WHERE path = ? AND signature = ?", (path, signature))
+            total -= nbytes
+
+    def clear(self):
+        """
+        Removes all entries from the cache.
+        """
+        self.conn.execute(r"DELETE FROM entries")
+        self.conn.commit()
+        self.conn.execute(r"VACUUM")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Evicts entries beyond the size limit, commits all changes and closes the cache database.
+        """
+        self.evict()
+        self.conn.commit()
+        self.conn.close()
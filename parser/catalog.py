@@ -0,0 +1,115 @@
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+
+class ReportFile(NamedTuple):
+    """
+    A file of a report catalog, classified from its name, with the stat info read when the catalog was built.
+    """
+    path: str
+    name: str
+    stem: str
+    ext: str
+    study_tag: str
+    config: str
+    size: int
+    mtime_ns: int
+
+
+class ReportCatalog:
+    """
+    Catalog of the files in an ETAP project directory, built from a single scan of the directory.
+
+    Every file is classified by extension, study tag and configuration, and its size and modification time
+    are kept so that the parsers, the session data check and the cache do not need to list or stat the
+    directory again. The catalog describes the directory as it was when built and must be rebuilt after
+    new reports are written, such as after running scenarios.
+    """
+
+    def __init__(self, input_dir: Path):
+        """
+        Scans the given directory.
+
+        :param Path input_dir: Path to the directory containing the report files.
+        """
+        self.input_dir = Path(input_dir)
+        self.files = {}
+        with os.scandir(self.input_dir) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError as e:
+                    print(f"Error with file {entry.path}: {e}")
+                    continue
+
+                path = self.input_dir / entry.name
+                study_tag, _, config = path.stem.partition('_')
+                self.files[str(path)] = ReportFile(str(path), entry.name, path.stem, path.suffix[1:], study_tag,
+                                                   config, stat.st_size, stat.st_mtime_ns)
+
+    def get_filepaths(self, ext: str, study_tag: str) -> list[str]:
+        """
+        Returns the paths of the files with the specified extension, in directory order.
+
+        :param str ext: File extension to filter by.
+        :param str study_tag: Tag to filter only the study files.
+        :return: List of file paths with the given extension.
+        :rtype: list[str]
+        """
+        filepaths = []
+        for file in self.files.values():
+            if file.ext == ext:
+                if study_tag and not file.stem.startswith(f'{study_tag}_'):
+                    continue
+                filepaths.append(file.path)
+        return filepaths
+
+    def get_fingerprint(self, exts: tuple[str, ...]) -> tuple:
+        """
+        Computes a fingerprint of the files with the given extensions,
+        which changes whenever a report file is added, removed or rewritten.
+
+        :param tuple[str, ...] exts: File extensions of the report files.
+        :return: Sorted tuples of the file name, size and modification time of each report file.
+        :rtype: tuple
+        """
+        return tuple(sorted((file.name, file.size, file.mtime_ns) for file in self.files.values()
+                            if file.ext in exts))
+
+    def get_file(self, filepath: str | Path) -> ReportFile | None:
+        """
+        Returns the catalog entry of a file.
+
+        :param str | Path filepath: Path to the file.
+        :return: The entry of the file, or None if it is not in the catalog.
+        :rtype: ReportFile | None
+        """
+        return self.files.get(str(filepath))
+
+    def stat(self, filepath: str | Path) -> tuple[int, int]:
+        """
+        Returns the size and modification time of a file, using the stat info of the catalog if the file is in it.
+
+        :param str | Path filepath: Path to the file.
+        :return: The file size and modification time in nanoseconds.
+        :rtype: tuple[int, int]
+        """
+        report_file = self.get_file(filepath)
+        if report_file:
+            return report_file.size, report_file.mtime_ns
+        return self.stat_path(filepath)
+
+    @staticmethod
+    def stat_path(filepath: str | Path) -> tuple[int, int]:
+        """
+        Returns the size and modification time of a file read from the file system.
+
+        :param str | Path filepath: Path to the file.
+        :return: The file size and modification time in nanoseconds.
+        :rtype: tuple[int, int]
+        """
+        stat = Path(filepath).stat()
+        return stat.st_size, stat.st_mtime_ns
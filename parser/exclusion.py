@@ -0,0 +1,79 @@
+import re
+from functools import lru_cache
+
+
+class ExclusionMatcher:
+    """
+    Decides whether element IDs are excluded from the parsed data. The exclusion lists are compiled once
+    into regular expressions, and the decision for each unique ID is memoized since the same IDs repeat
+    across configurations and studies.
+
+    An ID is kept if it contains any of the exception strings. Otherwise, it is excluded if it contains
+    any of the excluded substrings or starts with any of the excluded prefixes.
+    """
+
+    def __init__(self, exclude_startswith: list[str], exclude_contains: list[str], exclude_except: list[str]):
+        """
+        Compiles the exclusion lists.
+
+        :param list[str] exclude_startswith: List of prefixes to check for exclusion.
+        :param list[str] exclude_contains: List of substrings to check for exclusion.
+        :param list[str] exclude_except: List of exceptions to override exclusion.
+        """
+        self.startswith_regex = self._compile(exclude_startswith)
+        self.contains_regex = self._compile(exclude_contains)
+        self.except_regex = self._compile(exclude_except)
+        self.decisions = {}
+
+    @staticmethod
+    def _compile(words: list[str]) -> re.Pattern | None:
+        """
+        Compiles a list of literal strings into a single alternation pattern.
+
+        :param list[str] words: List of literal strings.
+        :return: The compiled pattern, or None if the list is empty.
+        :rtype: re.Pattern | None
+        """
+        if not words:
+            return None
+        return re.compile('|'.join(re.escape(word) for word in words))
+
+    def is_exclusion(self, _id: str) -> bool:
+        """
+        Determines whether a given ID should be excluded based on the matching rules.
+
+        :param str _id: The string ID to evaluate.
+        :return: True if the ID matches exclusion criteria, False otherwise.
+        :rtype: bool
+        """
+        if _id in self.decisions:
+            return self.decisions[_id]
+
+        if self.except_regex and self.except_regex.search(_id):
+            decision = False
+        elif self.contains_regex and self.contains_regex.search(_id):
+            decision = True
+        else:
+            decision = bool(self.startswith_regex and self.startswith_regex.match(_id))
+        self.decisions[_id] = decision
+        return decision
+
+
+@lru_cache(maxsize=8)
+def _get_matcher(exclude_startswith: tuple, exclude_contains: tuple, exclude_except: tuple) -> ExclusionMatcher:
+    return ExclusionMatcher(list(exclude_startswith), list(exclude_contains), list(exclude_except))
+
+
+def get_matcher(exclude_startswith: list[str], exclude_contains: list[str],
+                exclude_except: list[str]) -> ExclusionMatcher:
+    """
+    Returns the exclusion matcher for the given lists, reusing the one built earlier for the same lists
+    so that its memoized decisions are shared by all parsers of a run.
+
+    :param list[str] exclude_startswith: List of prefixes to check for exclusion.
+    :param list[str] exclude_contains: List of substrings to check for exclusion.
+    :param list[str] exclude_except: List of exceptions to override exclusion.
+    :return: The exclusion matcher.
+    :rtype: ExclusionMatcher
+    """
+    return _get_matcher(tuple(exclude_startswith), tuple(exclude_contains), tuple(exclude_except))
@@ -0,0 +1,155 @@
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from consts.common import MIRROR_CHUNK_SIZE, MIRROR_TEMP_MAX_AGE
+from consts.filenames import MIRROR_MANIFEST_FILENAME, MIRROR_OBJECTS_DIRNAME, MIRROR_TEMP_PREFIX
+from parser.catalog import ReportCatalog
+
+CREATE_TABLE_QUERY = (r"CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+                      r"mtime INTEGER NOT NULL, digest TEXT NOT NULL)")
+DIGEST_PATTERN = re.compile(r'[0-9a-f]{40}')
+
+
+class ReportMirror:
+    """
+    Local mirror of ETAP report files stored under the hash of their content.
+
+    Each report file is copied once to the mirror directory and read from there afterwards. A manifest records
+    the size and modification time the file had when copied, and the file is only copied again once either of
+    them changes. Report files with identical content, such as the reports of two scenarios giving the same
+    results, share a single copy. Copies no longer referenced by the manifest are removed on closing.
+    """
+
+    def __init__(self, mirror_dir: Path, catalog: ReportCatalog | None = None):
+        """
+        Opens or creates the mirror in the given directory.
+
+        :param Path mirror_dir: Path to the local mirror directory.
+        :param ReportCatalog | None catalog: Optional catalog of the report directory whose stat info is reused.
+        """
+        self.mirror_dir = Path(mirror_dir)
+        self.objects_dir = Path(self.mirror_dir, MIRROR_OBJECTS_DIRNAME)
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._stat = catalog.stat if catalog else ReportCatalog.stat_path
+        self.lock = threading.Lock()
+        manifest_path = Path(self.mirror_dir, MIRROR_MANIFEST_FILENAME)
+        self.conn = sqlite3.connect(manifest_path, timeout=5, check_same_thread=False)
+        try:
+            self.conn.execute(CREATE_TABLE_QUERY)
+        except sqlite3.DatabaseError:
+            self.conn.close()
+            manifest_path.unlink()
+            self.conn = sqlite3.connect(manifest_path, timeout=5, check_same_thread=False)
+            self.conn.execute(CREATE_TABLE_QUERY)
+
+    def _object_path(self, digest: str) -> Path:
+        """
+        Returns the path of the copy of the content with the given hash.
+
+        :param str digest: Hash of the content.
+        :return: The path of the copy in the mirror.
+        :rtype: Path
+        """
+        return Path(self.objects_dir, digest[:2], digest)
+
+    def _copy(self, filepath: str) -> str:
+        """
+        Copies a report file into the mirror with one sequential read, hashing its content on the way.
+        The copy is discarded if the mirror already holds the same content.
+
+        :param str filepath: Path to the report file.
+        :return: The hash of the content of the file.
+        :rtype: str
+        """
+        sha1 = hashlib.sha1()
+        fd, temp_path = tempfile.mkstemp(prefix=MIRROR_TEMP_PREFIX, dir=self.objects_dir)
+        try:
+            with open(filepath, 'rb') as source, os.fdopen(fd, 'wb') as target:
+                while chunk := source.read(MIRROR_CHUNK_SIZE):
+                    sha1.update(chunk)
+                    target.write(chunk)
+            digest = sha1.hexdigest()
+            object_path = self._object_path(digest)
+            if object_path.exists():
+                os.remove(temp_path)
+            else:
+                object_path.parent.mkdir(exist_ok=True)
+                os.replace(temp_path, object_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return digest
+
+    def get_path(self, filepath: str | Path) -> str:
+        """
+        Returns the path of the local copy of a report file, copying the file first if it is not mirrored
+        or has changed since it was copied.
+
+        :param str | Path filepath: Path to the report file.
+        :return: The path of the local copy.
+        :rtype: str
+        """
+        size, mtime = self._stat(str(filepath))
+        filepath = os.path.abspath(filepath)
+        with self.lock:
+            row = self.conn.execute(r"SELECT digest FROM files WHERE path = ? AND size = ? AND mtime = ?",
+                                    (filepath, size, mtime)).fetchone()
+        if row and self._object_path(row[0]).exists():
+            return str(self._object_path(row[0]))
+
+        digest = self._copy(filepath)
+        with self.lock:
+            self.conn.execute(r"INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", (filepath, size, mtime, digest))
+            self.conn.commit()
+        return str(self._object_path(digest))
+
+    def prune(self):
+        """
+        Removes the copies that are no longer referenced by the manifest. Temporary files are only removed once
+        they are older than MIRROR_TEMP_MAX_AGE, as a younger one may be a copy still being written by another run.
+        Any other file in the mirror is left alone.
+        """
+        with self.lock:
+            digests = {digest for digest, in self.conn.execute(r"SELECT digest FROM files")}
+        stale_before = time.time() - MIRROR_TEMP_MAX_AGE
+        for path in self.objects_dir.glob(f'{MIRROR_TEMP_PREFIX}*'):
+            try:
+                if path.is_file() and path.stat().st_mtime < stale_before:
+                    path.unlink()
+            except OSError as e:
+                print(f"Could not remove temporary file {path}: {e}")
+        for path in self.objects_dir.glob('*/*'):
+            if (DIGEST_PATTERN.fullmatch(path.name) and path.parent.name == path.name[:2]
+                    and path.name not in digests and path.is_file()):
+                try:
+                    path.unlink()
+                except OSError as e:
+                    print(f"Could not remove mirrored file {path}: {e}")
+
+    def clear(self):
+        """
+        Removes all copies and entries from the mirror.
+        """
+        with self.lock:
+            self.conn.execute(r"DELETE FROM files")
+            self.conn.commit()
+        self.prune()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Removes unreferenced copies and closes the manifest.
+        """
+        self.prune()
+        self.conn.close()
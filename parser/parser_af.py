@@ -1,12 +1,16 @@
-import sqlite3
 from parser import utils
+from parser.exclusion import get_matcher
+from parser.cache import ParseCache
+from parser.catalog import ReportCatalog
+from parser.mirror import ReportMirror
 from pathlib import Path
 from sqlite3 import Error, OperationalError
+from parser.reader import ReportReader
 from consts.tags import AF_TAG
 from consts.common import ROUND_DIGITS
 from consts.columns import AF_COL_INDICES
 from consts.filenames import AF_ANSI_EXT
-from consts.queries import AF_INFO_QUERY, AF_BUS_QUERY, AF_PD_QUERY
+from consts.queries import AF_INFO_QUERY, AF_BUS_QUERY, AF_PD_QUERY, AF_BUS_ID_COLUMN, AF_PD_ID_COLUMN
 
 
 class ArcFlashParser:
@@ -15,68 +19,105 @@ class ArcFlashParser:
     from ETAP arc flash study results stored in SQLite databases.
     """
 
-    def __init__(self, etap_dir: Path):
+    def __init__(self, etap_dir: Path, max_workers: int | None = None, cache: ParseCache | None = None,
+                 catalog: ReportCatalog | None = None, in_memory_max_bytes: int = 0,
+                 mirror: ReportMirror | None = None):
         """
         Initializes the ArcFlashParser instance with the directory containing arc flash study files.
 
         :param Path etap_dir: Path to the directory containing the arc flash study files (AAFS files).
+        :param int | None max_workers: Maximum number of threads used to read report files.
+        :param ParseCache | None cache: Optional cache of previously extracted report data.
+        :param ReportCatalog | None catalog: Optional catalog of the project directory, scanned if not given.
+        :param int in_memory_max_bytes: Maximum size in bytes of a report file loaded in memory; 0 disables loading.
+        :param ReportMirror | None mirror: Optional local mirror from which the report files are read.
         """
+        self.ansi_af_data = {}
         self.parsed_ansi_data = {}
-        self.filepaths = utils.get_filepaths(etap_dir, AF_ANSI_EXT, AF_TAG)
-
-    def extract_ansi_af_data(self):
+        self.cache = cache
+        self.max_workers = max_workers
+        self.in_memory_max_bytes = in_memory_max_bytes
+        self.mirror = mirror
+        self.read_timings = {}
+        self.queries = [(AF_BUS_QUERY, []), (AF_PD_QUERY, [])]
+        self.filepaths = (catalog or ReportCatalog(etap_dir)).get_filepaths(AF_ANSI_EXT, AF_TAG)
+
+    def extract_ansi_af_data(self, exclude_startswith: list[str] = (), exclude_contains: list[str] = (),
+                             exclude_except: list[str] = ()):
         """
         Extracts ANSI arc flash data from each SQLite database in the specified directory.
 
-        It attempts to connect to each database, execute the relevant queries, and fetch data
-        for further processing. Any errors during database access are logged.
+        Files are read in parallel when there are enough of them, and the results are merged
+        in file order so the output stays deterministic. Any errors during database access are logged.
+        Unchanged files are taken from the cache when one is set. Excluded IDs are filtered out by the queries.
+
+        :param list[str] exclude_startswith: List of string prefixes to exclude from the extracted data.
+        :param list[str] exclude_contains: List of strings to exclude if contained in entry IDs.
+        :param list[str] exclude_except: List of strings to not exclude if contained in entry IDs.
+        """
+        self.queries = []
+        for query, column in [(AF_BUS_QUERY, AF_BUS_ID_COLUMN), (AF_PD_QUERY, AF_PD_ID_COLUMN)]:
+            condition, params = utils.get_exclusion_filter(column, exclude_startswith, exclude_contains,
+                                                           exclude_except)
+            self.queries.append((utils.filter_query(query, [condition]), params))
+        signature = ParseCache.make_signature(AF_INFO_QUERY, *[part for query, params in self.queries
+                                                               for part in (query, *params)])
+        for af_data in utils.map_files(self._read_file, self.filepaths, self.max_workers, self.cache, signature):
+            if af_data:
+                self._update_ansi_af_data(af_data)
+
+    def _read_file(self, file_path: str) -> list | None:
+        """
+        Opens a single arc flash report file and fetches its processed data.
+
+        :param str file_path: Path to the SQLite report file.
+        :return: A list of arc flash data entries, or None if the file could not be read.
+        :rtype: list | None
         """
-        for file_path in self.filepaths:
-            try:
-                conn = sqlite3.connect(file_path)
-                cur = conn.cursor()
-                self._fetch_and_process_data(cur)
-                conn.close()
-            except (Error, OperationalError) as e:
-                print(f"Error with file {file_path}: {e}")
-
-    def _fetch_and_process_data(self, cur: sqlite3.Cursor):
+        try:
+            with ReportReader(file_path, self.read_timings, in_memory_max_bytes=self.in_memory_max_bytes,
+                              mirror=self.mirror) as reader:
+                return self._fetch_and_process_data(reader)
+        except (Error, OperationalError) as e:
+            print(f"Error with file {file_path}: {e}")
+
+    def _fetch_and_process_data(self, reader: ReportReader) -> list:
         """
-        Fetches study case information and arc flash data from the given database cursor,
+        Fetches study case information and arc flash data from the given report file,
         and processes the fetched data to include additional metadata.
 
-        :param sqlite3.Cursor cur: Cursor object for executing SQL queries on the database.
+        :param ReportReader reader: Open reader of the report file.
+        :return: A list of arc flash data entries including the output report and configuration.
+        :rtype: list
         """
-        cur.execute(AF_INFO_QUERY)
-        af_info = cur.fetchone()
-
-        if af_info:
-            af_info = list(af_info)
-            af_data = self._fetch_all_data(cur)
-            for i in range(len(af_data)):
-                af_data[i].insert(AF_COL_INDICES['rep'] + 1, Path(af_info[0]).stem)
-                af_data[i].insert(AF_COL_INDICES['con'] + 1, af_info[1])
-            self._update_ansi_af_data(af_data)
-
-    @staticmethod
-    def _fetch_all_data(cur: sqlite3.Cursor) -> list:
+        af_info = reader.fetchone(AF_INFO_QUERY)
+
+        if not af_info:
+            return []
+
+        af_info = list(af_info)
+        af_data = self._fetch_all_data(reader)
+        for i in range(len(af_data)):
+            af_data[i].insert(AF_COL_INDICES['rep'] + 1, Path(af_info[0]).stem)
+            af_data[i].insert(AF_COL_INDICES['con'] + 1, af_info[1])
+        return af_data
+
+    def _fetch_all_data(self, reader: ReportReader) -> list:
         """
-        Fetches all arc flash data from the database for both buses and protective devices.
+        Fetches all arc flash data from the report file for both buses and protective devices.
 
-        :param sqlite3.Cursor cur: Cursor object for executing SQL queries on the database.
+        :param ReportReader reader: Open reader of the report file.
         :return: A list of arc flash data entries.
         :rtype: list
         """
         af_data = []
-        cur.execute(AF_BUS_QUERY)
-        af_data.extend([list(elem) for elem in cur.fetchall()])
-        cur.execute(AF_PD_QUERY)
-        af_data.extend([list(elem) for elem in cur.fetchall()])
+        for query, params in self.queries:
+            af_data.extend(list(elem) for elem in reader.iter_rows(query, params))
         return af_data
 
     def _update_ansi_af_data(self, af_data: list):
         """
-        Updates the internal ANSI arc flash data dictionary by retaining the highest incident
+        Updates the extracted ANSI arc flash data dictionary by retaining the highest incident
         energy value for each entry.
 
         :param list af_data: List of arc flash data entries to process and update.
@@ -85,8 +126,8 @@ class ArcFlashParser:
             _id = entry[0]
             _data = entry[1:]
             _energy = entry[AF_COL_INDICES['ie'] + 1]
-            if _id not in self.parsed_ansi_data or _energy > self.parsed_ansi_data[_id][AF_COL_INDICES['ie']]:
-                self.parsed_ansi_data[_id] = _data
+            if _id not in self.ansi_af_data or _energy > self.ansi_af_data[_id][AF_COL_INDICES['ie']]:
+                self.ansi_af_data[_id] = _data
 
     def parse_ansi_af_data(self, use_si_units: bool, exclude_startswith: list[str],
                            exclude_contains: list[str], exclude_except: list[str]):
@@ -95,6 +136,7 @@ class ArcFlashParser:
 
         Entries can be excluded based on specific prefixes or contained strings. Numerical values
         are rounded to a predefined precision, and several fields are converted or recalculated.
+        The extracted data is left unchanged so that it can be parsed again with other options.
 
         :param bool use_si_units: A flag to determine whether to convert some columns to SI units.
         :param list[str] exclude_startswith: List of string prefixes to exclude from the parsed data.
@@ -102,6 +144,7 @@ class ArcFlashParser:
         :param list[str] exclude_except: List of strings to not exclude if contained in entry IDs.
         """
         conversion_func = utils.convert_to_m if use_si_units else utils.convert_to_ft
+        self.parsed_ansi_data = {key: list(data) for key, data in self.ansi_af_data.items()}
         for key, data in self.parsed_ansi_data.items():
             data[AF_COL_INDICES['lab']] = conversion_func(data[AF_COL_INDICES['lab']])
             data[AF_COL_INDICES['rab']] = conversion_func(data[AF_COL_INDICES['rab']])
@@ -115,8 +158,10 @@ class ArcFlashParser:
                     data[i] = round(data[i], ROUND_DIGITS)
             data[0] = round(data[0], ROUND_DIGITS + 1)
 
+        matcher = get_matcher(exclude_startswith, exclude_contains, exclude_except)
+
         def filter_func(pair: tuple):
-            return not utils.is_exclusion(next(iter(pair)), exclude_startswith, exclude_contains, exclude_except)
+            return not matcher.is_exclusion(next(iter(pair)))
 
         self.parsed_ansi_data = dict(filter(filter_func, self.parsed_ansi_data.items()))
         self.parsed_ansi_data = dict(sorted(self.parsed_ansi_data.items(),
@@ -1,11 +1,17 @@
 import etap.api
 from pathlib import Path
 import xml.etree.ElementTree as ET
-from consts.common import TYPE_MAP
+from consts.common import TYPE_MAP, DD_MOM_TYPES, DD_SWITCH_TYPES, DD_IEC_INT_TYPES
 from consts.filenames import DD_ANSI_EXT, DD_ANSI_SP_EXT, DD_IEC_EXT, DD_IEC_SP_EXT
 from consts.multipliers import MV_SWITCHGEAR_MULTIPLIER, LV_SWITCHGEAR_MULTIPLIER
 from consts.tags import MOM_TAG, INT_TAG, DD_TAG, COMMENT_VAR, BUS_TAG
 from parser import utils
+from parser.exclusion import get_matcher
+from parser.cache import ParseCache
+from parser.catalog import ReportCatalog
+from parser.mirror import ReportMirror
+from parser.reader import ReportReader
+from parser.pivot import PivotEngine
 from consts.queries import *
 
 
@@ -16,14 +22,26 @@ class DeviceDutyParser:
     of protection devices in both three-phase and single-phase systems.
     """
 
-    def __init__(self, etap_dir: Path):
+    def __init__(self, etap_dir: Path, max_workers: int | None = None, cache: ParseCache | None = None,
+                 catalog: ReportCatalog | None = None, in_memory_max_bytes: int = 0,
+                 mirror: ReportMirror | None = None):
         """
         Initializes the DeviceDutyParser with the given ETAP directory.
         Sets up SQL queries, modes, and file paths for ANSI and IEC data.
 
         :param Path etap_dir: The directory containing ETAP project files.
-        """
-        self.tree = None
+        :param int | None max_workers: Maximum number of threads used to read report files.
+        :param ParseCache | None cache: Optional cache of previously extracted report data.
+        :param ReportCatalog | None catalog: Optional catalog of the project directory, scanned if not given.
+        :param int in_memory_max_bytes: Maximum size in bytes of a report file loaded in memory; 0 disables loading.
+        :param ReportMirror | None mirror: Optional local mirror from which the report files are read.
+        """
+        self.layout_comments = None
+        self.cache = cache
+        self.max_workers = max_workers
+        self.in_memory_max_bytes = in_memory_max_bytes
+        self.mirror = mirror
+        self.read_timings = {}
         self._etap = None
         self.comments = {}
         self.ansi_data = {}
@@ -32,10 +50,13 @@ class DeviceDutyParser:
         self.mode_int = INT_TAG
         self.parsed_iec_data = {self.mode_int: {}}
         self.parsed_ansi_data = {self.mode_mom: {}, self.mode_int: {}}
-        self.ansi_filepaths = utils.get_filepaths(etap_dir, DD_ANSI_EXT, DD_TAG)
-        self.ansi_sp_filepaths = utils.get_filepaths(etap_dir, DD_ANSI_SP_EXT, DD_TAG)
-        self.iec_filepaths = utils.get_filepaths(etap_dir, DD_IEC_EXT, DD_TAG)
-        self.iec_sp_filepaths = utils.get_filepaths(etap_dir, DD_IEC_SP_EXT, DD_TAG)
+        self.pivoted_ansi_data = None
+        self.pivoted_iec_data = None
+        self.catalog = catalog or ReportCatalog(etap_dir)
+        self.ansi_filepaths = self.catalog.get_filepaths(DD_ANSI_EXT, DD_TAG)
+        self.ansi_sp_filepaths = self.catalog.get_filepaths(DD_ANSI_SP_EXT, DD_TAG)
+        self.iec_filepaths = self.catalog.get_filepaths(DD_IEC_EXT, DD_TAG)
+        self.iec_sp_filepaths = self.catalog.get_filepaths(DD_IEC_SP_EXT, DD_TAG)
         self.filter_filepaths()
 
     def connect_to_etap(self, url: str):
@@ -47,64 +68,233 @@ class DeviceDutyParser:
         self._etap = etap.api.connect(url)
         version = self._etap.application.version()['Version']
         if version.startswith('22'):
-            self.tree = ET.fromstring(self._etap.projectdata.get_xml())
+            self.layout_comments = utils.index_layout_comments(self._etap.projectdata.get_xml())
+        else:
+            self.prefetch_comments()
 
-    def extract_ansi_data(self):
+    def prefetch_comments(self):
+        """
+        Loads the comment text of all elements of every type found in the parsed data,
+        using one bulk query per element type instead of one query per element.
+        Elements missing from the bulk data are still looked up individually.
+        """
+        element_types = set()
+        for entries in [*self.parsed_ansi_data.values(), *self.parsed_iec_data.values()]:
+            for device_data in entries.values():
+                element_type = device_data.get('Type') or device_data.get('Device')
+                element_types.add(TYPE_MAP.get(element_type.strip(), BUS_TAG))
+
+        for elem_type in sorted(element_types):
+            try:
+                element_data = self._etap.projectdata.get_all_element_data(elem_type)
+                self.comments.update(utils.parse_element_comments(element_data))
+            except (RuntimeError, ValueError, ET.ParseError) as e:
+                print(f"Could not prefetch comments of {elem_type} elements: {e}")
+
+    def disconnect_from_etap(self):
+        """
+        Closes the DataHub session of the ETAP connection, if connected.
+        """
+        if self._etap is not None:
+            self._etap.close()
+            self._etap = None
+
+    def extract_ansi_data(self, exclude_startswith: list[str] = (), exclude_contains: list[str] = (),
+                          exclude_except: list[str] = ()):
         """
         Extracts ANSI data from SQLite databases and populates the `ansi_data` attribute.
         It processes both momentary and interrupting duties for three-phase and single-phase systems.
+        Excluded IDs and momentary devices of other types than the ones reported are filtered out by the queries.
+
+        :param list[str] exclude_startswith: List of strings that, if an ID starts with, should exclude the entry.
+        :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
+        :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
         """
-        for filepath in self.ansi_filepaths:
-            cur = utils.connect_to_sql_file(filepath)
-            mom_data = utils.fetch_sql_data(cur, ANSI_MOM_QUERY)
-            int_data = utils.fetch_sql_data(cur, ANSI_INT_QUERY)
-            config = Path(filepath).stem
-            self.ansi_data.update({
-                config: {
-                    self.mode_mom: mom_data,
-                    self.mode_int: int_data
-                }
-            })
-        for filepath in self.ansi_sp_filepaths:
-            cur = utils.connect_to_sql_file(filepath)
-            mom_data = utils.fetch_sql_data(cur, ANSI_MOM_SP_QUERY)
-            int_data = utils.fetch_sql_data(cur, ANSI_INT_SP_QUERY)
-            config = Path(filepath).stem
-            if config not in self.ansi_data:
-                self.ansi_data[config] = {}
-                self.ansi_data[config][self.mode_mom] = []
-                self.ansi_data[config][self.mode_int] = []
-            self.ansi_data[config][self.mode_mom] += mom_data
-            self.ansi_data[config][self.mode_int] += int_data
-
-    def extract_iec_data(self):
+        exclusion = utils.get_exclusion_filter(ANSI_ID_COLUMN, exclude_startswith, exclude_contains, exclude_except)
+        # Switches are kept here and dropped when parsing, so the extracted data does not depend on `add_switches`
+        mom_types = utils.get_type_filter(ANSI_TYPE_COLUMN, DD_MOM_TYPES + DD_SWITCH_TYPES)
+        queries = {self.mode_mom: self._filter_query(ANSI_MOM_QUERY, exclusion, mom_types),
+                   self.mode_int: self._filter_query(ANSI_INT_QUERY, exclusion)}
+        sp_queries = {self.mode_mom: self._filter_query(ANSI_MOM_SP_QUERY, exclusion, mom_types),
+                      self.mode_int: self._filter_query(ANSI_INT_SP_QUERY, exclusion)}
+        for config, data in self._read_files(self.ansi_filepaths, queries):
+            self.ansi_data.update({config: data})
+        for config, data in self._read_files(self.ansi_sp_filepaths, sp_queries):
+            self._merge_sp_data(self.ansi_data, config, data)
+
+    def extract_iec_data(self, exclude_startswith: list[str] = (), exclude_contains: list[str] = (),
+                         exclude_except: list[str] = ()):
         """
         Extracts IEC data from SQLite databases and populates the `iec_data` attribute.
         It processes interrupting duties for both three-phase and single-phase systems.
+        Excluded IDs and devices other than circuit breakers and fuses are filtered out by the queries.
+
+        :param list[str] exclude_startswith: List of strings that, if an ID starts with, should exclude the entry.
+        :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
+        :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
+        """
+        exclusion = utils.get_exclusion_filter(IEC_ID_COLUMN, exclude_startswith, exclude_contains, exclude_except)
+        int_types = utils.get_type_filter(IEC_TYPE_COLUMN, DD_IEC_INT_TYPES)
+        queries = {self.mode_int: self._filter_query(IEC_INT_QUERY, exclusion, int_types)}
+        sp_queries = {self.mode_int: self._filter_query(IEC_INT_SP_QUERY, exclusion, int_types)}
+        for config, data in self._read_files(self.iec_filepaths, queries):
+            self.iec_data.update({config: data})
+        for config, data in self._read_files(self.iec_sp_filepaths, sp_queries):
+            self._merge_sp_data(self.iec_data, config, data)
+
+    def pivot_ansi_data(self, exclude_startswith: list[str] = (), exclude_contains: list[str] = (),
+                        exclude_except: list[str] = (), add_switches: bool = True):
+        """
+        Extracts ANSI data from all SQLite databases at once, pivoted by configuration inside SQLite,
+        and populates the `pivoted_ansi_data` attribute. This replaces `extract_ansi_data` when the data
+        is parsed with `parse_pivoted_ansi_data`. Single-phase reports are read right after the three-phase
+        report of their configuration, in the same order as when the data is extracted file by file.
+        Since the constant columns of an element come from its first momentary row of a reported type,
+        switches are filtered out by the pivot rather than when parsing. Excluded IDs and momentary devices of
+        other types than the ones reported are filtered out by the pivot as well.
+
+        :param list[str] exclude_startswith: List of strings that, if an ID starts with, should exclude the entry.
+        :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
+        :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
+        :param bool add_switches: Flag to indicate whether to add switches to the pivoted data.
+        """
+        files = self._order_pivot_files(self.ansi_filepaths, self.ansi_sp_filepaths)
+        filepaths = [filepath for filepath, _ in files]
+        configs = [self._get_ansi_config_id(Path(filepath).stem) for filepath in filepaths]
+        exclusion = utils.get_exclusion_filter(ANSI_ID_COLUMN, exclude_startswith, exclude_contains, exclude_except)
+        mom_types = utils.get_type_filter(ANSI_TYPE_COLUMN,
+                                          DD_MOM_TYPES + DD_SWITCH_TYPES if add_switches else DD_MOM_TYPES)
+        mom_where, mom_params = self._pivot_filter(ANSI_ID_COLUMN, exclusion, mom_types)
+        int_where, int_params = self._pivot_filter(ANSI_ID_COLUMN, exclusion)
+        with PivotEngine(filepaths, configs, self.in_memory_max_bytes, self.mirror) as engine:
+            self.pivoted_ansi_data = {
+                'configs': engine.configs,
+                self.mode_mom: engine.pivot([ANSI_MOM_SP_TABLE if is_sp else ANSI_MOM_TABLE for _, is_sp in files],
+                                            ANSI_ID_COLUMN, ANSI_MOM_CONST_COLUMNS, ANSI_MOM_COLUMNS, mom_where,
+                                            mom_params, ANSI_ID_COLUMN, missing_ok=True),
+                self.mode_int: engine.pivot([ANSI_INT_SP_TABLE if is_sp else ANSI_INT_TABLE for _, is_sp in files],
+                                            ANSI_ID_COLUMN, ANSI_INT_CONST_COLUMNS, ANSI_INT_COLUMNS, int_where,
+                                            int_params, ANSI_ID_COLUMN, missing_ok=True)
+            }
+
+    def pivot_iec_data(self, exclude_startswith: list[str] = (), exclude_contains: list[str] = (),
+                       exclude_except: list[str] = ()):
+        """
+        Extracts IEC data from all SQLite databases at once, pivoted by configuration inside SQLite,
+        and populates the `pivoted_iec_data` attribute. This replaces `extract_iec_data` when the data
+        is parsed with `parse_pivoted_iec_data`. Excluded IDs and devices other than circuit breakers and fuses
+        are filtered out by the pivot.
+
+        :param list[str] exclude_startswith: List of strings that, if an ID starts with, should exclude the entry.
+        :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
+        :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
+        """
+        files = self._order_pivot_files(self.iec_filepaths, self.iec_sp_filepaths)
+        filepaths = [filepath for filepath, _ in files]
+        configs = [self._get_iec_config_id(Path(filepath).stem) for filepath in filepaths]
+        exclusion = utils.get_exclusion_filter(IEC_ID_COLUMN, exclude_startswith, exclude_contains, exclude_except)
+        int_types = utils.get_type_filter(IEC_TYPE_COLUMN, DD_IEC_INT_TYPES)
+        where, params = self._pivot_filter(IEC_ID_COLUMN, exclusion, int_types)
+        with PivotEngine(filepaths, configs, self.in_memory_max_bytes, self.mirror) as engine:
+            self.pivoted_iec_data = {
+                'configs': engine.configs,
+                self.mode_int: engine.pivot([IEC_INT_SP_TABLE if is_sp else IEC_INT_TABLE for _, is_sp in files],
+                                            IEC_ID_COLUMN, IEC_INT_CONST_COLUMNS, IEC_INT_COLUMNS, where, params,
+                                            IEC_ID_COLUMN, missing_ok=True)
+            }
+
+    @staticmethod
+    def _order_pivot_files(filepaths: list[str], sp_filepaths: list[str]) -> list[tuple[str, bool]]:
+        """
+        Orders three-phase and single-phase report files like the configurations of the extracted data:
+        each three-phase report is followed by the single-phase report of the same configuration, and
+        single-phase reports without a three-phase report come last.
+
+        :param list[str] filepaths: List of three-phase report file paths.
+        :param list[str] sp_filepaths: List of single-phase report file paths.
+        :return: Pairs of report file path and single-phase flag.
+        :rtype: list[tuple[str, bool]]
+        """
+        sp_files = {Path(filepath).stem: filepath for filepath in sp_filepaths}
+        files = []
+        for filepath in filepaths:
+            files.append((filepath, False))
+            sp_filepath = sp_files.pop(Path(filepath).stem, None)
+            if sp_filepath:
+                files.append((sp_filepath, True))
+        files += [(filepath, True) for filepath in sp_files.values()]
+        return files
+
+    @staticmethod
+    def _pivot_filter(id_column: str, *filters: tuple[str, list[str]]) -> tuple[str, list[str]]:
+        """
+        Combines the filters of the device duty queries into one pivot filter, also skipping rows without an ID.
+
+        :param str id_column: Name of the element ID column.
+        :param tuple[str, list[str]] filters: Pairs of SQL condition and parameters.
+        :return: The combined condition and the parameters of all filters.
+        :rtype: tuple[str, list[str]]
+        """
+        conditions = [f"TRIM({id_column}) <> ''"] + [f'({condition})' for condition, _ in filters if condition]
+        params = [param for condition, params in filters if condition for param in params]
+        return ' AND '.join(conditions), params
+
+    @staticmethod
+    def _filter_query(query: str, *filters: tuple[str, list[str]]) -> tuple[str, list[str]]:
+        """
+        Adds parameterized filters to a query.
+
+        :param str query: SQL query to filter.
+        :param tuple[str, list[str]] filters: Pairs of SQL condition and parameters.
+        :return: The filtered query and the parameters of all filters.
+        :rtype: tuple[str, list[str]]
+        """
+        conditions = [condition for condition, _ in filters]
+        params = [param for condition, params in filters if condition for param in params]
+        return utils.filter_query(query, conditions), params
+
+    def _read_files(self, filepaths: list[str], queries: dict) -> list[tuple[str, dict]]:
+        """
+        Runs the given queries against each report file, in parallel when there are enough files.
+        Results are returned in file order so that merging stays deterministic. Unchanged files are
+        taken from the cache when one is set.
+
+        :param list[str] filepaths: List of report file paths to read.
+        :param dict queries: Dictionary of SQL queries and their parameters keyed by mode.
+        :return: A list of (configuration, data by mode) pairs.
+        :rtype: list[tuple[str, dict]]
         """
-        for filepath in self.iec_filepaths:
-            cur = utils.connect_to_sql_file(filepath)
-            int_data = utils.fetch_sql_data(cur, IEC_INT_QUERY)
-            config = Path(filepath).stem
-            self.iec_data.update({
-                config: {
-                    self.mode_int: int_data
-                }
-            })
-        for filepath in self.iec_sp_filepaths:
-            cur = utils.connect_to_sql_file(filepath)
-            int_data = utils.fetch_sql_data(cur, IEC_INT_SP_QUERY)
-            config = Path(filepath).stem
-            if config not in self.iec_data:
-                self.iec_data[config] = {}
-                self.iec_data[config][self.mode_int] = []
-            self.iec_data[config][self.mode_int] += int_data
+        def read_file(filepath: str) -> tuple[str, dict]:
+            with ReportReader(filepath, self.read_timings, in_memory_max_bytes=self.in_memory_max_bytes,
+                              mirror=self.mirror) as reader:
+                data = {mode: reader.fetch(query, params, missing_ok=True) for mode, (query, params) in queries.items()}
+            return Path(filepath).stem, data
+
+        signature = ParseCache.make_signature(*[part for mode, (query, params) in queries.items()
+                                                for part in (mode, query, *params)])
+        return utils.map_files(read_file, filepaths, self.max_workers, self.cache, signature)
+
+    @staticmethod
+    def _merge_sp_data(target: dict, config: str, data: dict):
+        """
+        Appends single-phase data to the three-phase data of the same configuration.
+
+        :param dict target: Extracted data keyed by configuration to merge into.
+        :param str config: Configuration name of the single-phase report.
+        :param dict data: Single-phase data keyed by mode.
+        """
+        if config not in target:
+            target[config] = {mode: [] for mode in data}
+        for mode, entries in data.items():
+            target[config][mode] += entries
 
     def parse_ansi_data(self, exclude_startswith: list[str], exclude_contains: list[str],
                         exclude_except: list[str], add_switches: bool):
         """
         Parses the extracted ANSI data based on specified criteria, such as excluding specific IDs or
         calculating asymmetrical and symmetrical current values.
+        Once all configurations are parsed, the momentary entries are sorted by type and the interrupting
+        entries by bus.
 
         :param list[str] exclude_startswith: List of strings that, if an ID starts with, should exclude the entry.
         :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
@@ -112,8 +302,7 @@ class DeviceDutyParser:
         :param bool add_switches: Flag to indicate whether to add switches to the parsed data.
         """
         for config, modes in self.ansi_data.items():
-            config_tags = config.split('_', 1)
-            config_id = config_tags[1]
+            config_id = self._get_ansi_config_id(config)
             for mode, entries in modes.items():
                 if mode == self.mode_mom:
                     self.parse_ansi_mom_entries(entries, config_id, exclude_startswith,
@@ -121,24 +310,150 @@ class DeviceDutyParser:
                 if mode == self.mode_int:
                     self.parse_ansi_int_entries(entries, config_id, exclude_startswith,
                                                 exclude_contains, exclude_except)
+        self.parsed_ansi_data[self.mode_mom] = self._sort_entries(self.parsed_ansi_data[self.mode_mom], 'Type')
+        self.parsed_ansi_data[self.mode_int] = self._sort_entries(self.parsed_ansi_data[self.mode_int], 'Bus')
 
     def parse_iec_data(self, exclude_startswith: list[str], exclude_contains: list[str], exclude_except: list[str]):
         """
         Parses the extracted IEC data based on specified criteria, such as excluding specific IDs.
+        The entries are sorted by bus once all configurations are parsed.
 
         :param list[str] exclude_startswith: List of strings that, if an ID starts with, should exclude the entry.
         :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
         :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
         """
         for config, modes in self.iec_data.items():
-            config_tags = config.split('_')
-            if 'IEC' in config_tags:
-                config_id = '_'.join(config_tags[1:-1])
-            else:
-                config_id = '_'.join(config_tags[1:])
+            config_id = self._get_iec_config_id(config)
             for mode, entries in modes.items():
                 if mode == self.mode_int:
                     self.parse_iec_int_entries(entries, config_id, exclude_startswith, exclude_contains, exclude_except)
+        self.parsed_iec_data[self.mode_int] = self._sort_entries(self.parsed_iec_data[self.mode_int], 'Bus')
+
+    @staticmethod
+    def _sort_entries(entries: dict, key: str) -> dict:
+        """
+        Sorts parsed device entries by one of their fields. The sort is stable, so entries with
+        the same value keep the order in which they were parsed.
+
+        :param dict entries: Dictionary of parsed device entries keyed by ID.
+        :param str key: Field of the entries to sort by.
+        :return: The sorted dictionary of entries.
+        :rtype: dict
+        """
+        return dict(sorted(entries.items(), key=lambda item: item[1][key]))
+
+    def parse_pivoted_ansi_data(self, exclude_startswith: list[str], exclude_contains: list[str],
+                                exclude_except: list[str], add_switches: bool):
+        """
+        Parses the ANSI data pivoted by `pivot_ansi_data` into the same entries as `parse_ansi_data`.
+
+        :param list[str] exclude_startswith: List of strings that, if an ID starts with, should exclude the entry.
+        :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
+        :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
+        :param bool add_switches: Flag to indicate whether to add switches to the parsed data.
+        """
+        configs = self.pivoted_ansi_data['configs']
+        valid_types = DD_MOM_TYPES + DD_SWITCH_TYPES if add_switches else DD_MOM_TYPES
+        matcher = get_matcher(exclude_startswith, exclude_contains, exclude_except)
+
+        # Each configuration has a presence flag followed by its values, the symmetrical value of switches being 0
+        for _id, _voltage, _type, cap_sym, cap_asym, *values in self.pivoted_ansi_data[self.mode_mom]:
+            if _type.strip() not in valid_types or matcher.is_exclusion(_id):
+                continue
+            groups = [(config, values[i * 3 + 1:i * 3 + 3]) for i, config in enumerate(configs) if values[i * 3]]
+            self.parsed_ansi_data[self.mode_mom][_id] = {
+                'Voltage': _voltage,
+                'Type': _type,
+                'Sym': {config: sym for config, (sym, _) in groups},
+                'Asym': {config: asym for config, (_, asym) in groups},
+                'CapSym': self._get_mom_cap_sym(_id, _voltage, _type, cap_sym, cap_asym),
+                'CapAsym': cap_asym
+            }
+
+        for _id, _voltage, _bus, _device, cap_adj_sym, *values in self.pivoted_ansi_data[self.mode_int]:
+            if matcher.is_exclusion(_id):
+                continue
+            self.parsed_ansi_data[self.mode_int][_id] = {
+                'Voltage': _voltage,
+                'Bus': _bus,
+                'Device': _device,
+                'AdjSym': {config: values[i * 2 + 1] for i, config in enumerate(configs) if values[i * 2]},
+                'CapAdjSym': cap_adj_sym
+            }
+        self.parsed_ansi_data[self.mode_mom] = self._sort_entries(self.parsed_ansi_data[self.mode_mom], 'Type')
+        self.parsed_ansi_data[self.mode_int] = self._sort_entries(self.parsed_ansi_data[self.mode_int], 'Bus')
+
+    def parse_pivoted_iec_data(self, exclude_startswith: list[str], exclude_contains: list[str],
+                               exclude_except: list[str]):
+        """
+        Parses the IEC data pivoted by `pivot_iec_data` into the same entries as `parse_iec_data`.
+
+        :param list[str] exclude_startswith: List of strings that, if an ID starts with, should exclude the entry.
+        :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
+        :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
+        """
+        configs = self.pivoted_iec_data['configs']
+        matcher = get_matcher(exclude_startswith, exclude_contains, exclude_except)
+        for _id, _voltage, _bus, _device, cap_sym, cap_asym, *values in self.pivoted_iec_data[self.mode_int]:
+            if _device.strip() not in DD_IEC_INT_TYPES or matcher.is_exclusion(_id):
+                continue
+            groups = [(config, values[i * 3 + 1:i * 3 + 3]) for i, config in enumerate(configs) if values[i * 3]]
+            self.parsed_iec_data[self.mode_int][_id] = {
+                'Voltage': _voltage,
+                'Bus': _bus,
+                'Device': _device,
+                'LbSym': {config: sym for config, (sym, _) in groups},
+                'LbAsym': {config: asym for config, (_, asym) in groups},
+                'CapLbSym': cap_sym,
+                'CapLbAsym': cap_asym
+            }
+        self.parsed_iec_data[self.mode_int] = self._sort_entries(self.parsed_iec_data[self.mode_int], 'Bus')
+
+    @staticmethod
+    def _get_ansi_config_id(config: str) -> str:
+        """
+        Gets the configuration identifier of an ANSI report from its file name.
+
+        :param str config: File name of the report, without its extension.
+        :return: The configuration identifier.
+        :rtype: str
+        """
+        return config.split('_', 1)[1]
+
+    @staticmethod
+    def _get_iec_config_id(config: str) -> str:
+        """
+        Gets the configuration identifier of an IEC report from its file name.
+
+        :param str config: File name of the report, without its extension.
+        :return: The configuration identifier.
+        :rtype: str
+        """
+        config_tags = config.split('_')
+        if 'IEC' in config_tags:
+            return '_'.join(config_tags[1:-1])
+        return '_'.join(config_tags[1:])
+
+    @staticmethod
+    def _get_mom_cap_sym(_id: str, _voltage: float, _type: str, cap_sym: float, cap_asym: float) -> float:
+        """
+        Gets the symmetrical momentary capability of a device. The symmetrical capability of switchgear
+        is derived from its asymmetrical capability.
+
+        :param str _id: ID of the device.
+        :param float _voltage: Nominal voltage of the device in kV.
+        :param str _type: Type of the device.
+        :param float cap_sym: Symmetrical capability from the report.
+        :param float cap_asym: Asymmetrical capability from the report.
+        :return: The symmetrical capability.
+        :rtype: float
+        """
+        if 'Switchgear' in _type:
+            if _id.startswith('MV') or _voltage > 0.6:
+                return cap_asym / MV_SWITCHGEAR_MULTIPLIER
+            elif _id.startswith('LV') or _voltage <= 0.6:
+                return cap_asym / LV_SWITCHGEAR_MULTIPLIER
+        return cap_sym
 
     def parse_ansi_mom_entries(self, entries: list, config: str, exclude_startswith: list[str],
                                exclude_contains: list[str], exclude_except: list[str], add_switches: bool = True):
@@ -152,10 +467,9 @@ class DeviceDutyParser:
         :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
         :param bool add_switches: Flag to indicate whether to add switches to the parsed data.
         """
-        valid_types = ['Panelboard', 'Switchboard', 'Switchgear', 'MCC']
-        if add_switches:
-            valid_types += ['SPST Switch', 'SPDT Switch']
+        valid_types = DD_MOM_TYPES + DD_SWITCH_TYPES if add_switches else DD_MOM_TYPES
 
+        matcher = get_matcher(exclude_startswith, exclude_contains, exclude_except)
         for entry in entries:
             _id = entry[0]
             _voltage = entry[1]
@@ -164,7 +478,7 @@ class DeviceDutyParser:
             if _type.strip() not in valid_types:
                 continue
 
-            if utils.is_exclusion(_id, exclude_startswith, exclude_contains, exclude_except):
+            if matcher.is_exclusion(_id):
                 continue
 
             if _type.endswith('Switch'):
@@ -178,26 +492,15 @@ class DeviceDutyParser:
                 self.parsed_ansi_data[self.mode_mom][_id]['Asym'].update({config: _asymmetric})
                 continue
 
-            cap_sym = entry[5]
-            cap_asym = entry[6]
-
-            if 'Switchgear' in _type:
-                if _id.startswith('MV') or _voltage > 0.6:
-                    cap_sym = cap_asym / MV_SWITCHGEAR_MULTIPLIER
-                elif _id.startswith('LV') or _voltage <= 0.6:
-                    cap_sym = cap_asym / LV_SWITCHGEAR_MULTIPLIER
-
             entry_data = {
                 'Voltage': _voltage,
                 'Type': _type,
                 'Sym': {config: _symmetric},
                 'Asym': {config: _asymmetric},
-                'CapSym': cap_sym,
-                'CapAsym': cap_asym
+                'CapSym': self._get_mom_cap_sym(_id, _voltage, _type, entry[5], entry[6]),
+                'CapAsym': entry[6]
             }
             self.parsed_ansi_data[self.mode_mom].update({_id: entry_data})
-        self.parsed_ansi_data[self.mode_mom] = dict(sorted(self.parsed_ansi_data[self.mode_mom].items(),
-                                                           key=lambda item: item[1]['Type']))
 
     def parse_ansi_int_entries(self, entries: list, config: str, exclude_startswith: list[str],
                                exclude_contains: list[str], exclude_except: list[str]):
@@ -210,13 +513,14 @@ class DeviceDutyParser:
         :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
         :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
         """
+        matcher = get_matcher(exclude_startswith, exclude_contains, exclude_except)
         for entry in entries:
             _id = entry[0]
             _voltage = entry[1]
             _bus = entry[2]
             _device = entry[3]
 
-            if utils.is_exclusion(_id, exclude_startswith, exclude_contains, exclude_except):
+            if matcher.is_exclusion(_id):
                 continue
 
             if _id in self.parsed_ansi_data[self.mode_int]:
@@ -231,8 +535,6 @@ class DeviceDutyParser:
                 'CapAdjSym': entry[5]
             }
             self.parsed_ansi_data[self.mode_int].update({_id: entry_data})
-        self.parsed_ansi_data[self.mode_int] = dict(sorted(self.parsed_ansi_data[self.mode_int].items(),
-                                                           key=lambda item: item[1]['Bus']))
 
     def parse_iec_int_entries(self, entries: list, config: str, exclude_startswith: list[str],
                               exclude_contains: list[str], exclude_except: list[str]):
@@ -245,16 +547,17 @@ class DeviceDutyParser:
         :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
         :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
         """
+        matcher = get_matcher(exclude_startswith, exclude_contains, exclude_except)
         for entry in entries:
             _id = entry[0]
             _voltage = entry[1]
             _bus = entry[2]
             _device = entry[3]
 
-            if _device.strip() not in ['CB', 'Fuse']:
+            if _device.strip() not in DD_IEC_INT_TYPES:
                 continue
 
-            if utils.is_exclusion(_id, exclude_startswith, exclude_contains, exclude_except):
+            if matcher.is_exclusion(_id):
                 continue
 
             if _id in self.parsed_iec_data[self.mode_int]:
@@ -272,8 +575,6 @@ class DeviceDutyParser:
                 'CapLbAsym': entry[7]
             }
             self.parsed_iec_data[self.mode_int].update({_id: entry_data})
-        self.parsed_iec_data[self.mode_int] = dict(sorted(self.parsed_iec_data[self.mode_int].items(),
-                                                          key=lambda item: item[1]['Bus']))
 
     def is_series_rated(self, element_id: str, element_type: str) -> bool:
         """
@@ -336,18 +637,17 @@ class DeviceDutyParser:
         :return bool: Returns the value of the comment text attribute in lowercase.
         :raises AttributeError: If the element with the given ID is not found.
         """
-        if self.comments.get(element_id):
-            return self.comments.get(element_id)
+        if element_id in self.comments:
+            return self.comments[element_id]
 
-        if not self.tree:
+        if self.layout_comments is None:
             elem_type = TYPE_MAP.get(element_type.strip(), BUS_TAG)
             prop = self._etap.projectdata.get_element_prop(elem_type, element_id, COMMENT_VAR)
             comment = prop.get('Value') and prop.get('Value').lower()
         else:
-            element = self.tree.find(f'.//LAYOUT//*[@ID="{element_id}"]')
-            if element is None:
+            if element_id not in self.layout_comments:
                 raise AttributeError(f'No element with ID {element_id} found')
-            comment = element.get('CommentText').lower()
+            comment = self.layout_comments[element_id]
 
         self.comments.update({element_id: comment})
         return comment
@@ -373,7 +673,7 @@ class DeviceDutyParser:
 
     def filter_filepaths(self):
         def filter_func(path_str):
-            filename = Path(path_str).stem
+            filename = self.catalog.get_file(path_str).stem
             if filename.split('_')[0] in DD_TAG:
                 return True
             if DD_TAG in filename:
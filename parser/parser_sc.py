@@ -1,53 +1,125 @@
-import math
-import sqlite3
+import numpy as np
 from parser import utils
+from parser.exclusion import get_matcher
+from parser.cache import ParseCache
+from parser.catalog import ReportCatalog
+from parser.mirror import ReportMirror
+from parser.store import ColumnStore
+from parser.pivot import PivotEngine
 from pathlib import Path
 from sqlite3 import Error, OperationalError
+from parser.reader import ReportReader
 from consts.filenames import SC_ANSI_EXT
-from consts.queries import ANSI_SC_FAULT_QUERY, ANSI_SC_IMP_QUERY
+from consts.queries import ANSI_SC_FAULT_QUERY, ANSI_SC_IMP_QUERY, SC_FAULT_TABLE, SC_IMP_TABLE, SC_ID_COLUMN, \
+    SC_CONST_COLUMNS, SC_FAULT_COLUMNS, SC_IMP_COLUMNS
 from consts.tags import FAULT_TAG, IMP_TAG, SC_TAG
+from consts.keys import SC_FAULT_QUANTITIES, SC_FAULT_PHASORS, SC_IMP_QUANTITIES
 
 
 class ShortCircuitParser:
-    def __init__(self, etap_dir: Path):
+    def __init__(self, etap_dir: Path, max_workers: int | None = None, cache: ParseCache | None = None,
+                 catalog: ReportCatalog | None = None, in_memory_max_bytes: int = 0,
+                 mirror: ReportMirror | None = None):
         self.ansi_sc_data = {}
-        self.parsed_ansi_data = {FAULT_TAG: {}, IMP_TAG: {}}
-        self.filepaths = utils.get_filepaths(etap_dir, SC_ANSI_EXT, SC_TAG)
+        self.pivoted_data = None
+        self.queries = {FAULT_TAG: (ANSI_SC_FAULT_QUERY, []), IMP_TAG: (ANSI_SC_IMP_QUERY, [])}
+        self.cache = cache
+        self.max_workers = max_workers
+        self.in_memory_max_bytes = in_memory_max_bytes
+        self.mirror = mirror
+        self.read_timings = {}
+        self.parsed_ansi_data = self._create_stores()
+        self.filepaths = (catalog or ReportCatalog(etap_dir)).get_filepaths(SC_ANSI_EXT, SC_TAG)
+
+    def extract_ansi_data(self, exclude_startswith: list[str] = (), exclude_contains: list[str] = (),
+                          exclude_except: list[str] = ()):
+        """
+        Extracts ANSI short circuit data from each SQLite database in the specified directory.
+
+        Files are read in parallel when there are enough of them, and the results are merged
+        in file order so the output stays deterministic. Any errors during database access are logged.
+        Unchanged files are taken from the cache when one is set. Excluded IDs are filtered out by the queries.
 
-    def extract_ansi_data(self):
+        :param list[str] exclude_startswith: List of strings that, if an ID starts with, should exclude the entry.
+        :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
+        :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
         """
-        Extracts ANSI arc flash data from each SQLite database in the specified directory.
+        condition, params = utils.get_exclusion_filter(SC_ID_COLUMN, exclude_startswith, exclude_contains,
+                                                       exclude_except)
+        self.queries = {
+            FAULT_TAG: (utils.filter_query(ANSI_SC_FAULT_QUERY, [condition]), params),
+            IMP_TAG: (utils.filter_query(ANSI_SC_IMP_QUERY, [condition]), params)
+        }
+        signature = ParseCache.make_signature(*[query for query, _ in self.queries.values()], *params)
+        for result in utils.map_files(self._read_file, self.filepaths, self.max_workers, self.cache, signature):
+            if result:
+                config, data = result
+                self.ansi_sc_data.update({config: data})
+
+    def pivot_ansi_data(self, exclude_startswith: list[str] = (), exclude_contains: list[str] = (),
+                        exclude_except: list[str] = ()):
+        """
+        Extracts ANSI short circuit data from all SQLite databases in the specified directory at once,
+        pivoted by configuration inside SQLite, and populates the `pivoted_data` attribute.
+        This replaces `extract_ansi_data` when the data is parsed with `parse_pivoted_data`.
+        Excluded IDs are filtered out by the pivot.
 
-        It attempts to connect to each database, execute the relevant queries, and fetch data
-        for further processing. Any errors during database access are logged.
+        :param list[str] exclude_startswith: List of strings that, if an ID starts with, should exclude the entry.
+        :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
+        :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
         """
-        for filepath in self.filepaths:
-            try:
-                conn = sqlite3.connect(filepath)
-                cur = conn.cursor()
-                self._fetch_data(cur, filepath)
-                conn.close()
-            except (Error, OperationalError) as e:
-                print(f"Error with file {filepath}: {e}")
+        configs = [Path(filepath).stem.split('_')[1] for filepath in self.filepaths]
+        where, params = utils.get_exclusion_filter(SC_ID_COLUMN, exclude_startswith, exclude_contains, exclude_except)
+        with PivotEngine(self.filepaths, configs, self.in_memory_max_bytes, self.mirror) as engine:
+            self.pivoted_data = {
+                'configs': engine.configs,
+                FAULT_TAG: engine.pivot(SC_FAULT_TABLE, SC_ID_COLUMN, SC_CONST_COLUMNS, SC_FAULT_COLUMNS,
+                                        where, params),
+                IMP_TAG: engine.pivot(SC_IMP_TABLE, SC_ID_COLUMN, SC_CONST_COLUMNS, SC_IMP_COLUMNS, where, params)
+            }
 
-    def _fetch_data(self, cur: sqlite3.Cursor, filepath):
+    def _read_file(self, filepath: str) -> tuple[str, dict] | None:
         """
-        Fetches study case information and arc flash data from the given database cursor,
-        and processes the fetched data to include additional metadata.
+        Opens a single short circuit report file and fetches its fault and impedance data.
 
-        :param sqlite3.Cursor cur: Cursor object for executing SQL queries on the database.
+        :param str filepath: Path to the SQLite report file.
+        :return: The configuration name and its data keyed by mode, or None if the file could not be read.
+        :rtype: tuple[str, dict] | None
         """
-        cur.execute(ANSI_SC_FAULT_QUERY)
-        fault_data = cur.fetchall()
-        cur.execute(ANSI_SC_IMP_QUERY)
-        imp_data = cur.fetchall()
-        config = Path(filepath).stem
-        self.ansi_sc_data.update({
-            config: {
-                FAULT_TAG: fault_data,
-                IMP_TAG: imp_data
-            }
-        })
+        try:
+            with ReportReader(filepath, self.read_timings, in_memory_max_bytes=self.in_memory_max_bytes,
+                              mirror=self.mirror) as reader:
+                data = self._fetch_data(reader)
+            return Path(filepath).stem, data
+        except (Error, OperationalError) as e:
+            print(f"Error with file {filepath}: {e}")
+
+    def _fetch_data(self, reader: ReportReader) -> dict:
+        """
+        Fetches fault and sequence impedance data from the given report file.
+
+        :param ReportReader reader: Open reader of the report file.
+        :return: A dictionary of fetched rows keyed by mode.
+        :rtype: dict
+        """
+        data = {}
+        for mode, (query, params) in self.queries.items():
+            data[mode] = reader.fetch(query, params)
+        return data
+
+    @staticmethod
+    def _create_stores(configs: list[str] = ()) -> dict[str, ColumnStore]:
+        """
+        Creates the columnar stores of the parsed fault and impedance data.
+
+        :param list[str] configs: Configuration identifiers known in advance.
+        :return: A dictionary of stores keyed by mode.
+        :rtype: dict[str, ColumnStore]
+        """
+        return {
+            FAULT_TAG: ColumnStore(SC_FAULT_QUANTITIES, configs, SC_FAULT_PHASORS),
+            IMP_TAG: ColumnStore(SC_IMP_QUANTITIES, configs)
+        }
 
     def parse_ansi_data(self, exclude_startswith: list[str], exclude_contains: list[str], exclude_except: list[str]):
         """
@@ -58,6 +130,7 @@ class ShortCircuitParser:
         :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
         :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
         """
+        self.parsed_ansi_data = self._create_stores([config.split('_')[1] for config in self.ansi_sc_data])
         for config, modes in self.ansi_sc_data.items():
             config_tags = config.split('_')
             config_id = config_tags[1]
@@ -67,10 +140,43 @@ class ShortCircuitParser:
                 if mode == IMP_TAG:
                     self.parse_imp_entries(entries, config_id, exclude_startswith, exclude_contains, exclude_except)
 
+    def parse_pivoted_data(self, exclude_startswith: list[str], exclude_contains: list[str],
+                           exclude_except: list[str]):
+        """
+        Parses the ANSI data pivoted by `pivot_ansi_data` into the same stores as `parse_ansi_data`.
+
+        :param list[str] exclude_startswith: List of strings that, if an ID starts with, should exclude the entry.
+        :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
+        :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
+        """
+        configs = self.pivoted_data['configs']
+        self.parsed_ansi_data = self._create_stores(configs)
+        matcher = get_matcher(exclude_startswith, exclude_contains, exclude_except)
+        for mode, columns in [(FAULT_TAG, SC_FAULT_COLUMNS), (IMP_TAG, SC_IMP_COLUMNS)]:
+            rows = [row for row in self.pivoted_data[mode] if not matcher.is_exclusion(row[0])]
+            if not rows:
+                continue
+
+            # Each configuration has a presence flag followed by its values
+            width = len(columns) + 1
+            values = np.array([row[2:] for row in rows], dtype=float)
+            blocks, flags = [], []
+            for i in range(len(configs)):
+                block = values[:, i * width + 1:(i + 1) * width]
+                blocks.append((utils.calculate_phasors(block) if mode == FAULT_TAG else block).tolist())
+                flags.append((values[:, i * width] == 1).tolist())
+
+            # Elements are set in the order they were first read so that the store keeps the same order
+            for j, row in enumerate(rows):
+                for i, config in enumerate(configs):
+                    if flags[i][j]:
+                        self.parsed_ansi_data[mode].set(row[0], row[1], config, blocks[i][j])
+
     def parse_fault_entries(self, entries: list, config: str, exclude_startswith: list[str],
                             exclude_contains: list[str], exclude_except: list[str]):
         """
         Parses ANSI momentary duty data entries based on specified criteria and calculates necessary values.
+        The phase angles of all entries are calculated at once.
 
         :param list entries: List of entries to parse.
         :param str config: Configuration identifier.
@@ -78,84 +184,24 @@ class ShortCircuitParser:
         :param list[str] exclude_contains: List of substrings that, if present in an ID, should exclude the entry.
         :param list[str] exclude_except: List of substrings that, if present in an ID, should not exclude the entry.
         """
-        for entry in entries:
-            _id = entry[0]
+        matcher = get_matcher(exclude_startswith, exclude_contains, exclude_except)
+        entries = [entry for entry in entries if not matcher.is_exclusion(entry[0])]
+        if not entries:
+            return
 
-            if utils.is_exclusion(_id, exclude_startswith, exclude_contains, exclude_except):
-                continue
-
-            _voltage = entry[1]
-            _real_3ph = entry[2]
-            _ima_3ph = entry[3]
-            _mag_3ph = entry[4]
-            _phase_3ph = math.degrees(math.atan(_ima_3ph / _real_3ph))
-            _real_lg = entry[5]
-            _ima_lg = entry[6]
-            _mag_lg = entry[7]
-            _phase_lg = math.degrees(math.atan(_ima_lg / _real_lg))
-            _real_ll = entry[8]
-            _ima_ll = entry[9]
-            _mag_ll = entry[10]
-            _phase_ll = math.degrees(math.atan(_ima_ll / _real_ll))
-            _real_llg = entry[11]
-            _ima_llg = entry[12]
-            _mag_llg = entry[13]
-            _phase_llg = math.degrees(math.atan(_ima_llg / _real_llg))
-
-            if _id in self.parsed_ansi_data[FAULT_TAG]:
-                self.parsed_ansi_data[FAULT_TAG][_id]['Real3Ph'].update({config: _real_3ph})
-                self.parsed_ansi_data[FAULT_TAG][_id]['Imag3Ph'].update({config: _ima_3ph})
-                self.parsed_ansi_data[FAULT_TAG][_id]['Mag3Ph'].update({config: _mag_3ph})
-                self.parsed_ansi_data[FAULT_TAG][_id]['Ph3Ph'].update({config: _phase_3ph})
-                self.parsed_ansi_data[FAULT_TAG][_id]['Phasor3Ph'].update({config: [_mag_3ph, _phase_3ph]})
-                self.parsed_ansi_data[FAULT_TAG][_id]['RealLG'].update({config: _real_lg})
-                self.parsed_ansi_data[FAULT_TAG][_id]['ImagLG'].update({config: _ima_lg})
-                self.parsed_ansi_data[FAULT_TAG][_id]['MagLG'].update({config: _mag_lg})
-                self.parsed_ansi_data[FAULT_TAG][_id]['PhLG'].update({config: _phase_lg})
-                self.parsed_ansi_data[FAULT_TAG][_id]['PhasorLG'].update({config: [_mag_lg, _phase_lg]})
-                self.parsed_ansi_data[FAULT_TAG][_id]['RealLL'].update({config: _real_ll})
-                self.parsed_ansi_data[FAULT_TAG][_id]['ImagLL'].update({config: _ima_ll})
-                self.parsed_ansi_data[FAULT_TAG][_id]['MagLL'].update({config: _mag_ll})
-                self.parsed_ansi_data[FAULT_TAG][_id]['PhLL'].update({config: _phase_ll})
-                self.parsed_ansi_data[FAULT_TAG][_id]['PhasorLL'].update({config: [_mag_ll, _phase_ll]})
-                self.parsed_ansi_data[FAULT_TAG][_id]['RealLLG'].update({config: _real_llg})
-                self.parsed_ansi_data[FAULT_TAG][_id]['ImagLLG'].update({config: _ima_llg})
-                self.parsed_ansi_data[FAULT_TAG][_id]['MagLLG'].update({config: _mag_llg})
-                self.parsed_ansi_data[FAULT_TAG][_id]['PhLLG'].update({config: _phase_llg})
-                self.parsed_ansi_data[FAULT_TAG][_id]['PhasorLLG'].update({config: [_mag_llg, _phase_llg]})
-                continue
-
-            entry_data = {
-                'Voltage': _voltage,
-                'Real3Ph': {config: _real_3ph},
-                'Imag3Ph': {config: _ima_3ph},
-                'Mag3Ph': {config: _mag_3ph},
-                'Ph3Ph': {config: _phase_3ph},
-                'Phasor3Ph': {config: [_mag_3ph, _phase_3ph]},
-                'RealLG': {config: _real_lg},
-                'ImagLG': {config: _ima_lg},
-                'MagLG': {config: _mag_lg},
-                'PhLG': {config: _phase_lg},
-                'PhasorLG': {config: [_mag_lg, _phase_lg]},
-                'RealLL': {config: _real_ll},
-                'ImagLL': {config: _ima_ll},
-                'MagLL': {config: _mag_ll},
-                'PhLL': {config: _phase_ll},
-                'PhasorLL': {config: [_mag_ll, _phase_ll]},
-                'RealLLG': {config: _real_llg},
-                'ImagLLG': {config: _ima_llg},
-                'MagLLG': {config: _mag_llg},
-                'PhLLG': {config: _phase_llg},
-                'PhasorLLG': {config: [_mag_llg, _phase_llg]},
-            }
-            self.parsed_ansi_data[FAULT_TAG].update({_id: entry_data})
+        # Columns hold (real, imaginary, magnitude) groups for the 3Ph, LG, LL and LLG faults
+        values = np.array([entry[2:14] for entry in entries], dtype=float)
+        phasors = utils.calculate_phasors(values)
+        for entry, data in zip(entries, phasors.tolist()):
+            self.parsed_ansi_data[FAULT_TAG].set(entry[0], entry[1], config, data)
 
     def parse_imp_entries(self, entries: list, config: str, exclude_startswith: list[str],
                           exclude_contains: list[str], exclude_except: list[str]):
+        matcher = get_matcher(exclude_startswith, exclude_contains, exclude_except)
         for entry in entries:
             _id = entry[0]
 
-            if utils.is_exclusion(_id, exclude_startswith, exclude_contains, exclude_except):
+            if matcher.is_exclusion(_id):
                 continue
 
             _voltage = entry[1]
@@ -169,28 +215,6 @@ class ShortCircuitParser:
             _x_zero = entry[9]
             _z_zero = entry[10]
 
-            if _id in self.parsed_ansi_data[IMP_TAG]:
-                self.parsed_ansi_data[IMP_TAG][_id]['RPosOhm'].update({config: _r_pos})
-                self.parsed_ansi_data[IMP_TAG][_id]['XPosOhm'].update({config: _x_pos})
-                self.parsed_ansi_data[IMP_TAG][_id]['ZPosOhm'].update({config: _z_pos})
-                self.parsed_ansi_data[IMP_TAG][_id]['RNegOhm'].update({config: _r_neg})
-                self.parsed_ansi_data[IMP_TAG][_id]['XNegOhm'].update({config: _x_neg})
-                self.parsed_ansi_data[IMP_TAG][_id]['ZNegOhm'].update({config: _z_neg})
-                self.parsed_ansi_data[IMP_TAG][_id]['RZeroOhm'].update({config: _r_zero})
-                self.parsed_ansi_data[IMP_TAG][_id]['XZeroOhm'].update({config: _x_zero})
-                self.parsed_ansi_data[IMP_TAG][_id]['ZZeroOhm'].update({config: _z_zero})
-                continue
-
-            entry_data = {
-                'Voltage': _voltage,
-                'RPosOhm': {config: _r_pos},
-                'XPosOhm': {config: _x_pos},
-                'ZPosOhm': {config: _z_pos},
-                'RNegOhm': {config: _r_neg},
-                'XNegOhm': {config: _x_neg},
-                'ZNegOhm': {config: _z_neg},
-                'RZeroOhm': {config: _r_zero},
-                'XZeroOhm': {config: _x_zero},
-                'ZZeroOhm': {config: _z_zero}
-            }
-            self.parsed_ansi_data[IMP_TAG].update({_id: entry_data})
+            self.parsed_ansi_data[IMP_TAG].set(_id, _voltage, config, [
+                _r_pos, _x_pos, _z_pos, _r_neg, _x_neg, _z_neg, _r_zero, _x_zero, _z_zero
+            ])
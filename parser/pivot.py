@@ -0,0 +1,160 @@
+import sqlite3
+from parser.mirror import ReportMirror
+from parser.reader import get_report_uri, read_report_bytes
+
+SEQ_SHIFT = 32
+
+
+class PivotEngine:
+    """
+    Pivots the per-configuration results of many report files inside SQLite. The report files are attached
+    to one in-memory connection, as many at a time as SQLite allows, and their rows are gathered into a
+    temporary table tagged with the configuration and the order in which they were read. A single
+    GROUP BY query then returns one row per element ID with one column per configuration and quantity.
+
+    The pivot follows the same rules as the dictionaries built by the parsers: elements are returned in the
+    order they were first read, constant columns are taken from the first row read for an element, and the
+    last row read wins when an element appears more than once for the same configuration.
+    """
+
+    def __init__(self, filepaths: list[str], configs: list[str], in_memory_max_bytes: int = 0,
+                 mirror: ReportMirror | None = None):
+        """
+        Opens the in-memory connection for the given report files.
+
+        :param list[str] filepaths: List of report file paths.
+        :param list[str] configs: Configuration identifier of each report file. Files sharing a configuration
+                                  are merged into the same columns.
+        :param int in_memory_max_bytes: Maximum size in bytes of a report file loaded in memory before being
+                                        attached; 0 disables loading.
+        :param ReportMirror | None mirror: Optional local mirror of the report files, whose copies are attached.
+        """
+        self.filepaths = filepaths
+        self.in_memory_max_bytes = in_memory_max_bytes
+        self.mirror = mirror
+        self.configs = list(dict.fromkeys(configs))
+        self.config_indices = [self.configs.index(config) for config in configs]
+        self.conn = sqlite3.connect(':memory:', uri=True)
+        self.attach_limit = self.conn.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED)
+
+    def _gather(self, tables: list[str], id_column: str, columns: list[str], where: str | None,
+                params: list | tuple, order_by: str | None, missing_ok: bool):
+        """
+        Copies the rows of a table of every report file into the temporary source table,
+        attaching the files in batches. Files that cannot be read are logged and skipped.
+
+        :param list[str] tables: Name of the table in each report file.
+        :param str id_column: Name of the element ID column.
+        :param list[str] columns: Names of the other columns to copy.
+        :param str | None where: Optional filter applied to the rows of each file.
+        :param list | tuple params: Parameters bound to the placeholders of the filter.
+        :param str | None order_by: Optional order in which the rows of each file are read, instead of storage order.
+        :param bool missing_ok: A flag to skip files missing the table without logging an error.
+        """
+        names = ', '.join(f'c{i}' for i in range(len(columns)))
+        selected = ', '.join(f'{column} AS c{i}' for i, column in enumerate(columns))
+        condition = f' WHERE ({where})' if where else ''
+        row_number = f'ROW_NUMBER() OVER (ORDER BY {order_by})' if order_by else 'rowid'
+        self.conn.execute(r"DROP TABLE IF EXISTS temp.src")
+        self.conn.execute(f"CREATE TEMP TABLE src (cfg INTEGER, seq INTEGER, id TEXT, {names})")
+
+        for start in range(0, len(self.filepaths), self.attach_limit):
+            batch = list(enumerate(self.filepaths[start:start + self.attach_limit], start))
+            attached = []
+            for i, filepath in batch:
+                try:
+                    self._attach(filepath, f'r{i}')
+                    attached.append(i)
+                except (sqlite3.Error, OSError) as e:
+                    print(f"Error with file {filepath}: {e}")
+
+            for i in attached:
+                try:
+                    self.conn.execute(f"INSERT INTO temp.src SELECT {self.config_indices[i]}, "
+                                      f"({i} << {SEQ_SHIFT}) + {row_number}, {id_column}, {selected} "
+                                      f"FROM r{i}.{tables[i]}{condition}", params)
+                except sqlite3.OperationalError as e:
+                    if not (missing_ok and str(e).startswith('no such table')):
+                        print(f"Error with file {self.filepaths[i]}: {e}")
+                except sqlite3.Error as e:
+                    print(f"Error with file {self.filepaths[i]}: {e}")
+            self.conn.commit()
+            for i in attached:
+                self.conn.execute(f"DETACH DATABASE r{i}")
+        self.conn.execute(r"CREATE INDEX temp.src_id ON src (id)")
+
+    def _attach(self, filepath: str, name: str):
+        """
+        Attaches a report file read-only, or a copy of it loaded in memory if it is small enough.
+
+        :param str filepath: Path to the report file.
+        :param str name: Schema name of the attached database.
+        """
+        if self.mirror:
+            try:
+                filepath = self.mirror.get_path(filepath)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Could not mirror file {filepath}: {e}")
+        data = read_report_bytes(filepath, self.in_memory_max_bytes) if self.in_memory_max_bytes else None
+        if data is None:
+            self.conn.execute(f"ATTACH DATABASE ? AS {name}", (get_report_uri(filepath),))
+            return
+        self.conn.execute(f"ATTACH DATABASE ':memory:' AS {name}")
+        try:
+            self.conn.deserialize(data, name=name)
+            self.conn.execute(f"PRAGMA {name}.schema_version")
+        except sqlite3.Error:
+            self.conn.execute(f"DETACH DATABASE {name}")
+            self.conn.execute(f"ATTACH DATABASE ? AS {name}", (get_report_uri(filepath),))
+
+    def pivot(self, table: str | list[str], id_column: str, const_columns: list[str], value_columns: list[str],
+              where: str | None = None, params: list | tuple = (), order_by: str | None = None,
+              missing_ok: bool = False) -> list[tuple]:
+        """
+        Pivots a table of all report files by configuration.
+
+        Each returned row holds the element ID and its constant columns, followed by one group per configuration
+        made of a flag set to 1 if the element appears in that configuration and the values of that configuration.
+        Values of configurations the element does not appear in are None.
+
+        :param str | list[str] table: Name of the table in the report files, or in each report file.
+        :param str id_column: Name of the element ID column.
+        :param list[str] const_columns: Names of the columns taken from the first row read for an element.
+        :param list[str] value_columns: Names of the columns pivoted by configuration.
+        :param str | None where: Optional filter applied to the rows of each file.
+        :param list | tuple params: Parameters bound to the placeholders of the filter.
+        :param str | None order_by: Optional order in which the rows of each file are read, instead of storage order.
+        :param bool missing_ok: A flag to skip files missing the table without logging an error.
+        :return: The pivoted rows in the order the elements were first read.
+        :rtype: list[tuple]
+        """
+        if not self.filepaths:
+            return []
+        tables = [table] * len(self.filepaths) if isinstance(table, str) else table
+        self._gather(tables, id_column, const_columns + value_columns, where, params, order_by, missing_ok)
+        const_names = ', '.join(['f.id'] + [f'f.c{i}' for i in range(len(const_columns))])
+        groups = []
+        for k in range(len(self.configs)):
+            groups.append(f'MAX(l.cfg = {k})')
+            for i in range(len(const_columns), len(const_columns) + len(value_columns)):
+                groups.append(f'MAX(CASE WHEN l.cfg = {k} THEN l.c{i} END)')
+
+        query = (f"WITH firsts AS (SELECT MIN(seq) AS seq FROM temp.src GROUP BY id), "
+                 f"lasts AS (SELECT MAX(seq) AS seq FROM temp.src GROUP BY id, cfg) "
+                 f"SELECT {const_names}, {', '.join(groups)} "
+                 f"FROM temp.src AS f JOIN temp.src AS l ON l.id = f.id "
+                 f"WHERE f.seq IN (SELECT seq FROM firsts) AND l.seq IN (SELECT seq FROM lasts) "
+                 f"GROUP BY f.seq ORDER BY f.seq")
+        return self.conn.execute(query).fetchall()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Closes the in-memory connection.
+        """
+        self.conn.close()
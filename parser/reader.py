@@ -0,0 +1,205 @@
+import os
+import time
+import sqlite3
+from pathlib import Path
+from typing import Iterator, NamedTuple
+from urllib.parse import quote
+from consts.common import FETCH_BATCH_SIZE, REPORT_MMAP_SIZE, REPORT_CACHE_SIZE
+from parser.mirror import ReportMirror
+
+
+class ReadTimings(NamedTuple):
+    """
+    Time spent opening a report file and running queries on it, in seconds,
+    and whether the file was loaded in memory.
+    """
+    open: float
+    query: float
+    in_memory: bool
+
+
+def get_report_uri(filepath: str | Path) -> str:
+    """
+    Creates the SQLite URI opening a report file read-only and as immutable, so that SQLite neither
+    takes locks nor checks for a journal. Report files must not be modified while they are open.
+
+    :param str | Path filepath: Path to the report file.
+    :return: The URI of the report file.
+    :rtype: str
+    """
+    path = Path(filepath).resolve().as_posix()
+    if not path.startswith('/'):
+        path = f'/{path}'
+    return f'file://{quote(path)}?mode=ro&immutable=1'
+
+
+def read_report_bytes(filepath: str | Path, max_bytes: int) -> bytes | None:
+    """
+    Reads a whole report file in one sequential read if it is not larger than the given size.
+
+    :param str | Path filepath: Path to the report file.
+    :param int max_bytes: Maximum size of the file in bytes.
+    :return: The content of the file, or None if it is larger than the maximum size.
+    :rtype: bytes | None
+    """
+    with open(filepath, 'rb') as file:
+        if os.fstat(file.fileno()).st_size > max_bytes:
+            return None
+        return file.read()
+
+
+class ReportReader:
+    """
+    Read-only connection to an ETAP report file, used as a context manager so that the connection is
+    always closed. The connection is tuned for scanning whole tables once, and the time spent opening the
+    file and running queries is recorded.
+
+    Files up to a given size can instead be loaded in memory with one sequential read and queried there,
+    which is much faster than reading pages at random over a network share. Files that cannot be loaded
+    in memory are read directly. When a local mirror is given, the mirrored copy of the file is read instead.
+    """
+
+    def __init__(self, filepath: str | Path, timings: dict | None = None, batch_size: int = FETCH_BATCH_SIZE,
+                 in_memory_max_bytes: int = 0, mirror: ReportMirror | None = None):
+        """
+        Initializes the reader of a report file. The file is opened when entering the context.
+
+        :param str | Path filepath: Path to the report file.
+        :param dict | None timings: Optional dictionary in which the timings are stored by file path on closing.
+        :param int batch_size: Number of rows fetched at a time.
+        :param int in_memory_max_bytes: Maximum size in bytes of a file loaded in memory; 0 disables loading.
+        :param ReportMirror | None mirror: Optional local mirror of the report files.
+        """
+        self.filepath = str(filepath)
+        self.timings = timings
+        self.batch_size = batch_size
+        self.in_memory_max_bytes = in_memory_max_bytes
+        self.in_memory = False
+        self.mirror = mirror
+        self.source = self.filepath
+        self.conn = None
+        self.open_time = 0.0
+        self.query_time = 0.0
+
+    def __enter__(self):
+        start = time.perf_counter()
+        if self.mirror:
+            self.source = self._get_mirrored_path()
+        if self.in_memory_max_bytes:
+            self.conn = self._load_in_memory()
+        if self.conn is None:
+            self.conn = sqlite3.connect(get_report_uri(self.source), uri=True)
+            try:
+                self.conn.execute(f"PRAGMA mmap_size = {REPORT_MMAP_SIZE}")
+                self.conn.execute(f"PRAGMA cache_size = {REPORT_CACHE_SIZE}")
+            except sqlite3.Error:
+                self.conn.close()
+                raise
+        self.open_time = time.perf_counter() - start
+        return self
+
+    def _get_mirrored_path(self) -> str:
+        """
+        Returns the path of the mirrored copy of the report file, or of the file itself if it cannot be mirrored.
+
+        :return: The path of the file to read.
+        :rtype: str
+        """
+        try:
+            return self.mirror.get_path(self.filepath)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Could not mirror file {self.filepath}: {e}")
+            return self.filepath
+
+    def _load_in_memory(self) -> sqlite3.Connection | None:
+        """
+        Loads the report file in an in-memory database if it is small enough.
+
+        :return: The in-memory connection, or None if the file is too large or could not be loaded.
+        :rtype: sqlite3.Connection | None
+        """
+        try:
+            data = read_report_bytes(self.source, self.in_memory_max_bytes)
+        except OSError:
+            return None
+        if data is None:
+            return None
+
+        # Reading the schema checks that the copy can be queried, which fails for files in WAL mode
+        conn = sqlite3.connect(':memory:')
+        try:
+            conn.deserialize(data)
+            conn.execute(r"PRAGMA schema_version")
+        except sqlite3.Error:
+            conn.close()
+            return None
+        self.in_memory = True
+        return conn
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Closes the connection and stores the timings if a timings dictionary was given.
+        """
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+            if self.timings is not None:
+                self.timings[self.filepath] = ReadTimings(self.open_time, self.query_time, self.in_memory)
+
+    def iter_rows(self, query: str, params: list | tuple = ()) -> Iterator[tuple]:
+        """
+        Executes a SQL query and yields the resulting rows, fetching them in batches
+        so that the whole result set is never materialized at once.
+
+        :param str query: SQL query to execute.
+        :param list | tuple params: Parameters bound to the placeholders of the query.
+        :return: Iterator over the rows returned by the query.
+        :rtype: Iterator[tuple]
+        """
+        start = time.perf_counter()
+        cur = self.conn.cursor()
+        cur.arraysize = self.batch_size
+        cur.execute(query, params)
+        while True:
+            batch = cur.fetchmany()
+            self.query_time += time.perf_counter() - start
+            if not batch:
+                return
+            yield from batch
+            start = time.perf_counter()
+
+    def fetch(self, query: str, params: list | tuple = (), missing_ok: bool = False) -> list:
+        """
+        Executes a SQL query and returns all resulting rows.
+
+        :param str query: SQL query to execute.
+        :param list | tuple params: Parameters bound to the placeholders of the query.
+        :param bool missing_ok: A flag to return an empty list instead of raising if the query fails,
+                                such as when a table is missing from the report.
+        :return: List of rows returned by the query.
+        :rtype: list
+        :raises sqlite3.OperationalError: If the query fails and `missing_ok` is not set.
+        """
+        try:
+            return list(self.iter_rows(query, params))
+        except sqlite3.OperationalError:
+            if missing_ok:
+                return []
+            raise
+
+    def fetchone(self, query: str, params: list | tuple = ()) -> tuple | None:
+        """
+        Executes a SQL query and returns its first row.
+
+        :param str query: SQL query to execute.
+        :param list | tuple params: Parameters bound to the placeholders of the query.
+        :return: The first row returned by the query, or None if there is none.
+        :rtype: tuple | None
+        """
+        rows = self.iter_rows(query, params)
+        row = next(rows, None)
+        rows.close()
+        return row
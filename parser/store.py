@@ -0,0 +1,181 @@
+import math
+from array import array
+from collections.abc import Mapping, Iterator, Sequence
+
+MISSING = math.nan
+
+
+class ColumnStore(Mapping):
+    """
+    Columnar store of per-configuration results keyed by element ID. Each quantity is kept in one contiguous
+    float array laid out by element row and configuration column, next to an element index and a configuration
+    index, instead of one dictionary per element and quantity.
+
+    The store reads as a mapping of element ID to a row view, so that ``store[_id]['Voltage']`` returns the
+    voltage and ``store[_id][quantity]`` returns a mapping of configuration to value, as the nested dictionaries
+    it replaces did. Phasor keys return (magnitude, phase) pairs built from two stored quantities.
+    Values that were never set are stored as NaN and are left out of the views.
+    """
+
+    def __init__(self, quantities: list[str], configs: Sequence[str] = (),
+                 phasors: dict[str, tuple[str, str]] | None = None):
+        """
+        Initializes an empty store.
+
+        :param list[str] quantities: Names of the stored quantities, in the order their values are set.
+        :param Sequence[str] configs: Configurations known in advance, in column order.
+        :param dict[str, tuple[str, str]] | None phasors: Phasor keys mapped to their magnitude and phase quantities.
+        """
+        self.quantities = quantities
+        self.phasors = phasors or {}
+        self.ids = {}
+        self.configs = dict.fromkeys(configs)
+        for i, config in enumerate(self.configs):
+            self.configs[config] = i
+        self.voltages = array('d')
+        self.columns = {quantity: array('d') for quantity in quantities}
+
+    def set(self, _id: str, voltage: float, config: str, values: Sequence[float]):
+        """
+        Sets the values of an element for a configuration. The voltage is only recorded the first time
+        an element is set.
+
+        :param str _id: ID of the element.
+        :param float voltage: Voltage of the element.
+        :param str config: Configuration identifier.
+        :param Sequence[float] values: Values of the quantities, in the order of the store's quantities.
+        """
+        if config not in self.configs:
+            self._add_config(config)
+        stride = len(self.configs)
+
+        row = self.ids.get(_id)
+        if row is None:
+            row = self.ids[_id] = len(self.voltages)
+            self.voltages.append(voltage)
+            block = array('d', [MISSING]) * stride
+            for column in self.columns.values():
+                column.extend(block)
+
+        index = row * stride + self.configs[config]
+        for quantity, value in zip(self.quantities, values):
+            self.columns[quantity][index] = value
+
+    def _add_config(self, config: str):
+        """
+        Adds a configuration column, widening the layout of all stored quantities.
+
+        :param str config: Configuration identifier.
+        """
+        stride = len(self.configs)
+        self.configs[config] = stride
+        for quantity, column in self.columns.items():
+            widened = array('d')
+            for row in range(len(self.voltages)):
+                widened.extend(column[row * stride:(row + 1) * stride])
+                widened.append(MISSING)
+            self.columns[quantity] = widened
+
+    def get_values(self, row: int, quantity: str) -> Iterator[tuple[str, float]]:
+        """
+        Iterates over the set values of a quantity of an element, in configuration order.
+
+        :param int row: Row index of the element.
+        :param str quantity: Name of the quantity.
+        :return: Pairs of configuration and value.
+        :rtype: Iterator[tuple[str, float]]
+        """
+        column = self.columns[quantity]
+        start = row * len(self.configs)
+        for config, i in self.configs.items():
+            value = column[start + i]
+            if value == value:
+                yield config, value
+
+    def __getitem__(self, _id: str) -> 'RowView':
+        return RowView(self, self.ids[_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, _id) -> bool:
+        return _id in self.ids
+
+
+class RowView(Mapping):
+    """
+    Read-only view of the results of one element of a ColumnStore.
+    """
+    __slots__ = ('store', 'row')
+
+    def __init__(self, store: ColumnStore, row: int):
+        self.store = store
+        self.row = row
+
+    def __getitem__(self, key: str) -> float | Mapping:
+        if key == 'Voltage':
+            return self.store.voltages[self.row]
+        if key in self.store.phasors:
+            return PhasorView(self.store, self.row, *self.store.phasors[key])
+        if key in self.store.columns:
+            return ValueView(self.store, self.row, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield 'Voltage'
+        yield from self.store.quantities
+        yield from self.store.phasors
+
+    def __len__(self) -> int:
+        return 1 + len(self.store.quantities) + len(self.store.phasors)
+
+
+class ValueView(Mapping):
+    """
+    Read-only view of the values of one quantity of an element, keyed by configuration.
+    """
+    __slots__ = ('store', 'row', 'quantity')
+
+    def __init__(self, store: ColumnStore, row: int, quantity: str):
+        self.store = store
+        self.row = row
+        self.quantity = quantity
+
+    def items(self) -> Iterator[tuple[str, float]]:
+        return self.store.get_values(self.row, self.quantity)
+
+    def __getitem__(self, config: str) -> float:
+        value = self.store.columns[self.quantity][self.row * len(self.store.configs) + self.store.configs[config]]
+        if value != value:
+            raise KeyError(config)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (config for config, _ in self.items())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.items())
+
+
+class PhasorView(ValueView):
+    """
+    Read-only view of the (magnitude, phase) pairs of one phasor of an element, keyed by configuration.
+    """
+    __slots__ = ('phase',)
+
+    def __init__(self, store: ColumnStore, row: int, magnitude: str, phase: str):
+        super().__init__(store, row, magnitude)
+        self.phase = phase
+
+    def items(self) -> Iterator[tuple[str, tuple[float, float]]]:
+        phases = self.store.columns[self.phase]
+        start = self.row * len(self.store.configs)
+        for config, magnitude in self.store.get_values(self.row, self.quantity):
+            yield config, (magnitude, phases[start + self.store.configs[config]])
+
+    def __getitem__(self, config: str) -> tuple[float, float]:
+        magnitude = super().__getitem__(config)
+        return magnitude, self.store.columns[self.phase][self.row * len(self.store.configs) + self.store.configs[config]]
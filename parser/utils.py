@@ -1,61 +1,106 @@
+import json
+import numpy as np
 from pathlib import Path
+from typing import Callable, Any
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from parser.cache import ParseCache
+from parser.catalog import ReportCatalog
 from consts.multipliers import FT_M_MULTIPLIER
-from sqlite3 import Error, OperationalError, Cursor, connect
-from consts.tags import AF_VCB_CONFIG, AF_VCBB_CONFIG, AF_HCB_CONFIG
+from consts.common import EXTRACT_MAX_WORKERS, EXTRACT_PARALLEL_MIN_FILES
+from consts.tags import AF_VCB_CONFIG, AF_VCBB_CONFIG, AF_HCB_CONFIG, COMMENT_VAR, LAYOUT_TAG
 
 
-def connect_to_sql_file(filepath: str | Path) -> Cursor:
+def filter_query(query: str, conditions: list[str]) -> str:
     """
-    Connects to a SQLite database file and returns a cursor object.
+    Adds conditions to the WHERE clause of a query, before its ORDER BY clause if any.
 
-    :param str | Path filepath: Path to the SQLite database file.
-    :return: Cursor object for executing SQL commands.
-    :rtype: Cursor
-    :raises Error: If the connection to the database fails.
+    :param str query: SQL query to filter.
+    :param list[str] conditions: SQL conditions to add. Empty conditions are ignored.
+    :return: The filtered query.
+    :rtype: str
     """
-    try:
-        conn = connect(filepath)
-    except Error:
-        raise Error
-    return conn.cursor()
+    conditions = [f'({condition})' for condition in conditions if condition]
+    if not conditions:
+        return query
+    head, order_by, tail = query.partition(' ORDER BY ')
+    joiner = ' AND ' if ' WHERE ' in head else ' WHERE '
+    return head + joiner + ' AND '.join(conditions) + order_by + tail
 
 
-def fetch_sql_data(cur: Cursor, query: str) -> list:
+def get_exclusion_filter(column: str, exclude_startswith: list[str], exclude_contains: list[str],
+                         exclude_except: list[str]) -> tuple[str, list[str]]:
     """
-    Executes a SQL query using the provided cursor and returns the fetched results.
+    Creates a parameterized SQL condition keeping the rows whose ID is not excluded,
+    following the same rules as the exclusion matcher.
 
-    :param Cursor cur: Cursor object connected to the SQLite database.
-    :param str query: SQL query to execute.
-    :return: List of rows returned by the query; empty list if an error occurs.
-    :rtype: list
+    :param str column: Name of the ID column.
+    :param list[str] exclude_startswith: List of prefixes to check for exclusion.
+    :param list[str] exclude_contains: List of substrings to check for exclusion.
+    :param list[str] exclude_except: List of exceptions to override exclusion.
+    :return: The condition, empty if nothing is excluded, and its parameters.
+    :rtype: tuple[str, list[str]]
     """
-    try:
-        cur.execute(query)
-        return cur.fetchall()
-    except OperationalError:
-        return []
+    excluded = [f'instr({column}, ?) > 0' for _ in exclude_contains]
+    excluded += [f'substr({column}, 1, length(?)) = ?' for _ in exclude_startswith]
+    if not excluded:
+        return '', []
 
+    condition = f"NOT ({' OR '.join(excluded)})"
+    params = list(exclude_contains) + [word for word in exclude_startswith for _ in range(2)]
+    if exclude_except:
+        kept = [f'instr({column}, ?) > 0' for _ in exclude_except]
+        condition = f"{condition} OR {' OR '.join(kept)}"
+        params += list(exclude_except)
+    return condition, params
 
-def is_exclusion(_id: str, exclude_startswith: list[str], exclude_contains: list[str],
-                 exclude_except: list[str]) -> None | bool:
+
+def get_type_filter(column: str, types: list[str]) -> tuple[str, list[str]]:
     """
-    Determines whether a given ID should be excluded based on matching rules.
+    Creates a parameterized SQL condition keeping the rows whose type, stripped of whitespace,
+    is one of the given types.
 
-    :param str _id: The string ID to evaluate.
-    :param list[str] exclude_startswith: List of prefixes to check for exclusion.
-    :param list[str] exclude_contains: List of substrings to check for exclusion.
-    :param list[str] exclude_except: List of exceptions to override exclusion.
-    :return: True if the ID matches exclusion criteria, False otherwise.
-    :rtype: bool
+    :param str column: Name of the type column.
+    :param list[str] types: List of types to keep.
+    :return: The condition and its parameters.
+    :rtype: tuple[str, list[str]]
     """
-    if any(word in _id for word in exclude_except):
-        return False
+    placeholders = ', '.join('?' for _ in types)
+    return f"TRIM({column}, char(32, 9, 10, 11, 12, 13)) IN ({placeholders})", list(types)
 
-    if any(word in _id for word in exclude_contains):
-        return True
 
-    if any(_id.startswith(word) for word in exclude_startswith):
-        return True
+def map_files(func: Callable, filepaths: list[str], max_workers: int | None = None,
+              cache: ParseCache | None = None, signature: str = '') -> list:
+    """
+    Applies a function to each file path, using a pool of threads when there are enough files to benefit from it.
+    Results are returned in the order of the given file paths regardless of the order in which they complete.
+
+    When a cache is given, files that have not changed since they were cached are not read again,
+    and the results of the files that were read are stored in the cache. None results are never cached.
+
+    :param Callable func: Function taking a single file path and returning its extracted data.
+    :param list[str] filepaths: List of file paths to process.
+    :param int | None max_workers: Maximum number of worker threads. Defaults to EXTRACT_MAX_WORKERS; 1 forces serial.
+    :param ParseCache | None cache: Optional cache of previously extracted data.
+    :param str signature: Signature of the extraction performed by the function, used as part of the cache key.
+    :return: List of results, one per file path, in input order.
+    :rtype: list
+    """
+    results = {filepath: cache.get(filepath, signature) for filepath in filepaths} if cache else {}
+    pending = [filepath for filepath in filepaths if results.get(filepath) is None]
+
+    workers = min(max_workers or EXTRACT_MAX_WORKERS, len(pending))
+    if workers <= 1 or len(pending) < EXTRACT_PARALLEL_MIN_FILES:
+        pending_results = [func(filepath) for filepath in pending]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending_results = list(executor.map(func, pending))
+
+    for filepath, result in zip(pending, pending_results):
+        results[filepath] = result
+        if cache and result is not None:
+            cache.put(filepath, signature, result)
+    return [results[filepath] for filepath in filepaths]
 
 
 def calculate_la_var(value: int) -> int:
@@ -96,6 +141,23 @@ def convert_to_m(value: float) -> float:
     return value * FT_M_MULTIPLIER
 
 
+def calculate_phasors(values: np.ndarray) -> np.ndarray:
+    """
+    Calculates the phase angles of consecutive (real, imaginary, magnitude) column groups for all rows at once,
+    handling zero real parts.
+
+    :param np.ndarray values: A 2D array of rows holding (real, imaginary, magnitude) groups.
+    :return: A 2D array of the rows holding (real, imaginary, magnitude, angle in degrees) groups.
+    :rtype: np.ndarray
+    """
+    rows, cols = values.shape
+    groups = cols // 3
+    phasors = np.empty((rows, groups * 4))
+    phasors.reshape(rows, groups, 4)[:, :, :3] = values.reshape(rows, groups, 3)
+    phasors[:, 3::4] = np.degrees(np.arctan2(values[:, 1::3], values[:, 0::3]))
+    return phasors
+
+
 def convert_cycle_to_sec(value: float) -> float:
     """
     Converts a time value from cycles to seconds.
@@ -107,6 +169,84 @@ def convert_cycle_to_sec(value: float) -> float:
     return value / 60
 
 
+def parse_element_comments(element_data: Any) -> dict[str, str | None]:
+    """
+    Extracts the lowercase comment text of every element from the data returned by a bulk element query.
+    The data may be an XML string, or JSON (decoded or as a string) holding objects with an ID.
+
+    :param Any element_data: Data of all elements of a type as returned by ETAP.
+    :return: Dictionary mapping element IDs to their lowercase comment text, or None if they have none.
+    :rtype: dict[str, str | None]
+    :raises ValueError: If the data is a string that is neither XML nor JSON.
+    """
+    if isinstance(element_data, str):
+        text = element_data.strip()
+        if not text.startswith('<'):
+            return parse_element_comments(json.loads(text)) if text else {}
+        elements = (elem.attrib for elem in ET.fromstring(text).iter())
+    else:
+        elements = iter_dicts(element_data)
+
+    comments = {}
+    for element in elements:
+        element_id = element.get('ID')
+        if isinstance(element_id, str):
+            comment = element.get(COMMENT_VAR)
+            comments[element_id] = comment.lower() if isinstance(comment, str) and comment else None
+    return comments
+
+
+def index_layout_comments(xml_string: str, chunk_size: int = 1 << 16) -> dict[str, str]:
+    """
+    Builds an index of the lowercase comment text of every element with an ID nested in a LAYOUT section
+    of a project XML. The XML is parsed incrementally in a single pass and every element is discarded as soon
+    as it has been read, so the full tree is never kept in memory. The first element with a given ID wins.
+
+    :param str xml_string: The project XML.
+    :param int chunk_size: Number of characters fed to the parser at a time.
+    :return: Dictionary mapping element IDs to their lowercase comment text.
+    :rtype: dict[str, str]
+    """
+    comments = {}
+    layout_depth = 0
+    root = None
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    for i in range(0, len(xml_string), chunk_size):
+        parser.feed(xml_string[i:i + chunk_size])
+        for event, elem in parser.read_events():
+            if event == 'start':
+                if root is None:
+                    root = elem
+                    continue
+                if layout_depth and elem.get('ID') is not None:
+                    comments.setdefault(elem.get('ID'), (elem.get(COMMENT_VAR) or '').lower())
+                if elem.tag == LAYOUT_TAG:
+                    layout_depth += 1
+            elif elem is not root:
+                if elem.tag == LAYOUT_TAG:
+                    layout_depth -= 1
+                elem.clear()
+    parser.close()
+    return comments
+
+
+def iter_dicts(data: Any):
+    """
+    Iterates over every dictionary nested in decoded JSON data.
+
+    :param Any data: Decoded JSON data.
+    :return: Generator of nested dictionaries.
+    """
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            yield item
+            stack.extend(value for value in item.values() if isinstance(value, (dict, list)))
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+
+
 def map_electrode_config(index: int) -> str:
     """
     Maps an electrode configuration index to its corresponding name.
@@ -129,11 +269,4 @@ def get_filepaths(input_dir: Path, ext: str, study_tag: str) -> list[str]:
     :return: List of file paths with the given extension.
     :rtype: list[str]
     """
-    filepaths = []
-    for path in input_dir.iterdir():
-        if path.is_file() and path.suffix == f'.{ext}':
-            if study_tag and not path.stem.startswith(f'{study_tag}_'):
-                continue
-            filepaths.append(str(path))
-    return filepaths
-# and path.stem.startswith(f'{study_tag}_')
+    return ReportCatalog(input_dir).get_filepaths(ext, study_tag)
@@ -0,0 +1,242 @@
+import sqlite3
+import traceback
+from typing import Any
+from pathlib import Path
+from contextlib import nullcontext
+from parser.cache import ParseCache
+from parser.catalog import ReportCatalog
+from parser.mirror import ReportMirror
+from consts.filenames import CACHE_FILENAME, DATA_DB_FILENAME
+from consts.common import REPORT_IN_MEMORY_MAX_BYTES, BACKEND_OPENPYXL, DATA_FORMAT_SQLITE
+from consts.errors import DATAHUB_RUNNING_CHECK, LATEST_REPORTS_CHECK, SAME_NAME_OPEN
+
+
+class Pipeline:
+    """
+    A Pipeline class that performs the tasks of a study related to scenario execution, data parsing, and data export.
+    It does not depend on Qt, so it can be run by a worker thread of the interface or from the command line.
+    """
+    session_data = {}
+    report_exts = ()
+    output_filename = ''
+
+    def __init__(self, input_dir_path: Path, output_dir_path: Path, create_scenarios: bool, run_scenarios: bool,
+                 exclude_startswith: list, exclude_contains: list, exclude_except: list[str], create_table: bool,
+                 write_only: bool = False, use_cache: bool = True, clear_cache: bool = False,
+                 in_memory_reports: bool = False, mirror_dir: Path | None = None, conditional_formatting: bool = False,
+                 excel_backend: str = BACKEND_OPENPYXL, data_format: str | None = None):
+        """
+        Initializes the Pipeline with required parameters for data processing tasks.
+
+        :param Path input_dir_path: The directory path for input data.
+        :param Path output_dir_path: The directory path for output data.
+        :param bool create_scenarios: A flag to determine whether to create scenarios.
+        :param bool run_scenarios: A flag to determine whether to run scenarios.
+        :param list exclude_startswith: List of strings to exclude elements that start with specified prefixes.
+        :param list exclude_contains: List of strings to exclude elements that contain specified substrings.
+        :param list exclude_except: List of substrings; elements containing these will not be excluded.
+        :param bool create_table: A flag to determine whether to create an Excel table.
+        :param bool write_only: A flag to determine whether to stream the Excel table using write-only worksheets.
+        :param bool use_cache: A flag to determine whether to reuse report data cached in the output directory.
+        :param bool clear_cache: A flag to determine whether to clear the cache before parsing.
+        :param bool in_memory_reports: A flag to determine whether to load small report files in memory
+                                       with one sequential read before querying them.
+        :param Path | None mirror_dir: Optional local directory in which the report files are mirrored and read.
+        :param bool conditional_formatting: A flag to determine whether to highlight values in the Excel table
+                                            with conditional formatting rules.
+        :param str excel_backend: Name of the engine writing the Excel table, 'openpyxl' or 'xlsxwriter'.
+        :param str | None data_format: Optional format the tables are also written in next to the Excel table,
+                                       'csv', 'jsonl' or 'sqlite'. SQLite tables go to one database per project.
+        """
+        self.input_dir_path = input_dir_path
+        self.output_dir_path = output_dir_path
+        self.create_scenarios = create_scenarios
+        self.run_scenarios = run_scenarios
+        self.exclude_startswith = exclude_startswith
+        self.exclude_contains = exclude_contains
+        self.exclude_except = exclude_except
+        self.create_table = create_table
+        self.write_only = write_only
+        self.use_cache = use_cache
+        self.clear_cache = clear_cache
+        self.in_memory_max_bytes = REPORT_IN_MEMORY_MAX_BYTES if in_memory_reports else 0
+        self.mirror_dir = mirror_dir
+        self.conditional_formatting = conditional_formatting
+        self.excel_backend = excel_backend
+        self.data_format = data_format
+        self.scenario_class = None
+        # The report queries filter out excluded IDs, so the extracted data depends on the exclusion lists
+        self.extraction_options = (tuple(exclude_startswith), tuple(exclude_contains), tuple(exclude_except))
+        self.raw_data = None
+        self.catalog = None
+        self.read_timings = {}
+        self.parsed_ansi_data = None
+        self.parsed_iec_data = None
+
+    def execute_scenarios(self):
+        """
+        Executes the creation and/or running of scenarios based on the initialization parameters.
+        Updates input and output directory paths as needed.
+        """
+        if self.create_scenarios:
+            scenario = self.scenario_class()
+            try:
+                scenario.create_scenarios()
+                if self.run_scenarios:
+                    scenario.run_scenarios()
+            finally:
+                scenario.close()
+
+    def get_catalog(self) -> ReportCatalog:
+        """
+        Returns the catalog of the files in the input directory, scanning the directory on first use.
+
+        :return: The catalog of the input directory.
+        :rtype: ReportCatalog
+        """
+        if self.catalog is None:
+            self.catalog = ReportCatalog(self.input_dir_path)
+        return self.catalog
+
+    def open_cache(self) -> ParseCache | nullcontext:
+        """
+        Opens the cache of extracted report data in the output directory, clearing it first if requested.
+        The cache is bypassed if it is disabled or cannot be opened.
+
+        :return: A context manager yielding the cache, or None if it is bypassed.
+        :rtype: ParseCache | nullcontext
+        """
+        if not self.use_cache:
+            return nullcontext()
+        try:
+            cache = ParseCache(Path(self.output_dir_path, CACHE_FILENAME), catalog=self.get_catalog())
+            if self.clear_cache:
+                cache.clear()
+            return cache
+        except (sqlite3.Error, OSError) as e:
+            print(f"Report data cache unavailable: {e}")
+            return nullcontext()
+
+    def open_mirror(self) -> ReportMirror | nullcontext:
+        """
+        Opens the local mirror of the report files, if a mirror directory is set.
+        The mirror is bypassed if it cannot be opened.
+
+        :return: A context manager yielding the mirror, or None if it is bypassed.
+        :rtype: ReportMirror | nullcontext
+        """
+        if self.mirror_dir is None:
+            return nullcontext()
+        try:
+            return ReportMirror(self.mirror_dir, catalog=self.get_catalog())
+        except (sqlite3.Error, OSError) as e:
+            print(f"Report mirror unavailable: {e}")
+            return nullcontext()
+
+    def load_session_data(self) -> Any | None:
+        """
+        Returns the raw data extracted by an earlier run of this pipeline type in the current session, before any
+        unit conversion, if it was made with the same extraction options and the report files in the
+        input directory have not changed since. The stored data is dropped if the cache is to be cleared.
+
+        :return: The raw extracted data, or None if there is no valid data.
+        :rtype: Any | None
+        """
+        key = (type(self).__name__, str(self.input_dir_path))
+        if self.clear_cache:
+            Pipeline.session_data.pop(key, None)
+            return None
+        if key not in Pipeline.session_data:
+            return None
+
+        extraction_options, fingerprint, raw_data = Pipeline.session_data[key]
+        if extraction_options != self.extraction_options:
+            return None
+        if fingerprint != self.get_catalog().get_fingerprint(self.report_exts):
+            return None
+        return raw_data
+
+    def store_session_data(self, raw_data: Any):
+        """
+        Keeps the raw extracted data for the rest of the session along with the extraction options
+        and the current fingerprint of the report files.
+
+        :param Any raw_data: The raw extracted data, which parsing must leave unchanged.
+        """
+        key = (type(self).__name__, str(self.input_dir_path))
+        fingerprint = self.get_catalog().get_fingerprint(self.report_exts)
+        Pipeline.session_data[key] = (self.extraction_options, fingerprint, raw_data)
+        self.raw_data = raw_data
+
+    def execute_data_parsing(self):
+        """
+        Parses data from input files. Abstract method for inheritance.
+        """
+        pass
+
+    def export_tables(self, backend: str, wb_path: Path):
+        """
+        Exports the parsed data through the given exporter backend. Abstract method for inheritance.
+
+        :param str backend: Name of the exporter backend, an Excel engine or a data format.
+        :param Path wb_path: The filename to save the workbook, or the database of the SQLite format, as.
+        """
+        pass
+
+    def execute_data_export(self) -> Path:
+        """
+        Exports the parsed data to an Excel workbook in the output directory and, if a data format is set,
+        streams the same tables to data files next to it.
+
+        :return: The path to the saved Excel workbook.
+        :rtype: Path
+        """
+        project_number = self.input_dir_path.stem
+        wb_path = Path(self.output_dir_path, f'{project_number}_{self.output_filename}')
+        self.export_tables(self.excel_backend, wb_path)
+        if self.data_format == DATA_FORMAT_SQLITE:
+            # The sheet names of the studies are unique, so their tables share one project database
+            self.export_tables(self.data_format, Path(self.output_dir_path, f'{project_number}_{DATA_DB_FILENAME}'))
+        elif self.data_format:
+            self.export_tables(self.data_format, wb_path)
+        return wb_path
+
+    def process(self) -> Path | None:
+        """
+        Executes the scenarios, data parsing and data export of the study.
+        Data extraction is skipped if the raw data of an earlier run is still valid, which is checked after
+        the scenarios are run, as running them rewrites the reports.
+
+        :return: The path to the exported table, or None if no table was created.
+        :rtype: Path | None
+        """
+        output_path = None
+        self.raw_data = None
+        if self.create_scenarios:
+            self.execute_scenarios()
+            # Running scenarios writes new reports, so the directory is scanned again
+            self.catalog = None
+        if self.create_table:
+            self.raw_data = self.load_session_data()
+            self.execute_data_parsing()
+            output_path = self.execute_data_export()
+        return output_path
+
+    @staticmethod
+    def describe_error(error: Exception) -> str:
+        """
+        Creates the message shown to the user for an error raised while processing a study.
+        Unexpected errors are logged with their traceback.
+
+        :param Exception error: The raised error.
+        :return: The error message with a hint on how to resolve it, if known.
+        :rtype: str
+        """
+        if isinstance(error, ConnectionError):
+            return f'{error.args[0]}. {DATAHUB_RUNNING_CHECK}'
+        if isinstance(error, AttributeError):
+            return f'{error.args[0]}. {LATEST_REPORTS_CHECK}'
+        if isinstance(error, PermissionError):
+            return f'{error}. {SAME_NAME_OPEN}'
+        print(''.join(traceback.format_exception(error)))
+        return str(error)
@@ -0,0 +1,113 @@
+from pathlib import Path
+from consts.common import SUBHEAD_ROW, DATA_FORMATS
+from consts.filenames import SC_FILENAME, SC_ANSI_EXT
+from consts.keys import KEYS_SC_IMP, KEYS_SC_FAULT_PHASOR, KEYS_SC_FAULT_DATA
+from consts.tags import FAULT_TAG, IMP_TAG
+from exporters.exporter_sc import ShortCircuitExporter
+from parser.parser_sc import ShortCircuitParser
+from scenario.scenario_sc import ShortCircuitScenario
+from pipeline.pipeline import Pipeline
+from consts.columns import SC_FAULT_CONST_COLS, SC_FAULT_VAR_COLS, SC_IMP_CONST_COLS, SC_IMP_VAR_COLS, SC_VAR_COLS_PREFIX, \
+    SC_FAULT_DATA_VAR_COLS
+
+
+class ShortCircuitPipeline(Pipeline):
+    """
+    ShortCircuitPipeline class for handling short circuit analysis, parsing, and exporting.
+    Inherits from the Pipeline class and provides specialized methods for short circuit operations.
+    """
+
+    report_exts = (SC_ANSI_EXT,)
+    output_filename = SC_FILENAME
+
+    def __init__(self, url: str, input_dir_path: Path, output_dir_path: Path, create_scenarios: bool,
+                 run_scenarios: bool, exclude_startswith: list[str], exclude_contains: list[str],
+                 exclude_except: list[str], create_table: bool, use_all_sw_configs: bool, use_pivot: bool = False,
+                 **kwargs):
+        """
+        Initializes the ShortCircuitPipeline with parameters specific to short circuit analysis.
+
+        :param str url: local URL for connecting to ETAP datahub.
+        :param Path input_dir_path: Path to the directory containing input data files.
+        :param Path output_dir_path: Path to the directory where output files will be saved.
+        :param bool create_scenarios: Flag to indicate whether scenarios should be created.
+        :param bool run_scenarios: Flag to indicate whether scenarios should be executed.
+        :param list exclude_startswith: List of prefixes for elements to exclude from parsing.
+        :param list exclude_contains: List of substrings; elements containing these will be excluded.
+        :param list exclude_except: List of substrings; elements containing these will not be excluded.
+        :param bool create_table: A flag to determine whether to create an PDF reports.
+        :param bool use_all_sw_configs: Flag to indicate whether to use all available switching configurations.
+        :param bool use_pivot: Flag to indicate whether to pivot the report data by configuration inside SQLite.
+        :param kwargs: Additional keyword arguments for Pipeline initialization.
+        """
+        super().__init__(input_dir_path, output_dir_path, create_scenarios, run_scenarios, exclude_startswith,
+                         exclude_contains, exclude_except, create_table, **kwargs)
+        self.scenario_class = lambda: ShortCircuitScenario(url, use_all_sw_configs)
+        self.use_pivot = use_pivot
+        self.extraction_options += (use_pivot,)
+
+    def execute_data_parsing(self) -> None:
+        """
+        Executes the parsing of short circuit data by using the ShortCircuitParser class.
+        The report data is either extracted file by file, using the cache, or pivoted by configuration inside SQLite.
+        """
+        sc_parser = ShortCircuitParser(self.input_dir_path, catalog=self.get_catalog(),
+                                       in_memory_max_bytes=self.in_memory_max_bytes)
+        sc_parser.read_timings = self.read_timings
+        if self.use_pivot:
+            if self.raw_data is None:
+                with self.open_mirror() as mirror:
+                    sc_parser.mirror = mirror
+                    sc_parser.pivot_ansi_data(self.exclude_startswith, self.exclude_contains,
+                                              self.exclude_except)
+                self.store_session_data(sc_parser.pivoted_data)
+            sc_parser.pivoted_data = self.raw_data
+            sc_parser.parse_pivoted_data(self.exclude_startswith, self.exclude_contains, self.exclude_except)
+        else:
+            if self.raw_data is None:
+                with self.open_cache() as cache, self.open_mirror() as mirror:
+                    sc_parser.cache = cache
+                    sc_parser.mirror = mirror
+                    sc_parser.extract_ansi_data(self.exclude_startswith, self.exclude_contains,
+                                                self.exclude_except)
+                self.store_session_data(sc_parser.ansi_sc_data)
+            sc_parser.ansi_sc_data = self.raw_data
+            sc_parser.parse_ansi_data(self.exclude_startswith, self.exclude_contains, self.exclude_except)
+        self.parsed_ansi_data = sc_parser.parsed_ansi_data
+
+    def export_tables(self, backend: str, wb_path: Path):
+        """
+        Executes the export of parsed device duty data through the given exporter backend.
+        Creates headers, inserts data, and formats the sheets for ANSI momentary, ANSI interrupting, and IEC interrupting data.
+        Saves the workbook to the given filename.
+
+        :param str backend: Name of the exporter backend, an Excel engine or a data format.
+        :param Path wb_path: The filename to save the workbook, or the database of the SQLite format, as.
+        """
+        sc_exporter = ShortCircuitExporter(self.write_only, backend)
+        sc_exporter.set_ansi_data(self.parsed_ansi_data)
+
+        # Data formats get the magnitude and angle of each fault as separate numeric columns
+        if backend in DATA_FORMATS:
+            fault_var_cols, fault_keys = SC_FAULT_DATA_VAR_COLS, KEYS_SC_FAULT_DATA
+        else:
+            fault_var_cols, fault_keys = SC_FAULT_VAR_COLS, KEYS_SC_FAULT_PHASOR
+
+        # Create headers for ANSI momentary, ANSI interrupting, and IEC interrupting sheets
+        sc_exporter.create_headers(0, SC_FAULT_CONST_COLS, fault_var_cols, SC_VAR_COLS_PREFIX)
+        sc_exporter.create_headers(1, SC_IMP_CONST_COLS, SC_IMP_VAR_COLS, SC_VAR_COLS_PREFIX)
+
+        # Insert data into the sheets
+        sc_exporter.insert_data(0, FAULT_TAG, fault_keys)
+        sc_exporter.insert_data(1, IMP_TAG, KEYS_SC_IMP, round_to=3)
+
+        # Format headers for each sheet
+        sc_exporter.format_headers(0)
+        sc_exporter.format_headers(1)
+
+        # Apply formatting to each sheet
+        sc_exporter.format_sheet(0, SUBHEAD_ROW, len(SC_FAULT_CONST_COLS), len(fault_var_cols), 16)
+        sc_exporter.format_sheet(1, SUBHEAD_ROW, len(SC_IMP_CONST_COLS), len(SC_IMP_VAR_COLS), 16)
+
+        # Save the workbook
+        sc_exporter.save_workbook(wb_path)
@@ -0,0 +1,124 @@
+import json
+from pathlib import Path
+from consts.common import HTTP, HTTPS, ETAP22_PORT, DATAHUB_FILENAME
+from consts.errors import RUNTIME_ERROR_MSG, NO_OPTION_SELECTED_MSG, INVALID_ETAP_DIR_MSG, INVALID_OUTPUT_DIR_MSG
+
+
+def split_string_tags(tag_string: str, delimiter: str = ';') -> list[str]:
+    """
+    Splits a string into a list of tags based on a delimiter, removing empty items and trimming whitespace.
+
+    :param str tag_string: The string containing tags separated by the delimiter.
+    :param str delimiter: The character or string used to split tags. Default is ';'.
+    :return list[str]: A list of non-empty, trimmed tag strings.
+    """
+    return [tag.strip() for tag in tag_string.split(delimiter) if tag.strip()]
+
+
+def get_datahub_info(project_path: str | Path) -> tuple[str, str]:
+    """
+    Retrieves and returns the datahub settings for a project for API connection.
+
+    :param str | Path project_path: Path to the ETAP project files.
+    :return tuple[str, str]: returns the protocol and the port number to connect to datahub.
+    """
+    filepath = Path(project_path) / DATAHUB_FILENAME
+    try:
+        with open(filepath, 'r') as file:
+            services = json.load(file)['Services']
+    except FileNotFoundError:
+        return HTTP, ETAP22_PORT
+    port_number = next((s['Port'] for s in services if s['ServiceName'] == 'EtapApi'), None)
+    return HTTPS, str(port_number)
+
+
+def get_revisions(inputs: dict) -> list | None:
+    """
+    Retrieves revisions from saved interface inputs.
+
+    :param dict inputs: Interface input values keyed by widget name.
+    :return list | None: List of revisions or None.
+    """
+    if inputs.get('include_all_radio', False):
+        return None
+    if inputs.get('include_base_radio', True):
+        return []
+    return split_string_tags(inputs.get('include_revisions_input', ''))
+
+
+def get_output_dir(inputs: dict) -> str:
+    """
+    Retrieves the output directory from saved interface inputs, which is the ETAP directory if synchronized.
+
+    :param dict inputs: Interface input values keyed by widget name.
+    :return str: The output directory path.
+    """
+    if inputs.get('etap_dir_checkbox', False):
+        return inputs.get('etap_dir', '')
+    return inputs.get('output_dir', '')
+
+
+def validate_inputs(inputs: dict) -> str | None:
+    """
+    Validates saved interface inputs the same way the interface validates its form fields.
+
+    :param dict inputs: Interface input values keyed by widget name.
+    :return str | None: The error message of the first failed validation, or None if all validations pass.
+    """
+    if not any(inputs.get(name, False) for name in ['short_circuit_checkbox', 'device_duty_checkbox',
+                                                    'arc_flash_checkbox']):
+        return RUNTIME_ERROR_MSG
+    if not any([inputs.get('create_reports_checkbox', False), inputs.get('create_scenarios_checkbox', False)]):
+        return NO_OPTION_SELECTED_MSG
+
+    def is_input_empty(path):
+        return not path or not Path(path).is_dir()
+
+    if is_input_empty(inputs.get('etap_dir', '')):
+        return INVALID_ETAP_DIR_MSG
+    if is_input_empty(get_output_dir(inputs)):
+        return INVALID_OUTPUT_DIR_MSG
+
+
+def collect_arguments(inputs: dict) -> tuple:
+    """
+    Collects and structures the arguments required for each pipeline from interface inputs,
+    either read from the widgets of the interface or saved by it.
+
+    :param dict inputs: Interface input values keyed by widget name, as returned by get_all_inputs.
+    :return tuple: Arguments for Short Circuit, Device Duty, and Arc Flash pipelines.
+    """
+    protocol, port_number = get_datahub_info(inputs.get('etap_dir', ''))
+    url = f'{protocol}://localhost:{port_number}'
+    exclude_except = split_string_tags(inputs.get('exclude_except_input', '')) \
+        if inputs.get('exclude_except_radio', False) else []
+
+    common_args = [
+        url, Path(inputs.get('etap_dir', '')), Path(get_output_dir(inputs)),
+        inputs.get('create_scenarios_checkbox', False),
+        inputs.get('run_scenarios_checkbox', False),
+        split_string_tags(inputs.get('exclude_start_input', '')),
+        split_string_tags(inputs.get('exclude_contain_input', '')),
+        exclude_except,
+        inputs.get('create_reports_checkbox', False)
+    ]
+
+    short_circuit_args = common_args + [
+        inputs.get('use_all_checkbox', False),
+    ]
+
+    device_duty_args = common_args + [
+        inputs.get('sw_checkbox', False),
+        inputs.get('use_all_checkbox', False),
+        inputs.get('series_rating_checkbox', False),
+        inputs.get('mark_assumed_checkbox', False)
+    ]
+
+    arc_flash_args = common_args + [
+        inputs.get('si_units_checkbox', False),
+        inputs.get('high_energy_box', 0.0),
+        inputs.get('low_energy_box', 0.0),
+        get_revisions(inputs)
+    ]
+
+    return short_circuit_args, device_duty_args, arc_flash_args
@@ -18,9 +18,19 @@ class Scenario:
         """
         self.scenario_ids = []
         self._etap = etap.api.connect(url)
-        self.scenario_xml_path = self.get_scenario_xml_path()
-        self.scenario_xml = self.get_scenario_xml()
-        self.presentation = self._etap.application.get_active_scenario()['Presentation']
+        try:
+            self.scenario_xml_path = self.get_scenario_xml_path()
+            self.scenario_xml = self.get_scenario_xml()
+            self.presentation = self._etap.application.get_active_scenario()['Presentation']
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        """
+        Closes the DataHub session of the ETAP connection.
+        """
+        self._etap.close()
 
     def get_scenario_xml(self):
         """